@@ -0,0 +1,38 @@
+# benchmarks/bench_batch.py
+# 批量求值基准：比较不同工作进程数下 parse_and_evaluate_many 的吞吐量。
+# 用法: python benchmarks/bench_batch.py [表达式数量] [最大进程数]
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from polynomial_parser import parse_and_evaluate_many
+
+
+def build_corpus(count, seed=0):
+    """生成 count 个互不相同的有理式表达式 (避免缓存命中掩盖计算量)。"""
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(count):
+        a, b, c = rng.randint(1, 9), rng.randint(1, 9), rng.randint(-9, 9)
+        corpus.append(f"(x^{rng.randint(1, 4)} + {a}x - {i})/(x + {b}) - {c}/(x^2 + {a})")
+    return corpus
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    corpus = build_corpus(count)
+
+    baseline = None
+    workers = 1
+    while workers <= max_workers:
+        start = time.perf_counter()
+        parse_and_evaluate_many(corpus, workers=workers, use_cache=False)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"workers={workers:3d}: {count / elapsed:10.1f} 表达式/s, 加速比 {baseline / elapsed:.2f}")
+        workers *= 2
@@ -0,0 +1,73 @@
+# benchmarks/bench_compose.py
+# Taylor 平移与多项式复合基准：Polynomial.shift / Polynomial.compose 与直接用 Polynomial 的乘法
+# (Horner 法则逐次乘以 x + a 或 q) 以及 sympy 的 Poly.shift / Poly.compose 比较，并检查结果一致。
+# 用法: python benchmarks/bench_compose.py [平移的最高次数]
+
+import os
+import random
+import sys
+import time
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sympy
+
+from polynomial_parser.polynomial import Polynomial
+from polynomial_parser.partial_fraction import from_sympy_poly, to_sympy_poly
+
+x = sympy.Symbol('x')
+
+
+def random_poly(rng, degree):
+    terms = {exp: Fraction(rng.randint(-100, 100), rng.randint(1, 3)) for exp in range(degree)}
+    terms[degree] = Fraction(rng.randint(1, 100))
+    return Polynomial(terms)
+
+
+def horner(poly, inner):
+    result = Polynomial()
+    for exp in range(poly.degree(), -1, -1):
+        result = result * inner + poly.terms.get(exp, Fraction(0))
+    return result
+
+
+def measure(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def report(name, native, native_time, naive_time, reference, sympy_time):
+    same = native == reference
+    print(f"{name:26s} native {native_time * 1000:9.1f} ms  Horner {naive_time * 1000:9.1f} ms  "
+          f"sympy {sympy_time * 1000:9.1f} ms{'' if same else '  结果不一致!'}")
+    return same
+
+
+if __name__ == "__main__":
+    max_degree = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    rng = random.Random(0)
+    mismatches = 0
+
+    degree = 100
+    while degree <= max_degree:
+        poly = random_poly(rng, degree)
+        a = Fraction(-7, 3)
+        shifted, native_time = measure(poly.shift, a)
+        _, naive_time = measure(horner, poly, Polynomial({1: 1, 0: a}))
+        reference, sympy_time = measure(to_sympy_poly(poly).shift, sympy.Rational(-7, 3))
+        mismatches += not report(f"{degree} 次平移 x -> x - 7/3", shifted.terms, native_time, naive_time,
+                                 from_sympy_poly(reference).terms, sympy_time)
+        degree *= 2
+
+    for outer, inner in ((20, 20), (40, 30), (100, 8)):
+        p = random_poly(rng, outer)
+        q = random_poly(rng, inner)
+        composed, native_time = measure(p.compose, q)
+        _, naive_time = measure(horner, p, q)
+        reference, sympy_time = measure(to_sympy_poly(p).compose, to_sympy_poly(q))
+        mismatches += not report(f"{outer} 次 . {inner} 次复合", composed.terms, native_time, naive_time,
+                                 from_sympy_poly(reference).terms, sympy_time)
+    if mismatches:
+        sys.exit(1)
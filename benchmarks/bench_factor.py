@@ -0,0 +1,75 @@
+# benchmarks/bench_factor.py
+# 因式分解基准：比较 Polynomial.factor() (factorization 模块) 与 sympy.factor_list，
+# 语料包括分圆多项式的乘积、Swinnerton-Dyer 多项式 (模任何素数都分裂成很多因子，组合阶段最慢)
+# 以及随机多项式的乘积；同时检查两者得到的不可约因子完全相同。
+# 用法: python benchmarks/bench_factor.py [随机多项式的最高次数]
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sympy
+from sympy.polys.specialpolys import swinnerton_dyer_poly
+
+from polynomial_parser.partial_fraction import to_sympy_poly, from_sympy_poly
+
+x = sympy.Symbol('x')
+
+
+def build_corpus(max_degree, seed=0):
+    rng = random.Random(seed)
+
+    def random_poly(degree):
+        return sympy.Poly([rng.randint(1, 5)] + [rng.randint(-20, 20) for _ in range(degree)], x)
+
+    corpus = []
+    for n in (12, 30, 60, 105):
+        corpus.append((f"x^{n} - 1", sympy.Poly(x ** n - 1, x)))
+    corpus.append(("(x^15 - 1)(x^12 + 1)", sympy.Poly((x ** 15 - 1) * (x ** 12 + 1), x)))
+    for n in (3, 4, 5):
+        corpus.append((f"Swinnerton-Dyer S{n}", sympy.Poly(swinnerton_dyer_poly(n, x), x)))
+    for degree in (10, 25, 50, max_degree):
+        corpus.append((f"随机 {degree} 次 (不可约)", random_poly(degree)))
+    for degrees in ((5, 5, 5), (20, 15, 10), (max_degree // 2, max_degree // 3, max_degree // 6)):
+        product = sympy.Poly(1, x)
+        for degree in degrees:
+            product *= random_poly(degree)
+        corpus.append((f"随机 {'*'.join(map(str, degrees))}", product))
+    corpus.append(("重因式", sympy.Poly(((x ** 3 + 2) ** 3 * (2 * x - 1) ** 2 * (x ** 4 + x + 1)).expand(), x)))
+    return corpus
+
+
+def _normalized(factors):
+    return sorted((tuple(sorted(factor.terms.items())), multiplicity) for factor, multiplicity in factors)
+
+
+if __name__ == "__main__":
+    max_degree = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    from_sympy_poly(sympy.Poly(x ** 2 - 1, x)).factor() # 导入 factorization 模块的时间不计入
+    mismatches = 0
+    total_native = total_sympy = 0.0
+    for name, sympy_poly in build_corpus(max_degree):
+        poly = from_sympy_poly(sympy_poly)
+
+        start = time.perf_counter()
+        _, native = poly.factor()
+        native_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _, reference = sympy_poly.factor_list()
+        sympy_time = time.perf_counter() - start
+
+        reference = [(from_sympy_poly(factor), multiplicity) for factor, multiplicity in reference]
+        same = _normalized(native) == _normalized(reference)
+        mismatches += not same
+        total_native += native_time
+        total_sympy += sympy_time
+        print(f"{name:28s} 次数 {poly.degree():4d}  {len(native):3d} 个因子  "
+              f"native {native_time * 1000:9.1f} ms  sympy {sympy_time * 1000:9.1f} ms"
+              f"{'' if same else '  结果不一致!'}")
+    print(f"合计: native {total_native * 1000:.1f} ms, sympy {total_sympy * 1000:.1f} ms")
+    if mismatches:
+        sys.exit(1)
@@ -0,0 +1,61 @@
+# benchmarks/bench_gcdex.py
+# 扩展欧几里得算法基准：比较 polynomial_gcdex (模大素数 + half-GCD) 与 sympy.gcdex，
+# 语料为随机整系数多项式对 (互素，以及乘上一个公因式之后的情形)；同时检查 s、t、g 完全相同。
+# 用法: python benchmarks/bench_gcdex.py [最高次数]
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sympy
+
+from polynomial_parser.partial_fraction import to_sympy_poly, from_sympy_poly
+from polynomial_parser.polynomial_math import polynomial_gcdex
+
+x = sympy.Symbol('x')
+
+
+def build_corpus(max_degree, seed=0):
+    rng = random.Random(seed)
+
+    def random_poly(degree):
+        return sympy.Poly([rng.randint(1, 5)] + [rng.randint(-20, 20) for _ in range(degree)], x)
+
+    corpus = []
+    degree = 5
+    while degree <= max_degree:
+        corpus.append((f"互素 {degree} 次", random_poly(degree), random_poly(degree - 1)))
+        common = random_poly(max(degree // 5, 1))
+        corpus.append((f"公因式 {degree} 次", random_poly(degree) * common, random_poly(degree - 1) * common))
+        degree *= 2
+    return corpus
+
+
+if __name__ == "__main__":
+    max_degree = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    mismatches = 0
+    total_native = total_sympy = 0.0
+    for name, sympy_a, sympy_b in build_corpus(max_degree):
+        a, b = from_sympy_poly(sympy_a), from_sympy_poly(sympy_b)
+
+        start = time.perf_counter()
+        native = polynomial_gcdex(a, b)
+        native_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reference = sympy.gcdex(sympy_a.set_domain(sympy.QQ), sympy_b.set_domain(sympy.QQ))
+        sympy_time = time.perf_counter() - start
+
+        same = all(to_sympy_poly(value).as_expr() == expected.as_expr()
+                   for value, expected in zip(native, reference))
+        mismatches += not same
+        total_native += native_time
+        total_sympy += sympy_time
+        print(f"{name:16s} native {native_time * 1000:9.1f} ms  sympy {sympy_time * 1000:9.1f} ms"
+              f"{'' if same else '  结果不一致!'}")
+    print(f"合计: native {total_native * 1000:.1f} ms, sympy {total_sympy * 1000:.1f} ms")
+    if mismatches:
+        sys.exit(1)
@@ -0,0 +1,56 @@
+# benchmarks/bench_import.py
+# 导入时间基准：在新的解释器中测量 import polynomial_parser 的耗时，
+# 并检查导入后没有加载 SymPy 等重量级模块。
+# 用法: python benchmarks/bench_import.py [轮数] [上限毫秒]
+# 给出上限时，中位数超过上限或加载了不应加载的模块都会以非零状态退出。
+
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 这些模块不应出现在 import polynomial_parser 的启动路径上
+HEAVY_MODULES = ['sympy', 'numpy', 'sqlite3', 'asyncio', 'concurrent.futures', 'multiprocessing', 'http.server']
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = [name for name in {heavy!r} if name in sys.modules]
+print(elapsed * 1000, ','.join(loaded))
+"""
+
+
+def measure(module, rounds):
+    """返回 (每轮耗时 (毫秒) 列表, 被加载的重量级模块集合)。"""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    timings = []
+    loaded = set()
+    for _ in range(rounds):
+        output = subprocess.run([sys.executable, '-c', _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+                                env=env, cwd=ROOT, capture_output=True, text=True, check=True).stdout.split()
+        timings.append(float(output[0]))
+        if len(output) > 1:
+            loaded.update(output[1].split(','))
+    return timings, loaded
+
+
+if __name__ == "__main__":
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    limit_ms = float(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    failed = False
+    for module in ('polynomial_parser', 'polynomial_parser.partial_fraction', 'sympy'):
+        timings, loaded = measure(module, rounds)
+        print(f"import {module:36s} 中位数 {statistics.median(timings):8.1f} ms, "
+              f"最小 {min(timings):8.1f} ms, 加载的重量级模块: {', '.join(sorted(loaded)) or '无'}")
+        if module == 'polynomial_parser':
+            if loaded:
+                failed = True
+            if limit_ms is not None and statistics.median(timings) > limit_ms:
+                failed = True
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,62 @@
+# benchmarks/bench_numeric_roots.py
+# 批量数值求根基准：roots_numeric_many (按次数分组、整组求友矩阵特征值) 与逐个调用
+# numpy.roots、sympy 的 nroots 比较；同时检查与 numpy.roots 的结果一致。
+# 用法: python benchmarks/bench_numeric_roots.py [多项式个数]
+
+import os
+import random
+import sys
+import time
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy
+import sympy
+
+from polynomial_parser import roots_numeric_many
+from polynomial_parser.polynomial import Polynomial
+from polynomial_parser.partial_fraction import to_sympy_poly
+
+
+def build_corpus(count, seed=0):
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(count):
+        degree = rng.randint(2, 6)
+        terms = {exp: Fraction(rng.randint(-50, 50), rng.randint(1, 4)) for exp in range(degree)}
+        terms[degree] = Fraction(rng.randint(1, 9))
+        corpus.append(Polynomial(terms))
+    return corpus
+
+
+def _dense(poly):
+    return [float(poly.terms.get(exp, 0)) for exp in range(poly.degree(), -1, -1)]
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    corpus = build_corpus(count)
+
+    start = time.perf_counter()
+    native = roots_numeric_many(corpus)
+    native_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reference = [numpy.sort_complex(numpy.roots(_dense(poly))) for poly in corpus]
+    numpy_time = time.perf_counter() - start
+
+    sample = corpus[:200]
+    start = time.perf_counter()
+    for poly in sample:
+        sympy.Poly(to_sympy_poly(poly)).nroots()
+    sympy_time = (time.perf_counter() - start) * len(corpus) / len(sample)
+
+    error = max(numpy.max(numpy.abs(a - b) / numpy.maximum(numpy.abs(b), 1)) for a, b in zip(native, reference))
+    print(f"{count} 个 2~6 次多项式")
+    print(f"  roots_numeric_many: {native_time * 1000:9.1f} ms")
+    print(f"  numpy.roots 逐个:   {numpy_time * 1000:9.1f} ms")
+    print(f"  sympy nroots 逐个:  {sympy_time * 1000:9.1f} ms (按 {len(sample)} 个估计)")
+    print(f"  与 numpy.roots 的最大相对差: {error:.2e}")
+    if error > 1e-6:
+        sys.exit(1)
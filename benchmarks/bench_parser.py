@@ -0,0 +1,42 @@
+# benchmarks/bench_parser.py
+# 解析吞吐量基准：在长表达式上测量 Parser 构建 AST 的速度 (不含求值)。
+# 用法: python benchmarks/bench_parser.py [目标大小 MB]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from polynomial_parser.tokenizer import tokenize
+from polynomial_parser.parser import Parser
+
+# 覆盖加减乘除、乘方、一元负号、括号和隐式乘法
+SNIPPET = "3x^2 - 2(x-1)(x+1)^2 + -1/2x * (x^3 - 4x^2 + 6x + 7) / (x^2 + 2x + 4)"
+
+
+def build_expression(target_bytes):
+    """重复拼接 SNIPPET，直到长度达到 target_bytes。"""
+    repeat = max(1, target_bytes // (len(SNIPPET) + 3))
+    return " + ".join([SNIPPET] * repeat)
+
+
+def bench(tokens, rounds=5):
+    """返回构建 AST 的最佳耗时 (秒)。"""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        Parser(tokens).parse()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    target_mb = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    expression = build_expression(int(target_mb * 1024 * 1024))
+    tokens = tokenize(expression)
+
+    elapsed = bench(tokens)
+    print(f"输入大小: {len(expression) / (1024 * 1024):.2f} MB, token 数量: {len(tokens)}")
+    print(f"最佳耗时: {elapsed:.3f} s")
+    print(f"吞吐量: {len(tokens) / elapsed / 1e6:.2f} M tokens/s")
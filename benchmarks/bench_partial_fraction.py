@@ -0,0 +1,77 @@
+# benchmarks/bench_partial_fraction.py
+# 分式裂项基准：比较原生实现 (apart 模块) 与 SymPy 实现 (sympy.apart + 结果转换) 的速度，
+# 并检查两者的每个结果相加后都等于原分式。
+# 用法: python benchmarks/bench_partial_fraction.py [表达式数量]
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from polynomial_parser import parse_and_evaluate
+from polynomial_parser.polynomial import Polynomial
+from polynomial_parser.fractional_polynomial import FractionalPolynomial
+from polynomial_parser.partial_fraction import partial_fraction_decompose
+
+
+def build_corpus(count, seed=0):
+    """一次因式、重因式以及不可约二次因式混合的分式。"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(count):
+        factors = [f"({rng.randint(1, 3)}x + {rng.randint(-9, 9)})^{rng.randint(1, 3)}"
+                   for _ in range(rng.randint(1, 3))]
+        if rng.random() < 0.5:
+            factors.append(f"(x^2 + {rng.randint(1, 9)})")
+        numerator = " + ".join(f"{rng.randint(-9, 9)}x^{i}" for i in range(rng.randint(1, 6)))
+        corpus.append(f"({numerator}) / ({' * '.join(factors)})")
+    return corpus
+
+
+def build_linear_corpus(count, seed=0):
+    """分母是互不相同的一次因式之积 (最常见的输入，走有理根 + Heaviside 覆盖法的快速路径)。"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(count):
+        roots = rng.sample(range(-20, 21), rng.randint(2, 6))
+        factors = [f"({rng.choice([1, 1, 2, 3])}x + {root})" for root in roots]
+        numerator = " + ".join(f"{rng.randint(-9, 9)}x^{i}" for i in range(rng.randint(1, len(roots))))
+        corpus.append(f"({numerator}) / ({' * '.join(factors)})")
+    return corpus
+
+
+def _check(frac, terms):
+    """裂项结果之和是否等于原分式。"""
+    total = FractionalPolynomial(Polynomial(), Polynomial({0: 1}))
+    for term in terms:
+        total = total + term
+    return (total.numerator * frac.denominator - frac.numerator * total.denominator).is_zero()
+
+
+def run(fractions, method):
+    start = time.perf_counter()
+    results = [partial_fraction_decompose(frac, method=method) for frac in fractions]
+    return time.perf_counter() - start, results
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    failures = 0
+    for name, build in (("混合因式", build_corpus), ("一次因式", build_linear_corpus)):
+        fractions = [parse_and_evaluate(expression) for expression in build(count)]
+        fractions = [frac for frac in fractions if isinstance(frac, FractionalPolynomial)]
+
+        native_time, native_results = run(fractions, 'native')
+        # SymPy 的导入时间不计入
+        import sympy
+        sympy_time, _ = run(fractions, 'sympy')
+
+        failures += sum(1 for frac, terms in zip(fractions, native_results) if not _check(frac, terms))
+        print(f"{name}: {len(fractions)} 个分式")
+        print(f"  native: {native_time * 1000 / len(fractions):8.3f} ms/个")
+        print(f"  sympy:  {sympy_time * 1000 / len(fractions):8.3f} ms/个 (原生实现快 {sympy_time / native_time:.1f} 倍)")
+    if failures:
+        print(f"错误: {failures} 个原生裂项结果与原分式不相等")
+        sys.exit(1)
@@ -0,0 +1,83 @@
+# benchmarks/bench_power_series.py
+# 截断幂级数基准：PowerSeries 的 Newton 迭代 (倒数、对数、指数、平方根) 与 sympy 的 ring_series
+# (rs_series_inversion / rs_log / rs_exp / rs_nth_root) 比较，同时检查两者的系数相同；
+# 最后比较 FractionalPolynomial.to_series 与 sympy.series 展开有理函数。
+# 用法: python benchmarks/bench_power_series.py [最高阶数]
+
+import os
+import random
+import sys
+import time
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sympy
+from sympy.polys.domains import QQ
+from sympy.polys.rings import ring
+from sympy.polys.ring_series import rs_exp, rs_log, rs_nth_root, rs_series_inversion
+
+from polynomial_parser import PowerSeries, parse_and_evaluate
+from polynomial_parser.polynomial import Polynomial
+
+R, X = ring('x', QQ)
+
+
+def random_poly(rng, degree, constant):
+    terms = {exp: Fraction(rng.randint(-9, 9), rng.randint(1, 3)) for exp in range(1, degree + 1)}
+    terms[0] = Fraction(constant)
+    return Polynomial(terms)
+
+
+def to_ring(poly):
+    return sum((QQ(c.numerator, c.denominator) * X ** exp for exp, c in poly.terms.items()), R.zero)
+
+
+def coefficients(element, order):
+    # PolyElement 是 单项式 -> 系数 的字典
+    values = [element.get((k,), QQ.zero) for k in range(order)]
+    return [Fraction(int(c.numerator), int(c.denominator)) for c in values]
+
+
+def measure(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    max_order = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    rng = random.Random(0)
+    mismatches = 0
+    order = 100
+    while order <= max_order:
+        one = random_poly(rng, 5, 1)
+        zero = random_poly(rng, 5, 0)
+        cases = (
+            ("倒数", lambda: PowerSeries(one, order).inverse(), lambda: rs_series_inversion(to_ring(one), X, order)),
+            ("对数", lambda: PowerSeries(one, order).log(), lambda: rs_log(to_ring(one), X, order)),
+            ("指数", lambda: PowerSeries(zero, order).exp(), lambda: rs_exp(to_ring(zero), X, order)),
+            ("平方根", lambda: PowerSeries(one, order).sqrt(), lambda: rs_nth_root(to_ring(one), 2, X, order)),
+        )
+        for name, native_call, sympy_call in cases:
+            native, native_time = measure(native_call)
+            reference, sympy_time = measure(sympy_call)
+            same = native.coefficients() == coefficients(reference, order)
+            mismatches += not same
+            print(f"{order:5d} 阶 {name:4s}  native {native_time * 1000:9.1f} ms  ring_series {sympy_time * 1000:9.1f} ms"
+                  f"{'' if same else '  结果不一致!'}")
+        order *= 2
+
+    x = sympy.Symbol('x')
+    expression = "(x^3 - 2x + 5) / ((x - 3)^2 (x^2 + x + 1))"
+    frac = parse_and_evaluate(expression, use_cache=False)
+    native, native_time = measure(frac.to_series, 40, 1)
+    sympy_expression = (x ** 3 - 2 * x + 5) / ((x - 3) ** 2 * (x ** 2 + x + 1))
+    reference, sympy_time = measure(sympy.series, sympy_expression, x, 1, 40)
+    reference = sympy.Poly(reference.removeO().subs(x, x + 1).expand(), x)
+    same = native.coefficients() == [Fraction(int(c.p), int(c.q)) for c in reversed(reference.all_coeffs())]
+    mismatches += not same
+    print(f"to_series 40 阶 (x = 1)  native {native_time * 1000:9.1f} ms  sympy.series {sympy_time * 1000:9.1f} ms"
+          f"{'' if same else '  结果不一致!'}")
+    if mismatches:
+        sys.exit(1)
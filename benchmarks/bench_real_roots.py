@@ -0,0 +1,55 @@
+# benchmarks/bench_real_roots.py
+# 实根隔离基准：比较 Polynomial.real_roots() (real_roots 模块) 与 sympy 的 Poly.intervals()，
+# 语料为不同次数的随机整系数多项式、Chebyshev 多项式 (实根全部挤在 (-1, 1) 中) 以及带重根的乘积；
+# 同时检查两者隔离出的实根个数相同。
+# 用法: python benchmarks/bench_real_roots.py [随机多项式的最高次数]
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sympy
+
+from polynomial_parser.partial_fraction import from_sympy_poly
+
+x = sympy.Symbol('x')
+
+
+def build_corpus(max_degree, seed=0):
+    rng = random.Random(seed)
+    corpus = []
+    degree = 50
+    while degree <= max_degree:
+        coefficients = [rng.randint(1, 100)] + [rng.randint(-100, 100) for _ in range(degree)]
+        corpus.append((f"随机 {degree} 次", sympy.Poly(coefficients, x)))
+        degree *= 2
+    for n in (20, 40):
+        corpus.append((f"Chebyshev T{n}", sympy.Poly(sympy.chebyshevt(n, x), x)))
+    corpus.append(("重根", sympy.Poly(((x ** 2 - 2) ** 3 * (3 * x - 1) ** 2 * (x ** 5 - x - 1)).expand(), x)))
+    return corpus
+
+
+if __name__ == "__main__":
+    max_degree = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    mismatches = 0
+    for name, sympy_poly in build_corpus(max_degree):
+        poly = from_sympy_poly(sympy_poly)
+
+        start = time.perf_counter()
+        intervals = poly.real_roots()
+        native_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reference = sympy_poly.intervals()
+        sympy_time = time.perf_counter() - start
+
+        same = len(intervals) == len(reference)
+        mismatches += not same
+        print(f"{name:16s} 次数 {poly.degree():4d}  {len(intervals):3d} 个实根  "
+              f"native {native_time * 1000:9.1f} ms  sympy {sympy_time * 1000:9.1f} ms"
+              f"{'' if same else '  结果不一致!'}")
+    if mismatches:
+        sys.exit(1)
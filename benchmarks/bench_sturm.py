@@ -0,0 +1,78 @@
+# benchmarks/bench_sturm.py
+# Sturm 序列计数基准：同一个多项式在许多区间上的实根计数。
+# 比较 count_real_roots_many (序列缓存、端点一起求值) 与逐个区间调用 count_real_roots，
+# 以及 sympy 的 Poly.count_roots (按少量区间估计)；同时检查结果与 sympy 一致。
+# 用法: python benchmarks/bench_sturm.py [区间个数]
+
+import os
+import random
+import sys
+import time
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sympy
+
+from polynomial_parser.partial_fraction import from_sympy_poly
+
+x = sympy.Symbol('x')
+
+
+def build_corpus(seed=0):
+    rng = random.Random(seed)
+    corpus = []
+    for degree in (10, 20, 40):
+        coefficients = [rng.randint(1, 100)] + [rng.randint(-100, 100) for _ in range(degree)]
+        corpus.append((f"随机 {degree} 次", sympy.Poly(coefficients, x)))
+    corpus.append(("Chebyshev T20", sympy.Poly(sympy.chebyshevt(20, x), x)))
+    corpus.append(("重根", sympy.Poly(((x ** 2 - 2) ** 3 * (3 * x - 1) ** 2 * (x ** 5 - x - 1)).expand(), x)))
+    return corpus
+
+
+def build_intervals(count, seed=0):
+    rng = random.Random(seed)
+    # 端点取自一个有限的网格，区间之间会共用端点
+    grid = [Fraction(k, 16) for k in range(-48, 49)]
+    intervals = []
+    for _ in range(count):
+        a, b = sorted(rng.sample(grid, 2))
+        intervals.append((a, b))
+    return intervals
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    intervals = build_intervals(count)
+    sample = intervals[:10]
+    mismatches = 0
+    for name, sympy_poly in build_corpus():
+        poly = from_sympy_poly(sympy_poly)
+
+        start = time.perf_counter()
+        poly.sturm_sequence()
+        sequence_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        counts = poly.count_real_roots_many(intervals)
+        batch_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        single = [poly.count_real_roots(a, b) for a, b in intervals]
+        single_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        # count_roots 计算闭区间 [a, b]，右端点属于区间、左端点是根时需要减去
+        reference = [sympy_poly.count_roots(sympy.Rational(a.numerator, a.denominator),
+                                            sympy.Rational(b.numerator, b.denominator))
+                     - (sympy_poly.eval(sympy.Rational(a.numerator, a.denominator)) == 0)
+                     for a, b in sample]
+        sympy_time = (time.perf_counter() - start) * len(intervals) / len(sample)
+
+        same = counts == single and counts[:len(sample)] == reference
+        mismatches += not same
+        print(f"{name:14s} 序列 {sequence_time * 1000:7.1f} ms  批量 {batch_time * 1000:8.1f} ms  "
+              f"逐个 {single_time * 1000:8.1f} ms  sympy {sympy_time * 1000:10.1f} ms (按 {len(sample)} 个估计)"
+              f"{'' if same else '  结果不一致!'}")
+    if mismatches:
+        sys.exit(1)
@@ -0,0 +1,44 @@
+# benchmarks/bench_tokenizer.py
+# 词法分析吞吐量基准：在长输入上测量 tokenize 的 MB/s。
+# 用法: python benchmarks/bench_tokenizer.py [目标大小 MB]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from polynomial_parser.tokenizer import tokenize
+
+# 覆盖数字、分数、变量、乘方、括号和各种隐式乘法
+SNIPPET = "3x^2 + 2(x-1)(x+1) - 1/2x + (x^3 - 4x^2 + 6x + 7) / (x^2 + 2x + 4)"
+
+
+def build_expression(target_bytes):
+    """重复拼接 SNIPPET，直到长度达到 target_bytes。"""
+    repeat = max(1, target_bytes // (len(SNIPPET) + 3))
+    return " + ".join([SNIPPET] * repeat)
+
+
+def bench(expression, rounds=5):
+    """返回 (最佳耗时秒数, token 数量)。"""
+    best = float('inf')
+    token_count = 0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        tokens = tokenize(expression)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        token_count = len(tokens)
+    return best, token_count
+
+
+if __name__ == "__main__":
+    target_mb = float(sys.argv[1]) if len(sys.argv) > 1 else 4.0
+    expression = build_expression(int(target_mb * 1024 * 1024))
+    size_mb = len(expression) / (1024 * 1024)
+
+    elapsed, token_count = bench(expression)
+    print(f"输入大小: {size_mb:.2f} MB, token 数量: {token_count}")
+    print(f"最佳耗时: {elapsed:.3f} s")
+    print(f"吞吐量: {size_mb / elapsed:.2f} MB/s, {token_count / elapsed / 1e6:.2f} M tokens/s")
@@ -6,7 +6,6 @@ from polynomial_parser.partial_fraction import partial_fraction_decompose, get_s
 from polynomial_parser.polynomial import Polynomial
 from polynomial_parser.ast_nodes import BinOpNode, PolynomialNode, UnaryOpNode
 from fractions import Fraction
-import sympy
 from polynomial_parser.formatting import print_decomposed_terms # Import print_decomposed_terms
 
 
@@ -41,7 +40,8 @@ def solve_expression(expression_string):
 
 
 # Define the symbol for sorting and degree calculation (assuming 'x')
-x = sympy.symbols('x')
+# 只传变量名，SymPy 在真正需要裂项时才会被加载
+x = 'x'
 
 # Removed get_sort_key and print_decomposed_terms from here
 
@@ -1,34 +1,110 @@
-from .tokenizer import tokenize
+from .tokenizer import tokenize, iter_tokens
 from .implicit_multiply import insert_implicit_multiplication
 from .parser import Parser
-from .evaluator import ASTEvaluator
+from .evaluator import ASTEvaluator, EvaluatingParser
 from .fractional_polynomial import FractionalPolynomial
 from .polynomial import Polynomial
+from .cache import ExpressionCache, canonical_key, get_cache, configure_cache
+from .budget import Budget, BudgetExceeded, current_budget
+
+# --- 延迟加载的子模块 ---
+# 这些名称在第一次访问时才导入对应的子模块 (PEP 562)，
+# 使 import polynomial_parser 不必加载 sqlite3、asyncio、concurrent.futures 等。
+
+_LAZY_ATTRIBUTES = {
+    'DiskCache': 'disk_cache',
+    'SizeBounds': 'bounds',
+    'BoundsEvaluator': 'bounds',
+    'estimate_bounds': 'bounds',
+    'parse_and_evaluate_many': 'batch',
+    'iter_parse_and_evaluate_many': 'batch',
+    'EvaluationError': 'batch',
+    'AsyncSolver': 'aio',
+    'parse_and_evaluate_async': 'aio',
+    'partial_fraction_decompose_async': 'aio',
+    'partial_fraction_decompose': 'partial_fraction',
+    'roots_numeric_many': 'numeric_roots',
+    'PowerSeries': 'power_series',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value # 之后的访问不再经过 __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
 # --- 集成解析和求值 ---
 
-def parse_and_evaluate(expression_str: str) -> FractionalPolynomial:
+def parse_and_evaluate(expression_str, use_cache=True) -> FractionalPolynomial:
     """
-    解析数学表达式字符串，构建 AST，然后求值，返回最终的 FractionalPolynomial。
+    解析数学表达式并求值，返回最终的 FractionalPolynomial。
+
+    expression_str 可以是字符串，也可以是文件对象 (文本或二进制)、bytes 或 mmap。
+    字符串输入先查询进程内 LRU 缓存 (见 get_cache / configure_cache)，
+    缓存键是去掉空白并规范化隐式乘法之后的表达式；每次返回的都是独立的副本。
+    其他输入 (以及超长字符串) 以流的方式产生 token 并在解析的同时求值，
+    不会物化完整的 token 列表或 AST，只占用与嵌套深度相关的内存。
+    use_cache: 为 False 时跳过缓存。
     """
     try:
-        # 1. Tokenize
+        return _evaluate(expression_str, use_cache)
+    except (ValueError, SyntaxError, TypeError) as e:
+        print(f"解析或求值错误: {e}")
+        raise # 重新抛出异常
+
+
+def _evaluate(expression_str, use_cache=True):
+    """parse_and_evaluate 的实现，出错时直接抛出异常而不打印 (供批量接口使用)。"""
+    return _evaluate_keyed(expression_str, use_cache)[0]
+
+
+def _evaluate_keyed(expression_str, use_cache):
+    """求值并返回 (结果, 缓存键)；没有经过缓存时缓存键为 None。"""
+    cache = get_cache()
+    if use_cache and isinstance(expression_str, str) and cache.accepts(expression_str):
+        # 1. Tokenize (隐式乘法 token 已在同一遍扫描中插入)
         tokens = tokenize(expression_str)
-        # print("Tokens before implicit multiply:", tokens) # Debugging
+        key = canonical_key(tokens)
+        result = cache.get(key)
+        if result is None:
+            # 2. Parse and evaluate in one pass
+            result = EvaluatingParser(tokens).parse()
+            cache.put(key, result)
+        return result, key
 
-        # 2. Insert implicit multiplication tokens
-        tokens_with_implicit = insert_implicit_multiplication(tokens)
-        # print("Tokens after implicit multiply:", tokens_with_implicit) # Debugging
+    # 流式路径：token 生成器直接交给边解析边求值的解析器
+    tokens = iter_tokens(expression_str)
+    parser = EvaluatingParser(tokens)
+    result = parser.parse()
+    return result, None
 
-        # 3. Parse tokens into AST
-        parser = Parser(tokens_with_implicit)
-        ast = parser.parse()
-        # print("AST:", ast) # Debugging
 
-        # 4. Evaluate AST
-        evaluator = ASTEvaluator()
-        result = evaluator.evaluate(ast)
-        return result
-    except (ValueError, SyntaxError, TypeError) as e:
-        print(f"解析或求值错误: {e}")
-        raise # 重新抛出异常
+def _decompose(expression_str, use_cache=True):
+    """求值并裂项，返回 (FractionalPolynomial, 裂项结果列表)；/decompose、命令行和 AsyncSolver 共用。"""
+    result, key = _evaluate_keyed(expression_str, use_cache)
+    return result, _decomposition_of(result, key)
+
+
+def _decomposition_of(result, key):
+    """
+    result 的裂项结果，key 是 result 的缓存键 (None 表示不经过缓存)。
+    配置了磁盘缓存时先查询其中保存的裂项结果，未命中时计算并写回 (与结果存在同一项中)。
+    """
+    from .partial_fraction import partial_fraction_decompose
+    disk = get_cache().disk if key is not None else None
+    if disk is not None:
+        terms = disk.get_decomposition(key)
+        if terms is not None:
+            return terms
+    terms = partial_fraction_decompose(result)
+    if disk is not None:
+        disk.put(key, result, terms)
+    return terms
@@ -0,0 +1,198 @@
+# polynomial_parser/aio.py
+
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .budget import Budget, BudgetExceeded
+from .polynomial import Polynomial
+from .fractional_polynomial import FractionalPolynomial
+
+# --- asyncio 接口 ---
+
+# 超过这个长度的表达式不参与请求去重 (避免巨大的字符串作为字典键常驻内存)
+_MAX_DEDUP_KEY_LENGTH = 1 << 16
+
+
+def _evaluate_expression(expression_str, use_cache):
+    from . import _evaluate
+    return _evaluate(expression_str, use_cache)
+
+
+def _decompose(value, use_cache):
+    if isinstance(value, str):
+        # 与 /decompose、命令行共用的路径 (会查询磁盘缓存中保存的裂项结果)
+        from . import _decompose as decompose_expression
+        return decompose_expression(value, use_cache)[1]
+    from .partial_fraction import partial_fraction_decompose
+    return partial_fraction_decompose(value)
+
+
+def _run_with_budget(timeout, cancel_event, function, *args):
+    """
+    在执行器的线程 / 进程中运行 function(*args)，其中的多项式运算受 Budget 约束：
+    超过 timeout 或 cancel_event 被设置时在下一次预算检查处中止。
+    Budget 保存在 ContextVar 中，不会随 run_in_executor 传到执行器，因此限制以参数传入。
+    """
+    with Budget(timeout=timeout, cancel_event=cancel_event):
+        return function(*args)
+
+
+def _copy_terms(terms):
+    """复制裂项结果中的 Polynomial / FractionalPolynomial (SymPy 表达式本身不可变)。"""
+    return [term.copy() if isinstance(term, (Polynomial, FractionalPolynomial)) else term for term in terms]
+
+
+class _InFlight:
+    """一个正在执行的计算、它的取消标志以及等待它的协程数量。"""
+    __slots__ = ('future', 'cancel_event', 'waiters')
+
+    def __init__(self, future, cancel_event):
+        self.future = future
+        self.cancel_event = cancel_event
+        self.waiters = 0
+
+
+class AsyncSolver:
+    """
+    在执行器中运行解析 / 求值 / 裂项，不阻塞事件循环。
+
+    - executor: 可选的 concurrent.futures 执行器；默认按 use_processes 创建
+      线程池或进程池 (首次使用时创建，close() 时关闭)；
+    - 相同的请求 (timeout 也相同) 同时在执行时，后来的调用者等待同一个结果，不会重复计算；
+    - 每次调用可以指定 timeout (秒)，超时抛出 TimeoutError；计算本身也在执行器中以
+      Budget(timeout=timeout) 运行，超时后工作线程 / 进程随即中止计算，不会在后台继续占用；
+    - 调用方被取消或超时不会影响等待同一结果的其他调用方，
+      当所有调用方都放弃时取消底层任务：尚未开始的任务不再执行，
+      已经开始的任务通过取消标志在下一次预算检查时中止 (进程池使用 multiprocessing.Manager 的 Event)。
+
+    返回的对象是各调用方独立的副本。
+    """
+    def __init__(self, executor=None, use_processes=False, max_workers=None, use_cache=True):
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._use_processes = use_processes
+        self._max_workers = max_workers
+        self.use_cache = use_cache
+        self._manager = None # 进程池执行器的取消标志所需的 multiprocessing.Manager，首次需要时启动
+        self._inflight = {} # (事件循环, 请求键, timeout) -> _InFlight
+
+    def _get_executor(self):
+        if self._executor is None:
+            executor_class = ProcessPoolExecutor if self._use_processes else ThreadPoolExecutor
+            self._executor = executor_class(max_workers=self._max_workers)
+        return self._executor
+
+    def _new_cancel_event(self, executor):
+        """新建一个能传给 executor 的取消标志。"""
+        if isinstance(executor, ProcessPoolExecutor):
+            if self._manager is None:
+                import multiprocessing
+                self._manager = multiprocessing.Manager()
+            return self._manager.Event()
+        return threading.Event()
+
+    async def _run(self, key, function, *args, timeout=None):
+        loop = asyncio.get_running_loop()
+        # 执行器中的 Budget 使用发起计算的调用方的 timeout，所以 timeout 也是去重键的一部分
+        inflight_key = (loop, key, timeout) if key is not None else None
+        entry = self._inflight.get(inflight_key) if inflight_key is not None else None
+
+        if entry is None:
+            executor = self._get_executor()
+            cancel_event = self._new_cancel_event(executor)
+            entry = _InFlight(loop.run_in_executor(executor, _run_with_budget, timeout, cancel_event,
+                                                   function, *args),
+                              cancel_event)
+            if inflight_key is not None:
+                self._inflight[inflight_key] = entry
+                entry.future.add_done_callback(lambda _, k=inflight_key, e=entry: self._forget(k, e))
+
+        entry.waiters += 1
+        try:
+            # shield: 单个调用方的取消 / 超时只结束自己的等待
+            return await asyncio.wait_for(asyncio.shield(entry.future), timeout)
+        except BudgetExceeded as e:
+            # 执行器中的 Budget 先于 wait_for 到期：与等待超时一样报告为 TimeoutError
+            if e.limit != 'timeout':
+                raise
+            raise TimeoutError(str(e)) from e
+        finally:
+            entry.waiters -= 1
+            if entry.waiters == 0 and not entry.future.done():
+                entry.future.cancel()
+                entry.cancel_event.set()
+                self._forget(inflight_key, entry)
+
+    def _forget(self, key, entry):
+        if key is not None and self._inflight.get(key) is entry:
+            del self._inflight[key]
+
+    async def parse_and_evaluate(self, expression_str, timeout=None):
+        """
+        parse_and_evaluate 的异步版本，返回 FractionalPolynomial。
+        错误直接以异常抛出，不打印。
+        """
+        key = None
+        if isinstance(expression_str, str) and len(expression_str) <= _MAX_DEDUP_KEY_LENGTH:
+            key = ('evaluate', expression_str)
+        result = await self._run(key, _evaluate_expression, expression_str, self.use_cache, timeout=timeout)
+        return result.copy()
+
+    async def partial_fraction_decompose(self, value, timeout=None):
+        """
+        partial_fraction_decompose 的异步版本。
+        value 可以是 FractionalPolynomial，也可以是表达式字符串 (先求值再裂项)。
+        """
+        if isinstance(value, str):
+            key = ('decompose', value) if len(value) <= _MAX_DEDUP_KEY_LENGTH else None
+        elif isinstance(value, FractionalPolynomial):
+            key = ('decompose', value.to_bytes())
+        else:
+            raise TypeError("裂项的输入必须是 FractionalPolynomial 或表达式字符串")
+        terms = await self._run(key, _decompose, value, self.use_cache, timeout=timeout)
+        return _copy_terms(terms)
+
+    def in_flight(self):
+        """当前正在执行的 (去重后的) 请求数量。"""
+        return len(self._inflight)
+
+    def close(self):
+        """关闭自己创建的执行器，尚未开始的任务会被取消，正在执行的任务收到取消标志。"""
+        for entry in self._inflight.values():
+            entry.cancel_event.set()
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+
+# --- 模块级便捷函数 ---
+
+_default_solver = None
+
+
+def get_solver():
+    """返回模块级的默认 AsyncSolver (线程池执行器)。"""
+    global _default_solver
+    if _default_solver is None:
+        _default_solver = AsyncSolver()
+    return _default_solver
+
+
+async def parse_and_evaluate_async(expression_str, timeout=None):
+    """使用默认 AsyncSolver 异步解析并求值。"""
+    return await get_solver().parse_and_evaluate(expression_str, timeout=timeout)
+
+
+async def partial_fraction_decompose_async(value, timeout=None):
+    """使用默认 AsyncSolver 异步裂项。"""
+    return await get_solver().partial_fraction_decompose(value, timeout=timeout)
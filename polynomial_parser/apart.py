@@ -0,0 +1,201 @@
+# polynomial_parser/apart.py
+
+import math
+from fractions import Fraction
+
+from .polynomial import Polynomial
+from .fractional_polynomial import FractionalPolynomial
+from .polynomial_math import polynomial_invert
+
+# --- 原生分式裂项 ---
+#
+# 不经过 SymPy，直接在 Polynomial / FractionalPolynomial 上完成：
+#   1. N/D = Q + R/D (多项式长除法)
+#   2. D 在有理数域上分解为 lc * prod(f^e)：先用有理根定理 (模小素数筛选候选 + 综合除法)
+#      剥离全部一次因式及其重数；剩下的部分不超过三次时不可约，否则交给 factorization 模块
+#   3. 如果 D 只有一重的一次因式，用 Heaviside 覆盖法直接得到每一项的系数
+#   4. 对 D = lc * prod(f^e) 的每个 P = f^e，用扩展欧几里得算法 (polynomial_invert) 求 (D/P) 模 P 的逆元 s，
+#      得到 A = R * s / lc mod P，满足 R/D = sum(A / P)
+#   5. 重因式按 Hermite 的方式处理：把 A 写成 f 进制 A = c0 + c1*f + ... + c(e-1)*f^(e-1)，
+#      于是 A / f^e = sum(ck / f^(e-k))，每个 ck 的次数都小于 f 的次数
+#
+# 因式统一取本原整系数、主项系数为正的形式，结果与 sympy.apart 的写法一致 (例如 1/(2x + 1))。
+
+# 有理根候选来自常数项和主项系数的因数；系数超过这个值时不再试除分解整数，
+# 改为把分母整体交给 factorization 模块
+_MAX_ROOT_SEARCH_COEFFICIENT = 10 ** 10
+# 用来筛选有理根候选的小素数：候选 p/q 必须是 f 模 l 的根
+_PRUNING_PRIMES = (5, 7, 11, 13, 17)
+
+
+def _exact_quotient(a, b):
+    quotient, _ = a.divmod_polynomial(b)
+    return quotient
+
+
+def _divisors(n):
+    """n > 0 的全部正因数；n 过大时返回 None。"""
+    if n > _MAX_ROOT_SEARCH_COEFFICIENT:
+        return None
+    small, large = [], []
+    d = 1
+    while d * d <= n:
+        if n % d == 0:
+            small.append(d)
+            if d * d != n:
+                large.append(n // d)
+        d += 1
+    return small + large[::-1]
+
+
+def _synthetic_division(f, p, q):
+    """
+    整系数多项式 f (低次在前) 除以 q*x - p (综合除法)；不能整除时返回 None。
+    f = (q*x - p) * g 时 g[k-1] = (f[k] + p * g[k]) / q，只做整数运算。
+    """
+    n = len(f) - 1
+    g = [0] * n
+    previous = 0
+    for k in range(n, 0, -1):
+        previous, rest = divmod(f[k] + p * previous, q)
+        if rest:
+            return None
+        g[k - 1] = previous
+    if f[0] + p * g[0] != 0:
+        return None
+    return g
+
+
+def _rational_roots(f):
+    """
+    f: 本原整系数多项式 (低次在前)，f(0) != 0。
+    返回 ([(p, q, multiplicity), ...], rest)：f = prod((q*x - p)^multiplicity) * rest，rest 没有有理根；
+    系数太大、无法枚举候选时返回 None。
+
+    候选 p/q (p 整除 f(0)、q 整除主项系数) 先经过两道廉价的筛选：
+    q - p 整除 f(1)、q + p 整除 f(-1)，以及 p/q 模几个小素数 l 是 f 的根
+    (预先算出 f 模 l 的全部根，每个候选只需一次查表)；只有通过筛选的候选才做综合除法。
+    """
+    numerators = _divisors(abs(f[0]))
+    denominators = _divisors(abs(f[-1]))
+    if numerators is None or denominators is None:
+        return None
+    value_at_one = sum(f)
+    value_at_minus_one = sum(c if i % 2 == 0 else -c for i, c in enumerate(f))
+    residues = []
+    for prime in _PRUNING_PRIMES:
+        zeros = set()
+        for r in range(prime):
+            value = 0
+            for c in reversed(f):
+                value = (value * r + c) % prime
+            if value == 0:
+                zeros.add(r)
+        residues.append((prime, zeros))
+
+    roots = []
+    for q in denominators:
+        # 候选 p/q 模 l 等于 p * q^-1；l 整除 q 时这个素数不能用来筛选
+        sieve = [(prime, pow(q, -1, prime), zeros) for prime, zeros in residues if q % prime]
+        for numerator in numerators:
+            if math.gcd(numerator, q) != 1:
+                continue
+            for p in (numerator, -numerator):
+                if len(f) == 1:
+                    return roots, f
+                if q - p == 0 and value_at_one or q - p != 0 and value_at_one % (q - p):
+                    continue
+                if q + p == 0 and value_at_minus_one or q + p != 0 and value_at_minus_one % (q + p):
+                    continue
+                if any(p * inverse % prime not in zeros for prime, inverse, zeros in sieve):
+                    continue
+                multiplicity = 0
+                quotient = _synthetic_division(f, p, q)
+                while quotient is not None:
+                    multiplicity += 1
+                    f = quotient
+                    quotient = _synthetic_division(f, p, q) if len(f) > 1 else None
+                if multiplicity:
+                    roots.append((p, q, multiplicity))
+    return roots, f
+
+
+def factor_denominator(poly):
+    """
+    把多项式分解为 lc * prod(f^e)，返回 (lc, [(f, e), ...])。
+    f 为有理数域上的不可约因式 (本原整系数、主项系数为正)，按次数、重数排序。
+
+    先用有理根定理剥离所有一次因式 (常见的分母都能完全分解为一次因式，这时不需要
+    无平方分解和一般的因式分解)；剩下没有有理根的部分如果不超过三次就一定不可约，
+    否则交给 factorization 模块。
+    """
+    from .factorization import factor
+    from .int_poly import from_integer_list, to_integer_list
+    lc = poly._leading_term()[1]
+    _, f = to_integer_list(poly)
+    factors = []
+    low = next(i for i, c in enumerate(f) if c)
+    if low:
+        factors.append((Polynomial({1: 1}), low))
+        f = f[low:]
+    found = _rational_roots(f) if len(f) > 1 else ([], f)
+    if found is None:
+        rest = f
+    else:
+        roots, rest = found
+        factors.extend((Polynomial({1: q, 0: -p}), multiplicity) for p, q, multiplicity in roots)
+    if len(rest) > 1:
+        if found is not None and len(rest) <= 4:
+            # 没有有理根的二次、三次多项式不可约 (也就没有重因式)
+            factors.append((from_integer_list(rest), 1))
+        else:
+            factors.extend(factor(from_integer_list(rest))[1])
+    for factor_poly, multiplicity in factors:
+        lc /= factor_poly._leading_term()[1] ** multiplicity
+    factors.sort(key=lambda item: (item[0].degree(), item[1], sorted(item[0].terms.items())))
+    return lc, factors
+
+
+def apart(frac_poly):
+    """
+    对分式多项式进行分式裂项，不使用 SymPy。
+    返回 Polynomial / FractionalPolynomial 组成的列表：多项式部分 (如果非零) 在前，
+    随后是各个 c / f^k 项，f 为不可约因式，c 的次数小于 f 的次数。
+    """
+    numerator, denominator = frac_poly.numerator, frac_poly.denominator
+    if denominator.is_constant():
+        return [numerator * (Fraction(1) / denominator.terms[0])]
+
+    quotient, remainder = numerator.divmod_polynomial(denominator)
+    terms = [quotient] if not quotient.is_zero() else []
+    if remainder.is_zero():
+        return terms or [Polynomial()]
+
+    lc, factors = factor_denominator(denominator)
+    if all(factor.degree() == 1 and multiplicity == 1 for factor, multiplicity in factors):
+        # 分母只有一重的一次因式：Heaviside 覆盖法，r 处的系数为 N(r) / D'(r)
+        # (Q*D 在 r 处为零，所以 N 与余式 R 的值相同)；c / (x - r) 写成 (c*q) / (q*x - p)
+        derivative = denominator.derivative()
+        for factor, _ in factors:
+            q = factor.terms[1]
+            root = -factor.terms.get(0, Fraction(0)) / q
+            coeff = remainder.evaluate(root) / derivative.evaluate(root) * q
+            terms.append(FractionalPolynomial._from_reduced(Polynomial({0: coeff}), factor))
+        return terms
+
+    remainder = remainder * (Fraction(1) / lc)
+    # 去掉常数因子后的分母 prod(f^e)
+    monic_denominator = denominator * (Fraction(1) / lc)
+
+    for factor, multiplicity in factors:
+        prime_power = factor.power(multiplicity)
+        cofactor = _exact_quotient(monic_denominator, prime_power)
+        _, reduced = remainder.divmod_polynomial(prime_power)
+        _, cofactor = cofactor.divmod_polynomial(prime_power)
+        _, part = (reduced * polynomial_invert(cofactor, prime_power)).divmod_polynomial(prime_power)
+        # part = c0 + c1*f + ... ，ck 对应 ck / f^(multiplicity - k)
+        for k in range(multiplicity):
+            part, digit = part.divmod_polynomial(factor)
+            if not digit.is_zero():
+                terms.append(FractionalPolynomial(digit, factor.power(multiplicity - k)))
+    return terms
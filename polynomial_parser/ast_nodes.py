@@ -19,9 +19,9 @@ class PolynomialNode(Node):
 
 
 class BinOpNode(Node):
-    """表示二元运算符节点 (+, -, *, /)。"""
+    """表示二元运算符节点 (+, -, *, /, ^, @)。"""
     def __init__(self, operator: str, left: Node, right: Node):
-        if operator not in ['+', '-', '*', '/']:
+        if operator not in ['+', '-', '*', '/', '^', '@']:
             raise ValueError(f"不支持的二元运算符: {operator}")
         self.operator = operator
         self.left = left
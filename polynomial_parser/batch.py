@@ -0,0 +1,157 @@
+# polynomial_parser/batch.py
+
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from itertools import islice
+
+from .fractional_polynomial import FractionalPolynomial
+
+# --- 批量求值 ---
+
+# 单个表达式求值失败时会被捕获并记录的异常类型
+_ITEM_ERRORS = (ValueError, SyntaxError, TypeError, ZeroDivisionError)
+
+DEFAULT_CHUNKSIZE = 256
+
+
+class EvaluationError:
+    """
+    批量求值中单个表达式的错误。
+
+    批量接口不打印也不抛出单个表达式的错误，而是在结果的对应位置放入这个对象。
+    index: 表达式在输入中的位置；expression: 原始表达式；
+    error_type: 异常类名 (例如 'SyntaxError')；message: 异常信息。
+    """
+    __slots__ = ('index', 'expression', 'error_type', 'message')
+
+    def __init__(self, index, expression, error_type, message):
+        self.index = index
+        self.expression = expression
+        self.error_type = error_type
+        self.message = message
+
+    def __reduce__(self):
+        return (EvaluationError, (self.index, self.expression, self.error_type, self.message))
+
+    def __repr__(self):
+        return f"EvaluationError(index={self.index}, {self.error_type}: {self.message})"
+
+    def __str__(self):
+        return f"{self.error_type}: {self.message}"
+
+
+def _evaluate_chunk(start, expressions, use_cache, encode):
+    """
+    在当前进程中求值一批表达式 (也是工作进程执行的函数)。
+    encode 为 True 时结果编码为 bytes，进程间只传输紧凑的二进制数据。
+    """
+    from . import _evaluate
+
+    results = []
+    for offset, expression in enumerate(expressions):
+        try:
+            result = _evaluate(expression, use_cache)
+            results.append(result.to_bytes() if encode else result)
+        except _ITEM_ERRORS as e:
+            results.append(EvaluationError(start + offset, expression, type(e).__name__, str(e)))
+    return results
+
+
+def _chunks(expressions, chunksize):
+    """按 chunksize 切分任意可迭代对象，产生 (起始位置, 表达式列表)，不物化整个输入。"""
+    iterator = iter(expressions)
+    start = 0
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def _map_chunks(function, args, items, workers, chunksize, ordered=True, mp_context=None):
+    """
+    把 items 分块交给 function(起始位置, 块, *args)，逐块产生返回值。
+
+    workers <= 1 时在当前进程中依次执行；否则使用进程池，
+    同时在途的块最多为 workers 的两倍，内存占用与输入总量无关。
+    ordered 为 False 时按完成顺序产生结果，慢的块不会阻塞后面已完成的块。
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize 必须是正整数")
+
+    if workers <= 1:
+        for start, chunk in _chunks(items, chunksize):
+            yield function(start, chunk, *args)
+        return
+
+    if isinstance(mp_context, str):
+        mp_context = multiprocessing.get_context(mp_context)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+        max_pending = workers * 2
+        if ordered:
+            pending = deque()
+            for start, chunk in _chunks(items, chunksize):
+                pending.append(executor.submit(function, start, chunk, *args))
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        else:
+            pending = set()
+            for start, chunk in _chunks(items, chunksize):
+                pending.add(executor.submit(function, start, chunk, *args))
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            for future in as_completed(pending):
+                yield future.result()
+
+
+def _resolve_workers(workers):
+    """None 表示使用全部 CPU 核。"""
+    return workers if workers is not None else (os.cpu_count() or 1)
+
+
+def iter_parse_and_evaluate_many(expressions, workers=None, chunksize=DEFAULT_CHUNKSIZE,
+                                 use_cache=True, serialized=False, mp_context=None):
+    """
+    parse_and_evaluate_many 的生成器版本：按输入顺序逐个产生结果。
+
+    expressions 可以是任意可迭代对象 (例如逐行读取的文件)，输入按块提交，
+    内存占用与输入总量无关。
+    """
+    workers = _resolve_workers(workers)
+    # 单进程时直接求值，不经过序列化
+    encode = serialized or workers > 1
+    for items in _map_chunks(_evaluate_chunk, (use_cache, encode), expressions,
+                             workers, chunksize, mp_context=mp_context):
+        yield from _decode_chunk(items, serialized)
+
+
+def _decode_chunk(items, serialized):
+    if serialized:
+        return items
+    return [FractionalPolynomial.from_bytes(item) if isinstance(item, bytes) else item for item in items]
+
+
+def parse_and_evaluate_many(expressions, workers=None, chunksize=DEFAULT_CHUNKSIZE,
+                            use_cache=True, serialized=False, mp_context=None):
+    """
+    批量解析并求值，返回与输入顺序一致的结果列表。
+
+    expressions: 表达式字符串的可迭代对象。
+    workers: 工作进程数，默认为 CPU 核数；小于等于 1 时在当前进程中求值。
+    chunksize: 每次提交给工作进程的表达式数量，表达式很短时调大可以减少进程间通信开销。
+    use_cache: 是否使用 (每个工作进程各自的) 结果缓存。
+    serialized: 为 True 时成功的结果以 FractionalPolynomial.to_bytes() 的形式返回，
+                可以直接写入文件或再发送给其他进程，用 FractionalPolynomial.from_bytes 还原。
+    mp_context: 可选的 multiprocessing 上下文 (例如 'spawn')。
+
+    出错的表达式对应位置是 EvaluationError 对象，不会打印错误，也不会中断其他表达式。
+    """
+    return list(iter_parse_and_evaluate_many(expressions, workers, chunksize,
+                                             use_cache, serialized, mp_context))
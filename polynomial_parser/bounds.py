@@ -0,0 +1,169 @@
+# polynomial_parser/bounds.py
+
+import math
+from collections import namedtuple
+from fractions import Fraction
+
+from .evaluator import ASTEvaluator, EvaluatingParser
+from .ast_nodes import Node
+from .tokenizer import iter_tokens
+
+# --- 结果大小的静态估计 ---
+#
+# 不做任何多项式运算，只沿 AST 传播分子 / 分母次数以及系数位数的上界，
+# 用于在求值之前拒绝或分流过大的请求，也可以帮助调用方选择算法。
+#
+# 每个子表达式 a 被看作整系数分式 N/D (不约分的形式)，记录
+#   nd, dd: N、D 的次数上界
+#   nb, db: N、D 的系数高度 (最大系数绝对值) 的 log2 上界
+# 传播规则 (H 为高度, 乘积的高度 H(pq) <= (min(deg p, deg q) + 1) * H(p) * H(q))：
+#   a +- b = (Na*Db +- Nb*Da) / (Da*Db)
+#   a * b  = (Na*Nb) / (Da*Db)
+#   a / b  = (Na*Db) / (Da*Nb)
+#   a ^ n  = Na^n / Da^n，H(p^n) <= (deg p + 1)^(n-1) * H(p)^n
+#   a @ b  = (sum Na_i Nb^i Db^(k-i)) / (sum Da_i Nb^i Db^(k-i))，k = max(nd, dd)，
+#            每一项是 k 个次数不超过 e = max(deg Nb, deg Db) 的多项式之积
+# 实际求值时每一步都会约分，约分后的结果整除上面的不约分形式，
+# 由 Mignotte 界，其本原整系数表示的系数位数不超过 b + d + log2(d+1)/2。
+
+SizeBounds = namedtuple('SizeBounds', ['numerator_degree', 'denominator_degree', 'coefficient_bits'])
+SizeBounds.__doc__ = """
+结果大小的上界。
+numerator_degree / denominator_degree: 约分后分子 / 分母的次数上界；
+coefficient_bits: 约分后分子、分母的本原整系数表示中系数的位数上界。
+无法估计时 (例如指数不是常数) 为 math.inf。
+"""
+
+# 常数子表达式的精确值只在位数不超过这个值时保留 (用于确定乘方的指数)
+_MAX_CONSTANT_BITS = 256
+
+
+class _Bound:
+    """一个子表达式的上界；value 是常数子表达式的精确值 (未知时为 None)。"""
+    __slots__ = ('nd', 'dd', 'nb', 'db', 'value')
+
+    def __init__(self, nd, dd, nb, db, value=None):
+        self.nd = nd
+        self.dd = dd
+        self.nb = nb
+        self.db = db
+        self.value = value
+
+
+_UNKNOWN = _Bound(math.inf, math.inf, math.inf, math.inf)
+
+
+def _product_bits(bits_p, deg_p, bits_q, deg_q):
+    """两个多项式乘积的系数高度的 log2 上界。"""
+    return bits_p + bits_q + math.log2(min(deg_p, deg_q) + 1)
+
+
+def _small_constant(value):
+    if value is None:
+        return None
+    if max(abs(value.numerator).bit_length(), value.denominator.bit_length()) > _MAX_CONSTANT_BITS:
+        return None
+    return value
+
+
+class BoundsEvaluator(ASTEvaluator):
+    """
+    以 _Bound 代替 FractionalPolynomial 的 "求值器"。
+
+    可以直接对 Parser.parse() 得到的 AST 调用 evaluate，
+    也可以交给 EvaluatingParser 在解析的同时计算 (见 estimate_bounds)。
+    """
+    def apply_leaf(self, poly):
+        if not poly.terms:
+            return _Bound(0, 0, 0, 0, Fraction(0))
+        common = 1
+        for coeff in poly.terms.values():
+            common = common // math.gcd(common, coeff.denominator) * coeff.denominator
+        height = max(abs(coeff.numerator) * (common // coeff.denominator) for coeff in poly.terms.values())
+        degree = max(poly.terms)
+        value = poly.terms.get(0, Fraction(0)) if degree == 0 else None
+        return _Bound(degree, 0, math.log2(height), math.log2(common), _small_constant(value))
+
+    def apply_binary(self, operator, a, b):
+        if operator == '+' or operator == '-':
+            nb = max(_product_bits(a.nb, a.nd, b.db, b.dd), _product_bits(b.nb, b.nd, a.db, a.dd)) + 1
+            value = None
+            if a.value is not None and b.value is not None:
+                value = _small_constant(a.value + b.value if operator == '+' else a.value - b.value)
+            return _Bound(max(a.nd + b.dd, b.nd + a.dd), a.dd + b.dd,
+                          nb, _product_bits(a.db, a.dd, b.db, b.dd), value)
+        if operator == '*':
+            value = None
+            if a.value is not None and b.value is not None:
+                value = _small_constant(a.value * b.value)
+            return _Bound(a.nd + b.nd, a.dd + b.dd,
+                          _product_bits(a.nb, a.nd, b.nb, b.nd), _product_bits(a.db, a.dd, b.db, b.dd), value)
+        if operator == '/':
+            value = None
+            if a.value is not None and b.value:
+                value = _small_constant(a.value / b.value)
+            return _Bound(a.nd + b.dd, a.dd + b.nd,
+                          _product_bits(a.nb, a.nd, b.db, b.dd), _product_bits(a.db, a.dd, b.nb, b.nd), value)
+        if operator == '^':
+            exponent = b.value
+            if exponent is None or exponent.denominator != 1 or exponent < 0:
+                # 指数不是可以确定的非负整数常数：无法估计 (求值时通常会报错)
+                return _UNKNOWN
+            n = int(exponent)
+            if n == 0:
+                return _Bound(0, 0, 0, 0, Fraction(1))
+            value = None
+            if a.value is not None and n * max(a.nb, a.db) <= _MAX_CONSTANT_BITS:
+                value = _small_constant(a.value ** n)
+            return _Bound(a.nd * n, a.dd * n,
+                          n * a.nb + (n - 1) * math.log2(a.nd + 1),
+                          n * a.db + (n - 1) * math.log2(a.dd + 1), value)
+        if operator == '@':
+            if a.value is not None:
+                # 常数复合任何表达式都是它本身
+                return a
+            k = max(a.nd, a.dd)
+            e = max(b.nd, b.dd)
+            # H(Nb^i Db^(k-i)) <= (e+1)^(k-1) * max(H(Nb), H(Db))^k
+            power_bits = k * max(b.nb, b.db) + (k - 1) * math.log2(e + 1)
+            # Nb^i Db^(k-i) 的次数 i*deg Nb + (k-i)*deg Db 关于 i 是线性的，最大值在 i = 0 或 i = 次数处
+            return _Bound(max(k * b.dd, a.nd * b.nd + (k - a.nd) * b.dd), max(k * b.dd, a.dd * b.nd + (k - a.dd) * b.dd),
+                          a.nb + math.log2(a.nd + 1) + power_bits,
+                          a.db + math.log2(a.dd + 1) + power_bits)
+        raise ValueError(f"未知运算符: {operator}")
+
+    def apply_unary(self, operator, operand):
+        if operator == '-':
+            value = -operand.value if operand.value is not None else None
+            return _Bound(operand.nd, operand.dd, operand.nb, operand.db, value)
+        raise ValueError(f"未知一元运算符: {operator}")
+
+
+def _finish(bound):
+    """不约分形式的上界 -> 约分后结果的 SizeBounds。"""
+    def reduced_bits(bits, degree):
+        if math.isinf(bits) or math.isinf(degree):
+            return math.inf
+        # log2(高度) 的上界 -> 位数上界
+        return math.floor(bits + degree + math.log2(degree + 1) / 2) + 1
+
+    def as_int(value):
+        return value if math.isinf(value) else int(value)
+
+    return SizeBounds(as_int(bound.nd), as_int(bound.dd),
+                      max(reduced_bits(bound.nb, bound.nd), reduced_bits(bound.db, bound.dd), 1))
+
+
+def estimate_bounds(expression) -> SizeBounds:
+    """
+    估计表达式求值结果的大小上界，不执行任何多项式运算。
+
+    expression: Parser.parse() 得到的 AST，或者表达式字符串 / 文件对象等
+                (与 iter_tokens 接受的输入相同，边解析边估计，不构建 AST)。
+    语法错误照常抛出 SyntaxError / ValueError。
+    """
+    if isinstance(expression, Node):
+        bound = BoundsEvaluator().evaluate(expression)
+    else:
+        bound = EvaluatingParser(iter_tokens(expression), evaluator=BoundsEvaluator()).parse()
+    return _finish(bound)
@@ -0,0 +1,135 @@
+# polynomial_parser/budget.py
+
+import contextvars
+import time
+
+# --- 资源预算 ---
+#
+# with Budget(max_degree=1000, timeout=0.5):
+#     parse_and_evaluate(expression)
+#
+# 预算保存在 contextvars 中，对当前线程 / 协程内的所有多项式运算生效。
+# 乘法、长除法、GCD 和乘方在循环中定期检查预算，超出时抛出 BudgetExceeded，
+# 调用方可以据此中止请求，而不必杀死整个进程。没有预算时每次运算只多一次 ContextVar 查询。
+
+_current_budget = contextvars.ContextVar('polynomial_budget', default=None)
+
+
+class BudgetExceeded(ValueError):
+    """
+    运算超出了当前预算。
+    limit: 超出的限制名称 ('max_degree'、'max_coefficient_bits'、'max_terms'、'timeout' 或 'cancelled')；
+    value: 实际 (或预计) 的值。
+    """
+    def __init__(self, limit, value, message):
+        super().__init__(message)
+        self.limit = limit
+        self.value = value
+
+    def __reduce__(self):
+        # 可以在进程之间传递 (例如进程池中抛出的异常)
+        return (BudgetExceeded, (self.limit, self.value, str(self)))
+
+
+class Budget:
+    """
+    多项式运算的资源预算，作为上下文管理器使用。
+
+    max_degree: 任何中间结果允许的最高次数。
+    max_coefficient_bits: 系数分子 / 分母允许的最大位数。
+    max_terms: 单个多项式允许的最多非零项数。
+    timeout: 从进入上下文开始计算的时间限制 (秒)。
+    cancel_event: 可选的取消标志 (有 is_set() 方法的对象，例如 threading.Event 或 Manager().Event())，
+                  被设置后运算在下一次检查时间时中止。
+    为 None 的限制不检查。嵌套使用时，内层的实际限制是内外两层中较严格的一个
+    (with 语句得到的就是合并后实际生效的 Budget)。
+    每次进入上下文都生成一个新的生效对象 (截止时间、恢复用的 token 都保存在其中)，
+    因此同一个 Budget 对象可以被多个线程 / 协程同时使用，也可以重复使用。
+    """
+    # 取消标志可能是跨进程的代理对象，最多每隔这么多秒查询一次
+    CANCEL_CHECK_INTERVAL = 0.01
+
+    def __init__(self, max_degree=None, max_coefficient_bits=None, max_terms=None, timeout=None,
+                 cancel_event=None):
+        self.max_degree = max_degree
+        self.max_coefficient_bits = max_coefficient_bits
+        self.max_terms = max_terms
+        self.timeout = timeout
+        self.cancel_event = cancel_event
+        self.deadline = None # 生效对象的截止时间，进入上下文时确定 (time.monotonic() 时间)
+        self._next_cancel_check = 0.0
+        self._token = None # 生效对象对应的 ContextVar token，退出时用于恢复外层预算
+
+    def __enter__(self):
+        outer = _current_budget.get()
+        deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+        if outer is None:
+            effective = Budget(self.max_degree, self.max_coefficient_bits, self.max_terms, self.timeout,
+                               self.cancel_event)
+        else:
+            # 与外层预算合并
+            effective = Budget(_tighter(self.max_degree, outer.max_degree),
+                               _tighter(self.max_coefficient_bits, outer.max_coefficient_bits),
+                               _tighter(self.max_terms, outer.max_terms),
+                               self.timeout if self.timeout is not None else outer.timeout,
+                               self.cancel_event if self.cancel_event is not None else outer.cancel_event)
+            deadline = _tighter(deadline, outer.deadline)
+        effective.deadline = deadline
+        effective._token = _current_budget.set(effective)
+        return effective
+
+    def __exit__(self, *exc_info):
+        # with 语句按后进先出的顺序退出，当前上下文 (线程 / 协程) 中生效的就是这次进入时设置的对象
+        _current_budget.reset(_current_budget.get()._token)
+
+    def remaining(self):
+        """距离截止时间的剩余秒数；没有时间限制时返回 None。"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    # --- 检查 ---
+
+    def check_time(self):
+        if self.deadline is None and self.cancel_event is None:
+            return
+        now = time.monotonic()
+        if self.deadline is not None and now > self.deadline:
+            raise BudgetExceeded('timeout', self.timeout, f"运算超过时间限制 ({self.timeout} 秒)")
+        if self.cancel_event is not None and now >= self._next_cancel_check:
+            self._next_cancel_check = now + self.CANCEL_CHECK_INTERVAL
+            if self.cancel_event.is_set():
+                raise BudgetExceeded('cancelled', None, "运算已被取消")
+
+    def check_degree(self, degree):
+        """在计算之前检查 (预计的) 结果次数。"""
+        if self.max_degree is not None and degree > self.max_degree:
+            raise BudgetExceeded('max_degree', degree, f"多项式次数 {degree} 超过限制 {self.max_degree}")
+
+    def check_polynomial(self, poly):
+        """检查一个已经算出的多项式，同时检查时间。"""
+        terms = poly.terms
+        if terms:
+            if self.max_degree is not None:
+                self.check_degree(max(terms))
+            if self.max_terms is not None and len(terms) > self.max_terms:
+                raise BudgetExceeded('max_terms', len(terms), f"多项式项数 {len(terms)} 超过限制 {self.max_terms}")
+            if self.max_coefficient_bits is not None:
+                bits = max(max(abs(c.numerator).bit_length(), c.denominator.bit_length()) for c in terms.values())
+                if bits > self.max_coefficient_bits:
+                    raise BudgetExceeded('max_coefficient_bits', bits,
+                                         f"系数位数 {bits} 超过限制 {self.max_coefficient_bits}")
+        self.check_time()
+
+
+def _tighter(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return min(a, b)
+
+
+def current_budget():
+    """返回当前生效的 Budget，没有时返回 None。"""
+    return _current_budget.get()
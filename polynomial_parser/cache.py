@@ -0,0 +1,139 @@
+# polynomial_parser/cache.py
+
+import threading
+from collections import OrderedDict, namedtuple
+
+from .tokenizer import TOKEN_TYPE_EOF
+
+# --- 表达式结果缓存 ---
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize', 'hit_rate', 'disk_hits'])
+
+
+def canonical_key(tokens):
+    """
+    根据 token 序列生成表达式的规范形式，作为缓存键。
+
+    空白在词法分析时已经去掉，隐式乘法 token 的值就是 '*'，
+    因此 '2x(x+1)' 和 '2 * x * (x + 1)' 得到同一个键 '2 * x * ( x + 1 )'。
+    token 之间用空格分隔 (空格不会出现在 token 内部)，保留 token 的边界：
+    分数 token '2/3' 与 '2', '/', '3' 三个 token 的键不同，'23' 与 '2 3' 的键也不同。
+    """
+    return ' '.join([token.value for token in tokens if token.type != TOKEN_TYPE_EOF])
+
+
+class ExpressionCache:
+    """
+    进程内 LRU 缓存：规范表达式 -> FractionalPolynomial。
+
+    写入和读取时都会复制结果，调用方拿到的对象互不共享，可以放心修改。
+    所有操作都在锁内完成，可以在多线程中共享同一个缓存。
+    可选的 disk (DiskCache) 作为第二级缓存：内存未命中时查询磁盘，写入时两级都写。
+    """
+    def __init__(self, maxsize=1024, max_key_length=1 << 16, disk=None):
+        """
+        maxsize: 最多缓存的表达式数量，0 表示禁用内存缓存。
+        max_key_length: 超过这个长度的表达式不进入缓存 (避免巨大的键常驻内存)。
+        disk: 可选的 DiskCache。
+        """
+        if maxsize < 0:
+            raise ValueError("缓存大小不能为负数")
+        self.maxsize = maxsize
+        self.max_key_length = max_key_length
+        self.disk = disk
+        self.hits = 0
+        self.disk_hits = 0 # hits 中来自磁盘缓存的次数
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def accepts(self, expression_str):
+        """判断这个长度的表达式是否值得缓存。"""
+        return (self.maxsize > 0 or self.disk is not None) and len(expression_str) <= self.max_key_length
+
+    def get(self, key):
+        """命中时返回结果的副本并把它标记为最近使用；未命中返回 None。"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value.copy()
+
+        value = self.disk.get(key) if self.disk is not None else None
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+        # 磁盘上的结果提升到内存缓存；decode 出的对象是新建的，可以直接返回
+        self._store(key, value.copy())
+        return value
+
+    def put(self, key, value):
+        """保存结果的副本，超过容量时淘汰最久未使用的项。"""
+        if self.disk is not None:
+            self.disk.put(key, value)
+        self._store(key, value.copy())
+
+    def preload(self, key, value):
+        """只把结果的副本放入内存缓存 (不写磁盘)，用于预热。"""
+        self._store(key, value.copy())
+
+    def _store(self, key, value):
+        """把 value 放入内存缓存 (不复制)。"""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """清空缓存并重置统计。"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+
+    @property
+    def hit_rate(self):
+        """命中率 (0.0 ~ 1.0)；还没有任何查询时为 0.0。"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def info(self):
+        """返回 CacheInfo(hits, misses, maxsize, currsize, hit_rate, disk_hits)。"""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries), self.hit_rate, self.disk_hits)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# parse_and_evaluate 默认使用的缓存
+_default_cache = ExpressionCache()
+
+
+def get_cache():
+    """返回 parse_and_evaluate 使用的缓存。"""
+    return _default_cache
+
+
+def configure_cache(maxsize=1024, max_key_length=1 << 16, disk_path=None, disk_max_bytes=64 * 1024 * 1024):
+    """
+    替换 parse_and_evaluate 使用的缓存并返回新缓存。
+    maxsize=0 表示禁用内存缓存。
+    disk_path: 给出时在该路径启用 SQLite 持久化缓存，多个进程可以共享同一个文件。
+    disk_max_bytes: 磁盘缓存的大小上限。
+    """
+    global _default_cache
+    disk = None
+    if disk_path is not None:
+        from .disk_cache import DiskCache
+        disk = DiskCache(disk_path, max_bytes=disk_max_bytes)
+    _default_cache = ExpressionCache(maxsize, max_key_length, disk)
+    return _default_cache
@@ -0,0 +1,151 @@
+# polynomial_parser/cli.py
+# 非交互式批处理命令行：poly-solve [文件] --jobs N --order input|completion
+
+import argparse
+import contextlib
+import json
+import sys
+import time
+
+from .batch import _map_chunks, _resolve_workers
+
+# --- 批处理命令行 ---
+
+DEFAULT_CHUNKSIZE = 64
+
+
+def _read_records(stream):
+    """逐行读取输入，跳过空行；不会一次读入整个文件。"""
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield line
+
+
+def _parse_record(line):
+    """
+    一行输入 -> (表达式, id)。
+    以 '{' 开头的行按 JSON 解析，表达式取 "expression" 字段，可选的 "id" 原样输出；
+    其他行整行都是表达式。
+    """
+    if not line.startswith('{'):
+        return line, None
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"无效的 JSON 输入: {e}")
+    if not isinstance(record, dict) or not isinstance(record.get('expression'), str):
+        raise ValueError("JSON 输入必须包含字符串字段 \"expression\"")
+    return record['expression'], record.get('id')
+
+
+def _solve(expression, decompose):
+    """对单个表达式运行完整流程，返回输出记录中的结果字段。"""
+    from . import _evaluate_keyed, _decomposition_of
+
+    result, key = _evaluate_keyed(expression, True)
+    output = {
+        'simplified': str(result),
+        'single_fraction': result.to_single_fraction_str(),
+        'partial_fractions': None,
+    }
+    if decompose:
+        from .formatting import format_decomposed_terms
+        output['partial_fractions'] = format_decomposed_terms(_decomposition_of(result, key), 'x')
+    return output
+
+
+def _use_disk_cache(disk_path):
+    """在当前进程 (包括工作进程) 中启用 disk_path 处的持久化缓存，已经启用时不做任何事。"""
+    from . import configure_cache, get_cache
+    disk = get_cache().disk
+    if disk is None or disk.path != disk_path:
+        configure_cache(disk_path=disk_path)
+
+
+def _process_chunk(start, lines, decompose, disk_path=None):
+    """
+    处理一块输入行 (也是工作进程执行的函数)，返回 (编码好的 JSONL 行, 失败数量)。
+    处理过程中的警告输出被重定向到 stderr，不会混入 JSONL 结果。
+    disk_path: 可选的 SQLite 持久化缓存路径 (结果和裂项结果都会缓存)。
+    """
+    if disk_path is not None:
+        _use_disk_cache(disk_path)
+    out = []
+    failures = 0
+    with contextlib.redirect_stdout(sys.stderr):
+        for offset, line in enumerate(lines):
+            record = {'index': start + offset}
+            begin = time.perf_counter()
+            try:
+                expression, record_id = _parse_record(line)
+                if record_id is not None:
+                    record['id'] = record_id
+                record['expression'] = expression
+                record.update(_solve(expression, decompose))
+            except Exception as e:
+                # 除了解析错误，裂项 (SymPy) 也可能抛出其他异常；一个表达式失败不影响其余输入
+                record.setdefault('expression', line)
+                record['error'] = {'type': type(e).__name__, 'message': str(e)}
+                failures += 1
+            record['time_ms'] = round((time.perf_counter() - begin) * 1000, 3)
+            out.append(json.dumps(record, ensure_ascii=False))
+    return out, failures
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(
+        prog='poly-solve',
+        description='批量化简多项式 / 分式多项式表达式，每行输出一个 JSON 结果。')
+    parser.add_argument('input', nargs='?', default='-',
+                        help="输入文件，每行一个表达式或一个含 \"expression\" 字段的 JSON 对象；默认或 '-' 读取标准输入")
+    parser.add_argument('-o', '--output', default='-',
+                        help="输出文件，默认或 '-' 写到标准输出")
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='工作进程数，0 表示使用全部 CPU 核 (默认 1)')
+    parser.add_argument('--order', choices=('input', 'completion'), default='input',
+                        help='输出顺序：input 与输入一致，completion 按完成先后 (默认 input)')
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE,
+                        help=f'每次交给工作进程的表达式数量 (默认 {DEFAULT_CHUNKSIZE})')
+    parser.add_argument('--no-decompose', action='store_true',
+                        help='不计算裂项结果 (partial_fractions 输出为 null)')
+    parser.add_argument('--disk-cache', default=None,
+                        help='可选的 SQLite 持久化缓存路径，结果和裂项结果在多次运行之间复用')
+    return parser
+
+
+def main(argv=None):
+    """命令行入口，返回退出码：全部成功为 0，存在失败的表达式为 1。"""
+    args = build_arg_parser().parse_args(argv)
+    if args.jobs < 0:
+        print("poly-solve: --jobs 不能为负数", file=sys.stderr)
+        return 2
+    if args.chunksize < 1:
+        print("poly-solve: --chunksize 必须是正整数", file=sys.stderr)
+        return 2
+    workers = _resolve_workers(args.jobs or None)
+
+    with contextlib.ExitStack() as stack:
+        if args.input == '-':
+            source = sys.stdin
+        else:
+            source = stack.enter_context(open(args.input, encoding='utf-8'))
+        if args.output == '-':
+            sink = sys.stdout
+        else:
+            sink = stack.enter_context(open(args.output, 'w', encoding='utf-8'))
+
+        failures = 0
+        chunks = _map_chunks(_process_chunk, (not args.no_decompose, args.disk_cache), _read_records(source),
+                             workers, args.chunksize, ordered=args.order == 'input')
+        for lines, chunk_failures in chunks:
+            failures += chunk_failures
+            for line in lines:
+                sink.write(line)
+                sink.write('\n')
+            sink.flush()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+# polynomial_parser/composition.py
+
+from fractions import Fraction
+
+from .budget import current_budget
+from .polynomial import Polynomial
+
+# --- Taylor 平移与多项式复合 ---
+#
+# taylor_shift(poly, a) 计算 poly(x + a)。a = p/q 时先把变量放缩：
+#   q^n f(x + p/q) = q^n g(y + 1)，g(y) = f(p y / q)，y = q x / p
+# g 的系数 f_i p^i q^(n-i) 是整数，g(y + 1) 与 real_roots 中的 Taylor 平移相同，
+# 每一轮是一次前缀和 (itertools.accumulate 在 C 层完成)；最后 y^k 的系数乘以 (q/p)^k，
+# 其中除以 p^k 总是整除。
+#
+# compose(p, q) 计算 p(q(x))，compose_homogeneous(f, num, den, k) 计算 den^k f(num/den)
+# (分式的复合 FractionalPolynomial.compose 使用)。都先化成整系数：
+#   sum f_i num^i den^(n-i)
+# 分治：f = lo + x^m hi (m 为 2 的幂)，
+#   sum = den^(len - m) * [lo 部分] + num^m * [hi 部分]
+# num、den 的幂只计算一次；乘法用 Kronecker 代换 (一次大整数乘法)。
+# num、den 的次数很低时 Horner 法则逐次乘以 num 更快 (乘积的一方很短，逐行相乘即可)。
+
+# num / den 的次数低于这个值时用 Horner 法则，否则分治
+_HORNER_MAX_DEGREE = 12
+# 分治到这个长度以下改用 Horner 法则
+_HORNER_MAX_LENGTH = 4
+
+
+def _horner(f, num, den):
+    """sum f_i num^i den^(n-i)，den 为 None 时即 f(num)。"""
+    from .int_poly import addp, exact_mul
+    result = [f[-1]]
+    den_power = [1]
+    for c in reversed(f[:-1]):
+        result = exact_mul(result, num)
+        if den is None:
+            if result:
+                result[0] += c
+            else:
+                result = [c]
+        else:
+            den_power = exact_mul(den_power, den)
+            if c:
+                result = addp(result, [c * value for value in den_power])
+    return result
+
+
+def _compose_integer(f, num, den=None):
+    """sum f_i num^i den^(n-i) (n = len(f) - 1)，整数列表 (低次在前)；den 为 None 时即 f(num)。"""
+    from .int_poly import addp, exact_mul, trim
+    degree = max(len(num), len(den) if den is not None else 0) - 1
+    if degree < _HORNER_MAX_DEGREE:
+        return trim(_horner(f, num, den))
+
+    powers = {}
+
+    def power(base, exponent, key):
+        # base^exponent，按 (key, exponent) 缓存；平方求幂的中间结果也都缓存下来
+        cached = powers.get((key, exponent))
+        if cached is None:
+            if exponent == 1:
+                cached = base
+            else:
+                half = power(base, exponent // 2, key)
+                cached = exact_mul(half, half)
+                if exponent % 2:
+                    cached = exact_mul(cached, base)
+            powers[(key, exponent)] = cached
+        return cached
+
+    def combine(f):
+        if len(f) <= _HORNER_MAX_LENGTH:
+            return _horner(f, num, den)
+        m = 1 << ((len(f) - 1).bit_length() - 1)
+        low = combine(f[:m])
+        if den is not None:
+            low = exact_mul(low, power(den, len(f) - m, 'den'))
+        return addp(low, exact_mul(power(num, m, 'num'), combine(f[m:])))
+
+    return trim(combine(f))
+
+
+def taylor_shift(poly, a):
+    """poly(x + a)，a 为 int 或 Fraction。"""
+    from .int_poly import taylor_shift_one, to_integer_list
+    a = Fraction(a)
+    if poly.is_constant() or a == 0:
+        return poly.copy()
+    content, f = to_integer_list(poly)
+    p, q = a.numerator, a.denominator
+    n = len(f) - 1
+    scaled = []
+    p_power = 1
+    q_power = q ** n
+    for c in f:
+        scaled.append(c * p_power * q_power)
+        p_power *= p
+        q_power //= q
+    shifted = taylor_shift_one(scaled)
+    terms = {}
+    p_power = 1
+    q_power = q ** n
+    for k, c in enumerate(shifted):
+        # y^k 的系数 c 对应 x^k 的系数 c * (q/p)^k / q^n
+        if c:
+            terms[k] = content * Fraction(c // p_power, q_power)
+        p_power *= p
+        q_power //= q
+    return Polynomial._from_terms(terms)
+
+
+def compose_homogeneous(f, num, den, k):
+    """
+    den^k * f(num/den)，k 不小于 f 的次数；num、den 为 Polynomial，den 不是零多项式。
+    den 为常数 1 时就是 f(num)。
+    """
+    from .int_poly import exact_mul, from_integer_list, integer_combination, to_integer_list
+    if den.is_zero():
+        raise ValueError("分母不能是零多项式")
+    if k < f.degree():
+        raise ValueError("齐次化的次数不能小于多项式的次数")
+    budget = current_budget()
+    if budget is not None:
+        # 结果的次数不超过 k * max(deg num, deg den)，在计算之前拒绝过大的复合
+        budget.check_degree(k * max(num.degree(), den.degree(), 0))
+    if f.is_zero():
+        return Polynomial()
+    if num.is_zero() or f.is_constant():
+        # 只剩常数项：f(0) * den^k
+        return den.power(k) * f.terms.get(0, Fraction(0))
+    n = f.degree()
+    f_content, f_int = to_integer_list(f)
+    den_content, den_int = to_integer_list(den)
+    num_content, num_int = to_integer_list(num)
+    # f_i (cn N)^i (cd D)^(n-i)：把常数因子 cn^i cd^(n-i) 并入 f 的系数
+    scaled = []
+    num_power = Fraction(1)
+    den_power = den_content ** n
+    for c in f_int:
+        scaled.append(c * num_power * den_power)
+        num_power *= num_content
+        den_power /= den_content
+    common, scaled = integer_combination(scaled)
+    if len(den_int) == 1:
+        # den 的本原部分是 1
+        result = _compose_integer(scaled, num_int)
+    else:
+        result = _compose_integer(scaled, num_int, den_int)
+        if k > n:
+            extra = [1]
+            for _ in range(k - n):
+                extra = exact_mul(extra, den_int)
+            result = exact_mul(result, extra)
+    factor = f_content * den_content ** (k - n) / common
+    poly = from_integer_list(result)
+    return poly * factor if factor != 1 else poly
+
+
+def compose(p, q):
+    """p(q(x))。"""
+    return compose_homogeneous(p, q, Polynomial({0: 1}), max(p.degree(), 0))
@@ -0,0 +1,224 @@
+# polynomial_parser/disk_cache.py
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+from .polynomial import Polynomial
+from .fractional_polynomial import FractionalPolynomial
+from . import serialization
+
+# --- 持久化结果缓存 (SQLite) ---
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key BLOB PRIMARY KEY,           -- 规范表达式的 SHA-256
+    result BLOB NOT NULL,           -- 序列化的 FractionalPolynomial
+    decomposition BLOB,             -- 序列化的裂项结果，可能为空
+    size INTEGER NOT NULL,          -- result + decomposition 的字节数
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+CREATE TABLE IF NOT EXISTS stats (id INTEGER PRIMARY KEY CHECK (id = 0), total_size INTEGER NOT NULL);
+INSERT OR IGNORE INTO stats (id, total_size) VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+    UPDATE stats SET total_size = total_size + NEW.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+    UPDATE stats SET total_size = total_size - OLD.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size ON entries BEGIN
+    UPDATE stats SET total_size = total_size - OLD.size + NEW.size WHERE id = 0;
+END;
+"""
+
+
+# 缓存键格式的版本，参与哈希：canonical_key 的格式改变时加一，旧格式的项不再被命中 (最终被淘汰)
+KEY_FORMAT_VERSION = 2
+
+
+def _hash_key(key):
+    """缓存键 (规范表达式) -> 定长的 SHA-256 摘要。"""
+    return hashlib.sha256(f"{KEY_FORMAT_VERSION}:{key}".encode('utf-8')).digest()
+
+
+def encode_result(frac_poly):
+    """FractionalPolynomial -> bytes。"""
+    return serialization.dumps(frac_poly)
+
+
+def decode_result(blob):
+    """encode_result 的逆操作。存储的分式已经是最简形式，不再约分。"""
+    return serialization.loads(blob)
+
+
+def encode_decomposition(terms):
+    """
+    裂项结果 (Polynomial / FractionalPolynomial 列表) -> bytes。
+    如果其中包含无法转换的 SymPy 表达式，返回 None (不缓存)。
+    """
+    if not all(isinstance(term, (Polynomial, FractionalPolynomial)) for term in terms):
+        return None
+    return serialization.dumps(list(terms))
+
+
+def decode_decomposition(blob):
+    """encode_decomposition 的逆操作。"""
+    return serialization.loads(blob)
+
+
+class DiskCache:
+    """
+    基于 SQLite 的持久化缓存：规范表达式的哈希 -> 序列化的结果和裂项结果。
+
+    - 数据库使用 WAL 模式，多个进程 / 线程可以同时读取，写入互相排队；
+    - 每个线程、每个进程 (fork 之后) 使用自己的连接；
+    - 总大小超过 max_bytes 时，按最近访问时间淘汰到 max_bytes 的 90% 以下。
+    """
+    # 读取时最多每隔这么多秒刷新一次 last_access，避免每次读取都写数据库
+    TOUCH_INTERVAL = 1.0
+
+    def __init__(self, path, max_bytes=64 * 1024 * 1024, timeout=30.0):
+        self.path = os.fspath(path)
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._local = threading.local()
+        # 在构造时建表，提前暴露路径或权限错误
+        self._connection()
+
+    def _connection(self):
+        """返回当前线程 (当前进程) 的连接，必要时新建。"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _lookup(self, key, column):
+        digest = _hash_key(key)
+        conn = self._connection()
+        row = conn.execute(f"SELECT {column}, last_access FROM entries WHERE key = ?", (digest,)).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        if now - row[1] > self.TOUCH_INTERVAL:
+            try:
+                conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, digest))
+            except sqlite3.OperationalError:
+                pass # 数据库正忙时放弃刷新访问时间，不影响读取
+        return row[0]
+
+    def get(self, key):
+        """返回缓存的 FractionalPolynomial，未命中返回 None。"""
+        blob = self._lookup(key, 'result')
+        if blob is None:
+            return None
+        try:
+            return decode_result(blob)
+        except ValueError:
+            return None # 旧版本格式或损坏的数据视为未命中，之后的 put 会覆盖
+
+    def get_decomposition(self, key):
+        """返回缓存的裂项结果列表，未命中 (或未保存裂项结果) 返回 None。"""
+        blob = self._lookup(key, 'decomposition')
+        if blob is None:
+            return None
+        try:
+            return decode_decomposition(blob)
+        except ValueError:
+            return None
+
+    def put(self, key, frac_poly, decomposition=None):
+        """
+        保存结果；decomposition 为裂项结果列表 (可选)。
+        已存在的项只在提供了新的裂项结果时才会更新裂项列。
+        """
+        result_blob = encode_result(frac_poly)
+        decomposition_blob = encode_decomposition(decomposition) if decomposition is not None else None
+        size = len(result_blob) + (len(decomposition_blob) if decomposition_blob is not None else 0)
+        conn = self._connection()
+        conn.execute(
+            "INSERT INTO entries (key, result, decomposition, size, last_access) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET "
+            "result = excluded.result, "
+            "decomposition = COALESCE(excluded.decomposition, entries.decomposition), "
+            "size = length(excluded.result) + COALESCE(length(COALESCE(excluded.decomposition, entries.decomposition)), 0), "
+            "last_access = excluded.last_access",
+            (_hash_key(key), result_blob, decomposition_blob, size, time.time()),
+        )
+        if self.total_size() > self.max_bytes:
+            self._evict()
+
+    def _evict(self):
+        """按最近访问时间淘汰，直到总大小降到 max_bytes 的 90% 以下。"""
+        target = int(self.max_bytes * 0.9)
+        conn = self._connection()
+        excess = self.total_size() - target
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY last_access"):
+            if excess <= 0:
+                break
+            victims.append((key,))
+            excess -= size
+        conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+
+    def total_size(self):
+        """当前缓存内容的总字节数。"""
+        return self._connection().execute("SELECT total_size FROM stats WHERE id = 0").fetchone()[0]
+
+    def __len__(self):
+        return self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def clear(self):
+        """删除所有缓存项。"""
+        self._connection().execute("DELETE FROM entries")
+
+    def close(self):
+        """关闭当前线程的连接。"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def warm_up(self, expressions, decompose=False, memory_cache=None):
+        """
+        预先计算并保存一批表达式的结果。
+
+        expressions: 表达式字符串的可迭代对象。
+        decompose: 为 True 时同时计算并保存裂项结果。
+        memory_cache: 可选的 ExpressionCache，结果会同时放入其中。
+        无法解析的表达式会被跳过。返回新计算的表达式数量。
+        """
+        from .cache import canonical_key
+        from .evaluator import EvaluatingParser
+        from .tokenizer import tokenize
+
+        computed = 0
+        for expression in expressions:
+            try:
+                tokens = tokenize(expression)
+            except ValueError:
+                continue
+            key = canonical_key(tokens)
+            result = self.get(key)
+            has_decomposition = not decompose or self.get_decomposition(key) is not None
+            if result is None or not has_decomposition:
+                try:
+                    result = EvaluatingParser(tokens).parse()
+                except (ValueError, SyntaxError, TypeError, ZeroDivisionError):
+                    continue
+                decomposition = None
+                if decompose:
+                    from .partial_fraction import partial_fraction_decompose
+                    decomposition = partial_fraction_decompose(result)
+                self.put(key, result, decomposition)
+                computed += 1
+            if memory_cache is not None:
+                memory_cache.preload(key, result)
+        return computed
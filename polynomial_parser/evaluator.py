@@ -1,45 +1,124 @@
+import operator
+from fractions import Fraction
 from .ast_nodes import Node, PolynomialNode, BinOpNode, UnaryOpNode
 from .fractional_polynomial import FractionalPolynomial
-from .polynomial import Polynomial 
+from .parser import Parser
+from .polynomial import Polynomial
+
+
+def _power(base: FractionalPolynomial, exponent: FractionalPolynomial):
+    """base ^ exponent，指数必须是非负整数常数。"""
+    exponent_value = exponent.numerator.terms.get(0, Fraction(0))
+    if not (exponent.numerator.is_constant() and exponent.denominator.is_constant()
+            and exponent_value.denominator == 1):
+        raise ValueError(f"指数必须是整数常数，但得到 {exponent}")
+    if exponent_value < 0:
+        raise ValueError("指数不能为负数")
+    return base.power(int(exponent_value))
+
+
+# 二元运算符 -> 求值函数；与 parser.INFIX_OPERATORS 中的 AST 运算符对应
+BINARY_OPERATIONS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '^': _power,
+    '@': FractionalPolynomial.compose,
+}
+
+_ONE = Polynomial({0: 1})
 
 # --- AST Evaluator 类 ---
 
 class ASTEvaluator:
     """遍历 AST 并求值。"""
     def evaluate(self, node: Node):
-        """根据节点类型递归求值。"""
-        if isinstance(node, PolynomialNode):
-            return FractionalPolynomial(node.poly, Polynomial({0: 1}))
-
-        elif isinstance(node, BinOpNode):
-            left_val = self.evaluate(node.left)
-            right_val = self.evaluate(node.right)
-
-            # 左右子节点的值应该是 FractionalPolynomial 对象
-            if not isinstance(left_val, FractionalPolynomial) or not isinstance(right_val, FractionalPolynomial):
-                 raise TypeError("二元运算符的操作数必须是 FractionalPolynomial")
-
-            if node.operator == '+':
-                return left_val + right_val
-            elif node.operator == '-':
-                return left_val - right_val
-            elif node.operator == '*':
-                return left_val * right_val
-            elif node.operator == '/':
-                return left_val / right_val
-            else:
-                raise ValueError(f"未知运算符: {node.operator}")
+        """
+        按后序遍历对 AST 求值。
 
-        elif isinstance(node, UnaryOpNode):
-            operand_val = self.evaluate(node.operand)
+        使用显式栈而不是递归，深度很大的 AST (例如很长的一元负号链或
+        很长的左结合加法链) 不会触发 Python 的递归深度限制。
+        """
+        pending = [(node, False)] # (节点, 子节点是否已经求值)
+        values = []
 
-            if not isinstance(operand_val, FractionalPolynomial):
-                 raise TypeError("一元运算符的操作数必须是 FractionalPolynomial")
+        while pending:
+            current, children_done = pending.pop()
+
+            if isinstance(current, PolynomialNode):
+                values.append(self.apply_leaf(current.poly))
+
+            elif isinstance(current, BinOpNode):
+                if children_done:
+                    right_val = values.pop()
+                    left_val = values.pop()
+                    values.append(self.apply_binary(current.operator, left_val, right_val))
+                else:
+                    # 先压入父节点，再压入右、左子节点，保证左子树先求值
+                    pending.append((current, True))
+                    pending.append((current.right, False))
+                    pending.append((current.left, False))
+
+            elif isinstance(current, UnaryOpNode):
+                if children_done:
+                    values.append(self.apply_unary(current.operator, values.pop()))
+                else:
+                    pending.append((current, True))
+                    pending.append((current.operand, False))
 
-            if node.operator == '-':
-                return FractionalPolynomial(operand_val.numerator * -1, operand_val.denominator)
             else:
-                raise ValueError(f"未知一元运算符: {node.operator}")
+                raise TypeError(f"无法识别的 AST 节点类型: {type(current)}")
+
+        return values[0]
+
+    def apply_leaf(self, poly: Polynomial):
+        """将叶子节点的多项式转换为 FractionalPolynomial。"""
+        # 分母为 1 的分式已经是最简形式
+        return FractionalPolynomial._from_reduced(poly, _ONE)
 
+    def apply_binary(self, operator, left_val, right_val):
+        """对两个已求值的操作数应用二元运算符。"""
+        # 左右子节点的值应该是 FractionalPolynomial 对象
+        if not isinstance(left_val, FractionalPolynomial) or not isinstance(right_val, FractionalPolynomial):
+             raise TypeError("二元运算符的操作数必须是 FractionalPolynomial")
+
+        operation = BINARY_OPERATIONS.get(operator)
+        if operation is None:
+            raise ValueError(f"未知运算符: {operator}")
+        return operation(left_val, right_val)
+
+    def apply_unary(self, operator, operand_val):
+        """对已求值的操作数应用一元运算符。"""
+        if not isinstance(operand_val, FractionalPolynomial):
+             raise TypeError("一元运算符的操作数必须是 FractionalPolynomial")
+
+        if operator == '-':
+            # 最简分式取负后仍是最简分式，无需再次计算 GCD
+            return FractionalPolynomial._from_reduced(-operand_val.numerator, operand_val.denominator)
         else:
-            raise TypeError(f"无法识别的 AST 节点类型: {type(node)}")
+            raise ValueError(f"未知一元运算符: {operator}")
+
+
+# --- 边解析边求值 ---
+
+class EvaluatingParser(Parser):
+    """
+    在解析的同时直接求值的解析器。
+
+    与先构建 AST 再调用 ASTEvaluator 的结果相同，但不保留 AST：
+    配合 iter_tokens 的 token 流使用时，内存只与括号嵌套深度和结果大小有关，
+    与输入长度无关。parse() 返回 FractionalPolynomial。
+    """
+    def __init__(self, tokens, evaluator=None):
+        super().__init__(tokens)
+        self.evaluator = evaluator if evaluator is not None else ASTEvaluator()
+
+    def make_leaf(self, poly):
+        return self.evaluator.apply_leaf(poly)
+
+    def make_binary(self, operator, left, right):
+        return self.evaluator.apply_binary(operator, left, right)
+
+    def make_unary(self, operator, operand):
+        return self.evaluator.apply_unary(operator, operand)
@@ -0,0 +1,313 @@
+# polynomial_parser/factorization.py
+
+import math
+import random
+from itertools import combinations
+
+from .polynomial import Polynomial
+from .budget import current_budget
+from .int_poly import (addp, derivative_mod, divmod_mod, exact_division, from_integer_list, gcd_mod, gcdex_mod,
+                       is_square_free, monic_mod, mul_mod, primitive, reduce, rem_mod, sub_mod, symmetric,
+                       to_integer_list, trim)
+
+# --- 有理数域上的因式分解 (Zassenhaus) ---
+#
+# factor(poly) 把多项式分解为 content * prod(f^e)，f 为本原整系数的不可约多项式：
+#   1. 提取 content 与 x 的幂；模一个素数检查是否无平方因子，否则先做无平方分解 (Yun)
+#   2. x^n - 1 与 x^n + 1 直接写成分圆多项式之积；
+#      其余无平方因子的部分，选择几个不整除主项系数、且模 p 后仍无平方因子的小素数，
+#      用 Cantor-Zassenhaus (按次数分解 + 等次数分裂) 模 p 分解，保留因子个数最少的素数
+#   3. 多因子 Hensel 提升 (二叉树上的二次提升) 到 p^(2^j) > 2 * lc * Mignotte 界
+#   4. 组合：按子集大小从小到大尝试模 p^(2^j) 因子的乘积，整除原多项式的就是真正的因子
+#
+# 多项式用整数列表表示 (低次在前)，模运算与整数上的基本运算见 int_poly 模块。
+
+# 尝试的素数个数 (取模 p 因子个数最少的一个，减少组合阶段的子集数量)
+_PRIME_TRIALS = 5
+
+_rng = random.Random(0x5eed)
+
+
+# --- 模 p 分解 (Cantor-Zassenhaus) ---
+
+def _frobenius_matrix(f, p):
+    """
+    Frobenius 映射 h -> h^p mod f 的矩阵 (第 i 行为 x^(i*p) mod f)，它在 F_p 上是线性的，
+    因此 h^p 可以在 O(n^2) 内由行的线性组合得到，不必做快速幂。
+    每一行打包为一个大整数 (Kronecker 代换)，线性组合变成 n 次大整数乘加。
+    返回 (打包的行, 每个系数占用的字节数, n)。
+    """
+    n = len(f) - 1
+    x_p = _power_mod([0, 1], p, f, p)
+    slot = (2 * p.bit_length() + n.bit_length() + 7) // 8
+    rows = []
+    row = [1]
+    for i in range(n):
+        if i:
+            row = rem_mod(mul_mod(row, x_p, p), f, p)
+        rows.append(int.from_bytes(b''.join(c.to_bytes(slot, 'little') for c in row), 'little'))
+    return rows, slot, n
+
+
+def _apply_frobenius(h, matrix, p):
+    """h^p mod f (系数域 F_p 上 h(x)^p = h(x^p))。"""
+    rows, slot, n = matrix
+    total = 0
+    for i, coeff in enumerate(h):
+        if coeff:
+            total += coeff * rows[i]
+    data = total.to_bytes(slot * n, 'little')
+    return trim([int.from_bytes(data[j * slot:(j + 1) * slot], 'little') % p for j in range(n)])
+
+
+def _power_mod(base, exponent, f, p):
+    result = [1]
+    base = rem_mod(base, f, p)
+    while exponent:
+        if exponent & 1:
+            result = rem_mod(mul_mod(result, base, p), f, p)
+        exponent >>= 1
+        if exponent:
+            base = rem_mod(mul_mod(base, base, p), f, p)
+    return result
+
+
+def _distinct_degree(f, frobenius, p):
+    """按次数分解：返回 [(g, d), ...]，g 是 f 中所有 d 次不可约因子之积。"""
+    result = []
+    remaining = f
+    h = [0, 1]
+    d = 0
+    budget = current_budget()
+    while 2 * (d + 1) <= len(remaining) - 1:
+        if budget is not None:
+            budget.check_time()
+        d += 1
+        h = _apply_frobenius(h, frobenius, p)  # x^(p^d) mod f
+        g = gcd_mod(remaining, sub_mod(rem_mod(h, remaining, p), [0, 1], p), p)
+        if len(g) > 1:
+            result.append((g, d))
+            remaining = divmod_mod(remaining, g, p)[0]
+    if len(remaining) > 1:
+        result.append((remaining, len(remaining) - 1))
+    return result
+
+
+def _equal_degree(g, d, f, frobenius, p):
+    """把 g (所有不可约因子都是 d 次) 分裂为首一的不可约因子 (Cantor-Zassenhaus)。"""
+    if len(g) - 1 == d:
+        return [g]
+    n = len(f) - 1
+    while True:
+        a = trim([_rng.randrange(p) for _ in range(n)])
+        if len(a) < 2:
+            continue
+        # a^((p^d - 1) / 2) = (a * a^p * ... * a^(p^(d-1)))^((p - 1) / 2)
+        conjugate = a
+        norm = a
+        for _ in range(d - 1):
+            conjugate = _apply_frobenius(conjugate, frobenius, p)
+            norm = rem_mod(mul_mod(norm, conjugate, p), f, p)
+        b = _power_mod(norm, (p - 1) // 2, f, p)
+        factor = gcd_mod(g, sub_mod(rem_mod(b, g, p), [1], p), p)
+        if 1 < len(factor) < len(g):
+            return (_equal_degree(factor, d, f, frobenius, p)
+                    + _equal_degree(divmod_mod(g, factor, p)[0], d, f, frobenius, p))
+
+
+def _distinct_degree_mod_p(f, p):
+    """f 模 p 无平方因子；返回 (f 模 p 的首一形式, Frobenius 矩阵, 按次数分解的结果)。"""
+    monic = monic_mod(reduce(f, p), p)
+    frobenius = _frobenius_matrix(monic, p)
+    return monic, frobenius, _distinct_degree(monic, frobenius, p)
+
+
+def _odd_primes():
+    candidate = 3
+    while True:
+        if all(candidate % q for q in range(3, math.isqrt(candidate) + 1, 2)):
+            yield candidate
+        candidate += 2
+
+
+def _choose_prime(f):
+    """选择模 p 后次数不变且无平方因子的素数，在几次尝试中取因子最少的一个。"""
+    lc = f[-1]
+    best = None
+    trials = 0
+    for p in _odd_primes():
+        if lc % p == 0:
+            continue
+        reduced = reduce(f, p)
+        if len(gcd_mod(reduced, derivative_mod(reduced, p), p)) != 1:
+            continue
+        monic, frobenius, parts = _distinct_degree_mod_p(f, p)
+        count = sum((len(g) - 1) // d for g, d in parts)
+        if best is None or count < best[0]:
+            best = (count, p, monic, frobenius, parts)
+        trials += 1
+        if count == 1 or trials >= _PRIME_TRIALS:
+            break
+    return best
+
+
+# --- Hensel 提升 ---
+
+def _hensel_step(f, g, h, s, t, m):
+    """
+    f = g*h (mod m)，s*g + t*h = 1 (mod m)，h 首一 -> 提升到模 m^2 (von zur Gathen & Gerhard 算法 15.10)。
+    """
+    m2 = m * m
+    e = sub_mod(f, mul_mod(g, h, m2), m2)
+    q, r = divmod_mod(mul_mod(s, e, m2), h, m2)
+    g = reduce(addp(addp(g, mul_mod(t, e, m2)), mul_mod(q, g, m2)), m2)
+    h = reduce(addp(h, r), m2)
+    b = sub_mod(addp(mul_mod(s, g, m2), mul_mod(t, h, m2)), [1], m2)
+    c, d = divmod_mod(mul_mod(s, b, m2), h, m2)
+    s = sub_mod(s, d, m2)
+    t = sub_mod(sub_mod(t, mul_mod(t, b, m2), m2), mul_mod(c, g, m2), m2)
+    return g, h, s, t
+
+
+def _product(factors, m):
+    result = [1]
+    for factor in factors:
+        result = mul_mod(result, factor, m)
+    return result
+
+
+def _hensel_lift(f, factors, p, modulus):
+    """
+    f = lc(f) * prod(factors) (mod p)，factors 为模 p 首一且两两互素的因子；
+    返回模 modulus (p 的 2 的幂次方) 的首一因子列表，乘积 * lc(f) = f (mod modulus)。
+    """
+    if len(factors) == 1:
+        inverse = pow(f[-1], -1, modulus)
+        return [reduce([c * inverse for c in f], modulus)]
+    half = len(factors) // 2
+    g = reduce([c * f[-1] for c in _product(factors[:half], p)], p)
+    h = _product(factors[half:], p)
+    s, t = gcdex_mod(g, h, p)
+    m = p
+    budget = current_budget()
+    while m < modulus:
+        if budget is not None:
+            budget.check_time()
+        g, h, s, t = _hensel_step(f, g, h, s, t, m)
+        m *= m
+    g = reduce(g, modulus)
+    h = reduce(h, modulus)
+    # 两部分分别继续提升：g 的主项系数为 lc(f)，h 首一
+    return _hensel_lift(g, factors[:half], p, modulus) + _hensel_lift(h, factors[half:], p, modulus)
+
+
+# --- 整系数多项式 ---
+
+def _cyclotomic_factors(f):
+    """
+    x^n - 1 = prod(Phi_d, d | n)，x^n + 1 = prod(Phi_d, d | 2n 且 d 不整除 n)；
+    f 不是这两种形式时返回 None。分圆多项式 Phi_d 在 Q 上不可约。
+    """
+    n = len(f) - 1
+    if f[-1] != 1 or abs(f[0]) != 1 or any(f[1:-1]):
+        return None
+    order = n if f[0] == -1 else 2 * n
+    cyclotomic = {}
+    for d in range(1, order + 1):
+        if order % d:
+            continue
+        # Phi_d = (x^d - 1) / prod(Phi_e, e | d, e < d)
+        phi = [-1] + [0] * (d - 1) + [1]
+        for e, phi_e in cyclotomic.items():
+            if d % e == 0:
+                phi = exact_division(phi, phi_e)
+        cyclotomic[d] = phi
+    return [phi for d, phi in cyclotomic.items() if f[0] == -1 or n % d]
+
+
+def _factor_square_free(f):
+    """f: 本原、无平方因子、次数 >= 1 的整系数多项式 (整数列表)，返回不可约因子 (本原) 列表。"""
+    n = len(f) - 1
+    if n == 1:
+        return [f]
+    cyclotomic = _cyclotomic_factors(f)
+    if cyclotomic is not None:
+        return cyclotomic
+    count, p, monic, frobenius, parts = _choose_prime(f)
+    if count == 1:
+        return [f]
+    modular = []
+    for g, d in parts:
+        modular.extend(_equal_degree(g, d, monic, frobenius, p))
+
+    # Mignotte 界：f 的任何因子的系数绝对值不超过 2^n * ||f||_2
+    lc = abs(f[-1])
+    bound = 2 * lc * (1 << n) * (math.isqrt(sum(c * c for c in f)) + 1)
+    modulus = p
+    while modulus <= bound:
+        modulus *= modulus
+    lifted = _hensel_lift(f, modular, p, modulus)
+
+    factors = []
+    remaining = f
+    size = 1
+    budget = current_budget()
+    while 2 * size <= len(lifted):
+        found = False
+        lc_remaining = remaining[-1]
+        constant = remaining[0] * lc_remaining
+        for subset in combinations(range(len(lifted)), size):
+            if budget is not None:
+                budget.check_time()
+            # 先只看常数项：候选因子的常数项必须整除 lc * f(0)
+            head = lc_remaining
+            for i in subset:
+                head = head * lifted[i][0] % modulus
+            head = head - modulus if head > modulus // 2 else head
+            if head == 0 or constant % head:
+                continue
+            candidate = [lc_remaining % modulus]
+            for i in subset:
+                candidate = mul_mod(candidate, lifted[i], modulus)
+            candidate = primitive(symmetric(candidate, modulus))
+            quotient = exact_division(remaining, candidate)
+            if quotient is None:
+                continue
+            factors.append(candidate)
+            remaining = quotient
+            lifted = [factor for i, factor in enumerate(lifted) if i not in subset]
+            found = True
+            break
+        if not found:
+            size += 1
+    if len(remaining) > 1:
+        factors.append(primitive(remaining))
+    return factors
+
+
+def factor(poly):
+    """
+    有理数域上的因式分解：返回 (content, [(factor, multiplicity), ...])，
+    poly = content * prod(factor^multiplicity)，factor 为本原整系数、主项系数为正的不可约多项式，
+    按次数、重数排序。常数多项式返回 (常数, [])；零多项式抛出 ValueError。
+    """
+    if not poly.terms:
+        raise ValueError("零多项式不能分解")
+    content, f = to_integer_list(poly)
+    result = []
+    low = next(i for i, c in enumerate(f) if c)
+    if low:
+        result.append((Polynomial({1: 1}), low))
+        f = f[low:]
+    if len(f) > 1:
+        if is_square_free(f):
+            parts = [(f, 1)]
+        else:
+            parts = []
+            for part, multiplicity in from_integer_list(f).square_free_decomposition():
+                parts.append((to_integer_list(part)[1], multiplicity))
+        for part, multiplicity in parts:
+            for irreducible in _factor_square_free(part):
+                result.append((from_integer_list(irreducible), multiplicity))
+    result.sort(key=lambda item: (item[0].degree(), item[1], sorted(item[0].terms.items())))
+    return content, result
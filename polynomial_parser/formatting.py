@@ -2,25 +2,29 @@
 
 from .polynomial import Polynomial
 from .fractional_polynomial import FractionalPolynomial
-import sympy
 
 # Import get_sort_key from partial_fraction for sorting
-from .partial_fraction import get_sort_key
+from .partial_fraction import get_sort_key, _is_sympy_expr
 
-# Function to sort and print decomposed terms
-def print_decomposed_terms(terms_list, symbol):
+# Function to sort and format decomposed terms
+def format_decomposed_terms(terms_list, symbol):
+    """
+    将裂项结果排序并转换为字符串列表 (与 print_decomposed_terms 的顺序相同)。
+    SymPy 的 ** 会被替换为 ^。symbol 可以是变量名字符串或 SymPy Symbol。
+    """
     # Sort the terms using the custom key (descending overall)
     sorted_terms = sorted(terms_list, key=lambda term: get_sort_key(term, symbol), reverse=True)
 
-    # Print each term, adding '+' before subsequent terms if they are positive
-    for i, term in enumerate(sorted_terms):
-       # print(f"Debug: Processing term {i}, type: {type(term)}, value: {term}") # Print type and value of each term
-
+    term_strs = []
+    for term in sorted_terms:
         # Get the string representation based on type
-        if isinstance(term, (Polynomial, FractionalPolynomial)):
+        if isinstance(term, FractionalPolynomial) and term.numerator._leading_term()[1] < 0:
+            # 负号提到括号外面，打印时显示为 " - (1) / (x + 1)" 而不是 " + (-1) / (x + 1)"
+            term_str = "-" + str(FractionalPolynomial._from_reduced(-term.numerator, term.denominator))
+        elif isinstance(term, (Polynomial, FractionalPolynomial)):
             # Use the custom object's __str__ method which should handle ^ and implicit mul
             term_str = str(term)
-        elif isinstance(term, sympy.Expr):
+        elif _is_sympy_expr(term):
             # Use SymPy's default string representation, then replace ** with ^
             try:
                 # Use SymPy's default string representation
@@ -35,7 +39,13 @@ def print_decomposed_terms(terms_list, symbol):
             # For any other unexpected types
             print(f"警告: 遇到未知类型的项 ({type(term)}): {term}")
             term_str = str(term)
+        term_strs.append(term_str)
+    return term_strs
 
+# Function to sort and print decomposed terms
+def print_decomposed_terms(terms_list, symbol):
+    # Print each term, adding '+' before subsequent terms if they are positive
+    for i, term_str in enumerate(format_decomposed_terms(terms_list, symbol)):
         # Add separator before terms after the first one
         if i > 0:
             # If the term string starts with '-', add a space before the '-'
@@ -55,4 +65,3 @@ def print_decomposed_terms(terms_list, symbol):
 
     # Print a final newline after all terms
     print()
-    
\ No newline at end of file
@@ -1,6 +1,7 @@
 from fractions import Fraction
 from .polynomial import Polynomial
 from .polynomial_math import polynomial_gcd
+from .budget import BudgetExceeded
 
 # --- FractionalPolynomial 类 ---
 
@@ -27,6 +28,45 @@ class FractionalPolynomial:
         # 实例化时进行简化
         self._simplify()
 
+    @classmethod
+    def _from_reduced(cls, numerator: Polynomial, denominator: Polynomial):
+        """
+        跳过约分直接构造分式多项式。
+        调用方需保证分子分母已经是 _simplify 之后的最简形式 (例如对最简分式取负)。
+        """
+        frac = cls.__new__(cls)
+        frac.numerator = numerator
+        frac.denominator = denominator
+        return frac
+
+    def copy(self):
+        """返回分式多项式的副本，分子分母也一并复制。"""
+        return FractionalPolynomial._from_reduced(self.numerator.copy(), self.denominator.copy())
+
+    # --- 序列化 ---
+
+    def to_bytes(self):
+        """编码为紧凑的二进制格式 (见 serialization 模块)。"""
+        from .serialization import dumps
+        return dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data, offset=0):
+        """
+        从 to_bytes 的结果解码，不再约分。
+        data 可以是 bytes、bytearray、memoryview 或 mmap，解码时不复制缓冲区。
+        """
+        from .serialization import loads
+        frac = loads(data, offset)
+        if not isinstance(frac, FractionalPolynomial):
+            raise ValueError("数据不是 FractionalPolynomial")
+        return frac
+
+    def __reduce__(self):
+        # pickle (包括多进程之间的传递) 使用紧凑的二进制格式
+        from .serialization import _fractional_from_bytes
+        return (_fractional_from_bytes, (self.to_bytes(),))
+
     def _simplify(self):
         """
         简化分式多项式。
@@ -53,6 +93,8 @@ class FractionalPolynomial:
                 self.numerator = new_numerator
                 self.denominator = new_denominator
 
+            except BudgetExceeded:
+                raise
             except ValueError as e:
                 print(f"约分过程中发生错误: {e}")
 
@@ -194,6 +236,52 @@ class FractionalPolynomial:
 
         return FractionalPolynomial(new_numerator, new_denominator)
 
+    def power(self, n):
+        """
+        计算分式多项式的非负整数次幂。
+        n: 非负整数指数。
+        """
+        if not isinstance(n, int) or n < 0:
+            raise ValueError("分式多项式的指数必须是非负整数")
+        # 最简分式的幂仍是最简分式，分母主项系数仍为正，无需再次约分
+        return FractionalPolynomial._from_reduced(self.numerator.power(n), self.denominator.power(n))
+
+    def evaluate(self, value):
+        """计算分式在 x = value 处的值，返回 Fraction；分母为零时抛出 ValueError。"""
+        denominator = self.denominator.evaluate(value)
+        if denominator == 0:
+            raise ValueError(f"分母在 x = {value} 处为零")
+        return self.numerator.evaluate(value) / denominator
+
+    def to_series(self, order, point=0):
+        """
+        在 x = point 处展开为截断幂级数 (见 power_series 模块)，保留 (x - point)^0 到 (x - point)^(order-1) 的项。
+        分子分母先做 Taylor 平移，再用 Newton 迭代求分母的倒数；point 是分母的根 (极点) 时抛出 ValueError。
+        """
+        from .power_series import PowerSeries
+        point = Fraction(point)
+        numerator = self.numerator.shift(point) if point else self.numerator
+        denominator = self.denominator.shift(point) if point else self.denominator
+        if denominator.terms.get(0, 0) == 0:
+            raise ValueError(f"在 x = {point} 处有极点，不能展开为幂级数")
+        return PowerSeries(numerator, order, point) / PowerSeries(denominator, order, point)
+
+    def compose(self, other):
+        """
+        复合：返回 self(other(x))，other 为 FractionalPolynomial、Polynomial、int 或 Fraction。
+        other = P/Q 时分子分母都乘以 Q^k (k 为 self 的分子、分母次数的较大者)，化为多项式的复合。
+        """
+        from .composition import compose_homogeneous
+        if isinstance(other, FractionalPolynomial):
+            num, den = other.numerator, other.denominator
+        else:
+            num, den = self._to_polynomial(other), Polynomial({0: 1})
+        k = max(self.numerator.degree(), self.denominator.degree())
+        new_denominator = compose_homogeneous(self.denominator, num, den, k)
+        if new_denominator.is_zero():
+            raise ValueError(f"代入 x = {other} 后分母为零")
+        return FractionalPolynomial(compose_homogeneous(self.numerator, num, den, k), new_denominator)
+
     def __rtruediv__(self, other):
         """反向除法: other / self"""
         if isinstance(other, (int, Fraction)):
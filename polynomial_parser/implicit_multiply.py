@@ -10,6 +10,9 @@ def insert_implicit_multiplication(tokens):
          'x(x+1)' -> 'x', '*', '(', 'x', '+', '1', ')'
          '(x+1)(x-1)' -> '(', 'x', '+', '1', ')', '*', '(', 'x', '-', '1', ')'
          '(x+1)x' -> '(', 'x', '+', '1', ')', '*', 'x'
+
+    注意：tokenize 已经在扫描时插入 MUL_IMPLICIT token，解析流程不再调用本函数；
+    保留它是为了兼容手工构造的 token 列表。
     """
     new_tokens = []
     i = 0
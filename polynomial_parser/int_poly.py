@@ -0,0 +1,248 @@
+# polynomial_parser/int_poly.py
+
+import math
+from fractions import Fraction
+from itertools import accumulate
+
+from .polynomial import Polynomial
+
+# --- 整系数多项式的列表运算 ---
+#
+# 因式分解、扩展欧几里得、实根隔离、复合与幂级数共用的底层运算。
+# 多项式用整数列表表示，下标为指数 (低次在前)，末尾没有零。
+# 带 _mod 后缀的函数在模 m 下运算 (gcd_mod、gcdex_mod 等要求 m 是素数)，系数取 [0, m) 中的代表元；
+# 其余函数在整数上精确运算。较长的乘法用 Kronecker 代换交给 Python 大整数乘法 (Karatsuba) 完成。
+
+# 超过这个长度的乘法使用 Kronecker 代换
+KRONECKER_THRESHOLD = 24
+
+
+# --- 模 m 的运算 ---
+
+def trim(a):
+    """去掉末尾的零 (原地修改并返回 a)。"""
+    while a and a[-1] == 0:
+        a.pop()
+    return a
+
+
+def reduce(a, m):
+    """各系数取模 m。"""
+    return trim([c % m for c in a])
+
+
+def symmetric(a, m):
+    """系数取 (-m/2, m/2] 中的代表元。"""
+    half = m // 2
+    return [c - m if c > half else c for c in a]
+
+
+def addp(a, b):
+    """整数上的逐项相加 (不取模，也不去掉末尾的零)。"""
+    if len(a) < len(b):
+        a, b = b, a
+    result = list(a)
+    for i, c in enumerate(b):
+        result[i] += c
+    return result
+
+
+def mul_mod(a, b, m):
+    """模 m 的乘积；a、b 的系数在 [0, m) 中。"""
+    if not a or not b:
+        return []
+    if min(len(a), len(b)) < KRONECKER_THRESHOLD:
+        if len(a) < len(b):
+            a, b = b, a
+        result = [0] * (len(a) + len(b) - 1)
+        for i, bi in enumerate(b):
+            if bi:
+                result[i:i + len(a)] = [r + bi * ai for r, ai in zip(result[i:i + len(a)], a)]
+        return reduce(result, m)
+    # 系数都在 [0, m) 中，每个乘积系数小于 min(len) * m^2，按字节对齐打包为一个大整数
+    slot = (2 * m.bit_length() + min(len(a), len(b)).bit_length() + 7) // 8
+    packed_a = int.from_bytes(b''.join(c.to_bytes(slot, 'little') for c in a), 'little')
+    packed_b = int.from_bytes(b''.join(c.to_bytes(slot, 'little') for c in b), 'little')
+    count = len(a) + len(b) - 1
+    data = (packed_a * packed_b).to_bytes(slot * count, 'little')
+    return trim([int.from_bytes(data[i * slot:(i + 1) * slot], 'little') % m for i in range(count)])
+
+
+def sub_mod(a, b, m):
+    if len(a) < len(b):
+        a = a + [0] * (len(b) - len(a))
+    return reduce([c - (b[i] if i < len(b) else 0) for i, c in enumerate(a)], m)
+
+
+def divmod_mod(a, b, m):
+    """模 m 的带余除法；b 的主项系数在模 m 下必须可逆。"""
+    remainder = list(a)
+    if len(remainder) < len(b):
+        return [], remainder
+    inverse = pow(b[-1], -1, m)
+    db = len(b) - 1
+    if len(remainder) == len(b) + 1 and db:
+        # 商只有两项 (欧几里得算法中最常见的情形)：r[i] = a[i] - q0*b[i] - q1*b[i-1]，一遍算完
+        q1 = remainder[-1] * inverse % m
+        q0 = (remainder[-2] - q1 * b[-2]) * inverse % m
+        return [q0, q1], trim([(r - q0 * value - q1 * previous) % m
+                               for r, value, previous in zip(remainder, b[:db], [0] + b[:db - 1])])
+    divisor = b[:db]
+    quotient = [0] * (len(remainder) - db)
+    for i in range(len(remainder) - 1, db - 1, -1):
+        # 中间结果不取模，只在用到某个系数时才约化
+        coeff = remainder[i] % m
+        if coeff:
+            if inverse != 1:
+                coeff = coeff * inverse % m
+            quotient[i - db] = coeff
+            shift = i - db
+            remainder[shift:i] = [r - coeff * value for r, value in zip(remainder[shift:i], divisor)]
+    return trim(quotient), reduce(remainder[:db], m)
+
+
+def rem_mod(a, b, m):
+    return divmod_mod(a, b, m)[1]
+
+
+def monic_mod(a, p):
+    inverse = pow(a[-1], -1, p)
+    return [c * inverse % p for c in a]
+
+
+def gcd_mod(a, b, p):
+    """模素数 p 的首一 GCD。"""
+    while b:
+        a, b = b, rem_mod(a, b, p)
+    return monic_mod(a, p) if a else a
+
+
+def gcdex_mod(a, b, p):
+    """模素数 p 的扩展欧几里得：返回 (s, t)，s*a + t*b = 1 (a、b 互素)。"""
+    r0, r1 = a, b
+    s0, s1 = [1], []
+    t0, t1 = [], [1]
+    while r1:
+        q, r = divmod_mod(r0, r1, p)
+        r0, r1 = r1, r
+        s0, s1 = s1, sub_mod(s0, mul_mod(q, s1, p), p)
+        t0, t1 = t1, sub_mod(t0, mul_mod(q, t1, p), p)
+    inverse = pow(r0[-1], -1, p)
+    return [c * inverse % p for c in s0], [c * inverse % p for c in t0]
+
+
+def derivative_mod(a, m):
+    return reduce([i * c for i, c in enumerate(a)][1:], m)
+
+
+# --- 整数上的运算 ---
+
+def exact_mul(a, b):
+    """
+    整系数多项式 (低次在前) 的精确乘积。短的一方较短时逐行相乘，否则用 Kronecker 代换：
+    每个系数加上半个槽宽的偏移后按字节打包成非负大整数，相乘后再逐槽减去偏移取回有符号系数。
+    """
+    if not a or not b:
+        return []
+    if min(len(a), len(b)) < KRONECKER_THRESHOLD:
+        if len(a) < len(b):
+            a, b = b, a
+        result = [0] * (len(a) + len(b) - 1)
+        for i, bi in enumerate(b):
+            if bi:
+                result[i:i + len(a)] = [r + bi * ai for r, ai in zip(result[i:i + len(a)], a)]
+        return trim(result)
+    bound = min(len(a), len(b)) * max(map(abs, a)) * max(map(abs, b))
+    slot = (bound.bit_length() + 2 + 7) // 8
+    half = 1 << (8 * slot - 1)
+    half_bytes = half.to_bytes(slot, 'little')
+
+    def pack(c):
+        # sum (c_i + half) * 2^(8*slot*i) - sum half * 2^(8*slot*i)
+        packed = int.from_bytes(b''.join((value + half).to_bytes(slot, 'little') for value in c), 'little')
+        return packed - int.from_bytes(half_bytes * len(c), 'little')
+
+    count = len(a) + len(b) - 1
+    # 乘积的每个系数的绝对值小于 half，加上偏移后各占一个槽且不产生进位
+    data = (pack(a) * pack(b) + int.from_bytes(half_bytes * count, 'little')).to_bytes(slot * count, 'little')
+    return trim([int.from_bytes(data[i * slot:(i + 1) * slot], 'little') - half for i in range(count)])
+
+
+def exact_division(a, b):
+    """整系数多项式 a / b；不能整除时返回 None。"""
+    remainder = list(a)
+    db = len(b) - 1
+    lc = b[-1]
+    if len(remainder) - 1 < db:
+        return None
+    quotient = [0] * (len(remainder) - db)
+    for i in range(len(remainder) - 1, db - 1, -1):
+        coeff, rest = divmod(remainder[i], lc)
+        if rest:
+            return None
+        quotient[i - db] = coeff
+        if coeff:
+            shift = i - db
+            remainder[shift:i] = [r - coeff * value for r, value in zip(remainder[shift:i], b)]
+    if any(remainder[:db]):
+        return None
+    return quotient
+
+
+def primitive(a):
+    """除以系数的最大公约数，主项系数取正。"""
+    content = 0
+    for c in a:
+        content = math.gcd(content, c)
+    if a[-1] < 0:
+        content = -content
+    return [c // content for c in a]
+
+
+def integer_combination(values):
+    """Fraction 列表 -> (公分母, 整数列表)。"""
+    common_denominator = 1
+    for value in values:
+        common_denominator = common_denominator // math.gcd(common_denominator, value.denominator) * value.denominator
+    return common_denominator, [value.numerator * (common_denominator // value.denominator) for value in values]
+
+
+def taylor_shift_one(f):
+    """f(x + 1)。"""
+    n = len(f) - 1
+    # 高次在前；第 k 轮前缀和的最后一项是 f(x+1) 的 k 次系数 (x = 1 处的综合除法)
+    g = f[::-1]
+    for end in range(n + 1, 1, -1):
+        g[:end] = accumulate(g[:end])
+    return g[::-1]
+
+
+# --- 与 Polynomial 之间的转换 ---
+
+def to_integer_list(poly):
+    """Polynomial -> (content, 本原整系数列表，低次在前)。"""
+    common_denominator = 1
+    for coeff in poly.terms.values():
+        common_denominator = common_denominator // math.gcd(common_denominator, coeff.denominator) * coeff.denominator
+    dense = [0] * (max(poly.terms) + 1)
+    for exp, coeff in poly.terms.items():
+        dense[exp] = coeff.numerator * (common_denominator // coeff.denominator)
+    primitive_part = primitive(dense)
+    return Fraction(dense[-1] // primitive_part[-1], common_denominator), primitive_part
+
+
+def from_integer_list(a):
+    """整数列表 -> Polynomial。"""
+    return Polynomial._from_terms({exp: Fraction(c) for exp, c in enumerate(a) if c})
+
+
+def is_square_free(f):
+    """找一个不整除主项系数的素数，模 p 无平方因子则 f 在 Q 上也无平方因子 (不成立时不下结论)。"""
+    # 随机多项式模 p 有重因式的概率约为 1/p，所以用较大的素数；
+    # 小于 2^15 时乘积不超过 2^30，仍是 Python 的单字整数，运算最快
+    for p in (32749, 32719, 32717):
+        if f[-1] % p:
+            reduced = reduce(f, p)
+            if len(gcd_mod(reduced, derivative_mod(reduced, p), p)) == 1:
+                return True
+    return False
@@ -0,0 +1,213 @@
+# polynomial_parser/numeric_roots.py
+
+# --- 数值求根 (需要 NumPy) ---
+#
+# roots_numeric_many(polys) 一次求出许多多项式的全部复根 (计重数)，按次数分组后整组向量化计算：
+#   1. 先去掉 x 的幂 (这些根精确为 0)；再在有理数上精确地代入 x = 2^s y 并除以主项系数，
+#      2^s 取在根的模的上下界之间，然后各自舍入为 float。超出 float 范围的系数
+#      (例如 10^400) 或相差悬殊的系数不会变成 inf / 0，根的大小为 O(1)，最后再乘以 2^s
+#   2. 次数不超过 _COMPANION_MAX_DEGREE 时，把同一组的友矩阵堆成 (组大小, n, n) 的数组，
+#      一次 numpy.linalg.eigvals 求出所有特征值 (LAPACK 在 C 层循环，每个多项式没有 Python 开销)
+#   3. 次数更高时用 Aberth-Ehrlich 迭代：所有根同时更新，根之间的相互作用用广播一次算出，
+#      已经收敛的根不再移动
+#   4. 最后用原多项式的系数做几步 Newton 修正 (只接受让 |p(z)| 变小的修正)
+# |z| > 1 时 p(z) / p'(z) 改用倒序多项式在 1/z 处计算，高次多项式不会溢出。
+# 失败只影响对应的多项式：根超出 float 范围、或个别友矩阵的特征值不收敛时，该多项式的结果是一行 NaN。
+
+# 不超过这个次数时用友矩阵的特征值，否则用 Aberth-Ehrlich 迭代
+_COMPANION_MAX_DEGREE = 200
+_ABERTH_MAX_ITERATIONS = 200
+_POLISH_STEPS = 2
+
+
+def _require_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("数值求根需要 NumPy，请安装: pip install polynomial-solver[numeric]") from None
+    return numpy
+
+
+def _float_coefficients(poly):
+    """
+    Polynomial -> (x 的幂次 k, 缩放指数 s, float 系数列表 (低次在前，主项系数为 1))。
+    去掉 x^k 之后代入 x = 2^s y 并除以主项系数 c_n，y^i 的系数为 (c_i / c_n) 2^(-s(n-i))；
+    原多项式的非零根是 2^s 乘以这些系数的根。2^s 取根的模的上界 (Fujiwara) 与下界 (倒序多项式的上界)
+    的几何平均，系数本来就在合理范围内时 s 接近 0。
+    根的模相差过于悬殊、缩放后的系数仍然超出 float 范围时，系数列表为 None。
+    """
+    if poly.is_zero():
+        raise ValueError("零多项式的根不确定")
+    terms = poly.terms
+    low = min(terms)
+    n = max(terms) - low
+    lead = terms[n + low]
+    lead_numerator, lead_denominator = lead.numerator, lead.denominator
+    # |c_i / c_n| = numerator / denominator，其 log2 与 bits 最多相差 1
+    ratios = []
+    for exp, coeff in terms.items():
+        i = exp - low
+        if i == n:
+            continue
+        numerator = coeff.numerator * lead_denominator
+        denominator = coeff.denominator * lead_numerator
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        ratios.append((i, numerator, denominator, abs(numerator).bit_length() - denominator.bit_length()))
+    if not ratios:
+        return low, 0, [1.0]
+    # 去掉 x^k 后常数项 c_0 不为零：根的模不超过 max 2 |c_i / c_n|^(1/(n-i))，
+    # 不小于 min |c_0 / c_i|^(1/i) / 2 (i = n 时 |c_0 / c_n|^(1/n))
+    bits_0 = next(bits for i, _, _, bits in ratios if i == 0)
+    upper = max(-(-bits // (n - i)) for i, _, _, bits in ratios)
+    lower = min([(bits_0 - bits) // i for i, _, _, bits in ratios if i] + [bits_0 // n])
+    scale = (upper + lower) // 2
+    dense = [0.0] * (n + 1)
+    dense[n] = 1.0
+    try:
+        for i, numerator, denominator, _ in ratios:
+            shift = scale * (n - i)
+            # 整数的真除法是正确舍入的 (过小时得到 0.0 或次正规数)，乘除 2 的幂是精确的
+            if shift >= 0:
+                dense[i] = numerator / (denominator << shift)
+            else:
+                dense[i] = (numerator << -shift) / denominator
+    except OverflowError:
+        return low, scale, None
+    return low, scale, dense
+
+
+def _newton_ratio(np, coefficients, z):
+    """
+    coefficients: (组大小, n+1)，低次在前；z: (组大小, m)。返回 p(z) / p'(z) 以及 |p(z)| 的相对大小。
+    |z| > 1 时用倒序多项式 q(y) = y^n p(1/y)：p / p' = z q(y) / (n q(y) - y q'(y))，y = 1/z。
+    """
+    n = coefficients.shape[1] - 1
+    outside = np.abs(z) > 1
+    y = np.where(outside, 1 / np.where(z == 0, 1, z), z)
+    # 同一次 Horner 循环同时计算 p(z) (|z| <= 1) 与 q(y) (|z| > 1)
+    value = np.where(outside, coefficients[:, :1], coefficients[:, -1:]).astype(complex)
+    derivative = np.zeros_like(value)
+    for k in range(1, n + 1):
+        derivative = derivative * y + value
+        value = value * y + np.where(outside, coefficients[:, k:k + 1], coefficients[:, n - k:n - k + 1])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(outside, z * value / (n * value - y * derivative), value / derivative)
+    # |q(y)| = |p(z)| / |z|^n，两种情形都是与 p 的大小同阶的量，用来判断修正是否有效
+    return ratio, np.abs(value)
+
+
+def _companion_roots(np, coefficients):
+    """coefficients: (组大小, n+1)，n >= 1。友矩阵特征值，(组大小, n)。"""
+    count, width = coefficients.shape
+    n = width - 1
+    companion = np.zeros((count, n, n))
+    companion[:, np.arange(1, n), np.arange(n - 1)] = 1
+    companion[:, :, -1] = -coefficients[:, :-1] / coefficients[:, -1:]
+    return np.linalg.eigvals(companion).astype(complex)
+
+
+def _aberth_roots(np, coefficients):
+    """coefficients: (组大小, n+1)，n >= 1。Aberth-Ehrlich 迭代，(组大小, n)。"""
+    count, width = coefficients.shape
+    n = width - 1
+    # 初值放在半径为 |a0/an|^(1/n) 的圆上，角度错开以免与实轴对称
+    radius = (np.abs(coefficients[:, :1]) / np.abs(coefficients[:, -1:])) ** (1 / n)
+    radius = np.where(radius > 0, radius, 1.0)
+    angles = 2 * np.pi * np.arange(n) / n + 0.4
+    z = radius * np.exp(1j * angles)[None, :]
+    active = np.ones(z.shape, dtype=bool)
+    eye = np.eye(n, dtype=bool)
+    for _ in range(_ABERTH_MAX_ITERATIONS):
+        ratio, _ = _newton_ratio(np, coefficients, z)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            difference = z[:, :, None] - z[:, None, :]
+            interaction = np.where(eye, 0, 1 / np.where(eye, 1, difference)).sum(axis=2)
+            correction = ratio / (1 - ratio * interaction)
+        correction = np.where(active & np.isfinite(correction), correction, 0)
+        z = z - correction
+        active &= np.abs(correction) > 1e-15 * np.maximum(np.abs(z), 1e-300)
+        if not active.any():
+            break
+    return z
+
+
+def _polish(np, coefficients, z):
+    """Newton 修正：只保留让 |p(z)| 变小的步骤。"""
+    for _ in range(_POLISH_STEPS):
+        ratio, size = _newton_ratio(np, coefficients, z)
+        candidate = z - np.where(np.isfinite(ratio), ratio, 0)
+        _, candidate_size = _newton_ratio(np, coefficients, candidate)
+        z = np.where(candidate_size < size, candidate, z)
+    return z
+
+
+def _roots_of_group(np, coefficients):
+    n = coefficients.shape[1] - 1
+    if n <= _COMPANION_MAX_DEGREE:
+        try:
+            roots = _companion_roots(np, coefficients)
+        except np.linalg.LinAlgError:
+            if len(coefficients) == 1:
+                return np.full((1, n), np.nan, dtype=complex)
+            # 个别友矩阵的特征值不收敛：逐个重新计算，失败的一行是 NaN，不影响同组的其他多项式
+            return np.concatenate([_roots_of_group(np, coefficients[row:row + 1])
+                                   for row in range(len(coefficients))])
+    else:
+        roots = _aberth_roots(np, coefficients)
+    return _polish(np, coefficients, roots)
+
+
+def _scale_roots(np, roots, scales):
+    """roots: (组大小, n)，第 i 行乘以 2^scales[i]；结果超出 float 范围的行整行为 NaN。"""
+    if not scales.any():
+        return roots
+    with np.errstate(over='ignore', invalid='ignore'):
+        scaled = np.ldexp(roots.real, scales[:, None]) + 1j * np.ldexp(roots.imag, scales[:, None])
+    return np.where(np.isfinite(scaled).all(axis=1, keepdims=True), scaled, np.nan)
+
+
+def roots_numeric_many(polys):
+    """
+    一次求出多个多项式的全部复根 (计重数)。
+    polys: Polynomial 的可迭代对象。返回与输入顺序相同的 numpy 复数数组列表，
+    第 i 个数组长度为 polys[i] 的次数，根按实部、虚部排序。常数多项式对应空数组。
+    系数可以超出 float 的范围 (见模块开头的说明)；根本身超出 float 范围的多项式
+    (或特征值计算不收敛的多项式) 对应的非零根是 NaN，其他多项式的结果不受影响。
+    零多项式抛出 ValueError，消息中给出它在输入中的位置。
+    """
+    np = _require_numpy()
+    prepared = []
+    degrees = []
+    for index, poly in enumerate(polys):
+        try:
+            prepared.append(_float_coefficients(poly))
+            degrees.append(poly.degree())
+        except ValueError as e:
+            raise ValueError(f"第 {index} 个多项式: {e}") from None
+    results = [None] * len(prepared)
+    groups = {}
+    for index, (low, _, dense) in enumerate(prepared):
+        if dense is None:
+            results[index] = np.concatenate((np.zeros(low, dtype=complex),
+                                             np.full(degrees[index] - low, np.nan, dtype=complex)))
+            continue
+        groups.setdefault(len(dense), []).append(index)
+    for width, indices in groups.items():
+        if width == 1:
+            roots = np.zeros((len(indices), 0), dtype=complex)
+        else:
+            roots = _roots_of_group(np, np.array([prepared[index][2] for index in indices]))
+            scales = np.array([prepared[index][1] for index in indices])
+            roots = np.sort_complex(_scale_roots(np, roots, scales))
+        for row, index in zip(roots, indices):
+            low = prepared[index][0]
+            results[index] = np.sort_complex(np.concatenate((np.zeros(low, dtype=complex), row))) if low else row
+    return results
+
+
+def roots_numeric(poly):
+    """poly 的全部复根 (计重数) 的数值近似，按实部、虚部排序的 numpy 复数数组。"""
+    if poly.is_zero():
+        raise ValueError("零多项式的根不确定")
+    return roots_numeric_many([poly])[0]
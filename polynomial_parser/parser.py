@@ -1,136 +1,227 @@
 from fractions import Fraction
-from .tokenizer import Token, TOKEN_TYPE_NUMBER, TOKEN_TYPE_VARIABLE, TOKEN_TYPE_OPERATOR, TOKEN_TYPE_LPAREN, TOKEN_TYPE_RPAREN, TOKEN_TYPE_EOF, TOKEN_TYPE_MUL_IMPLICIT
+from .tokenizer import Token, EOF_TOKEN, TOKEN_TYPE_NUMBER, TOKEN_TYPE_VARIABLE, TOKEN_TYPE_OPERATOR, TOKEN_TYPE_LPAREN, TOKEN_TYPE_RPAREN, TOKEN_TYPE_EOF, TOKEN_TYPE_MUL_IMPLICIT
 from .ast_nodes import Node, PolynomialNode, BinOpNode, UnaryOpNode
 from .polynomial import Polynomial
+from .budget import current_budget
+
+# --- 运算符表 ---
+# 解析器按 token 的分派键查表：运算符 token 的键是它的值 ('+', '^' 等)，
+# 其他 token 的键是它的类型 (例如 MUL_IMPLICIT)。
+# 新增运算符只需在表中添加一项 (并在 evaluator.BINARY_OPERATIONS 中给出求值方式)，
+# 不会给已有运算符增加额外的检查。
+
+# 前缀运算符: 分派键 -> (AST 运算符, 优先级)
+PREFIX_OPERATORS = {
+    '-': ('-', 4), # 一元负号作用于紧随其后的 factor：-x*2 = (-x)*2，-x^2 = -(x^2)
+}
+
+# 中缀运算符: 分派键 -> (AST 运算符, 优先级, 是否右结合)
+# 优先级数值越大结合越紧
+INFIX_OPERATORS = {
+    '@': ('@', 1, False),                      # 复合：f @ g = f(g(x))，结合最松：x^2+1 @ x-1 = (x^2+1) @ (x-1)
+    '+': ('+', 2, False),
+    '-': ('-', 2, False),
+    '*': ('*', 3, False),
+    '/': ('/', 3, False),
+    TOKEN_TYPE_MUL_IMPLICIT: ('*', 3, False), # 隐式乘法视为常规乘法
+    '^': ('^', 5, True),                       # 乘方，右结合：x^2^3 = x^(2^3)
+}
+
+# 运算符栈上的左括号标记；优先级 0 保证归约在括号处停止
+_LPAREN_MARK = (None, 0, False)
+
+# 每个 Parser 最多缓存的叶子多项式数量
+_LEAF_CACHE_SIZE = 1024
+
+
+def _dispatch_key(token):
+    """返回 token 在运算符表中的键。"""
+    if token.type == TOKEN_TYPE_OPERATOR:
+        return token.value
+    return token.type
+
 
 # --- Parser 类 ---
 
 class Parser:
     """
-    递归下降解析器，将 token 列表构建成 AST。
-    遵循经典的表达式解析语法:
-    expression -> term ((+ | -) term)*
-    term -> factor ((* | /) factor)*
-    factor -> power (^ power)*
-    power -> (NUMBER | VARIABLE | '(' expression ')')
-    unary_op -> '-' factor (simplified for now, treats leading '-' on factors)
+    表驱动的非递归 Pratt / 运算符优先级解析器，将 token 序列构建成 AST。
+    语法:
+    expression -> prefix* operand (infix prefix* operand)*
+    operand    -> x ('^' NUMBER)? | NUMBER | '(' expression ')'
+    运算符的优先级和结合性全部来自 PREFIX_OPERATORS / INFIX_OPERATORS，
+    每个 token 只被消耗一次，并且只做一次查表。
+
+    括号和待归约的运算符保存在显式的运算符栈上而不是 Python 调用栈上，
+    因此嵌套深度只受内存限制，解析时间与 token 数量成线性关系。
+
+    tokens 可以是 token 列表，也可以是任意 token 迭代器 (例如 iter_tokens 生成器)。
+    解析器最多前瞻三个 token，不会把整个 token 流物化到内存中。
     """
     def __init__(self, tokens):
-        self.tokens = tokens
-        self.current_token_index = 0
+        self._tokens = iter(tokens)
+        self._current = next(self._tokens, EOF_TOKEN)
+        self._lookahead = [] # current 之后已经通过 peek 读取的 token
+        # 同一个数字或 x^n 在长表达式中反复出现，叶子多项式只构造一次。
+        # Polynomial 在构造后不会被修改，因此可以在多个节点之间共享。
+        self._leaf_polys = {}
 
     def current_token(self):
         """返回当前 token。"""
-        return self.tokens[self.current_token_index]
+        return self._current
+
+    def peek(self, offset=1):
+        """返回当前 token 之后第 offset 个 token，但不消耗。"""
+        while len(self._lookahead) < offset:
+            self._lookahead.append(next(self._tokens, EOF_TOKEN))
+        return self._lookahead[offset - 1]
 
     def eat(self, token_type):
         """如果当前 token 类型匹配，则消耗并前进到下一个 token。"""
-        if self.current_token().type == token_type:
-            self.current_token_index += 1
+        if self._current.type == token_type:
+            if self._lookahead:
+                self._current = self._lookahead.pop(0)
+            else:
+                # token 流耗尽后始终停留在 EOF
+                self._current = next(self._tokens, EOF_TOKEN)
         else:
             raise SyntaxError(f"期望 {token_type}，但得到 {self.current_token().type} (值: {self.current_token().value})")
 
     def parse(self):
         """开始解析过程，构建 AST。"""
-        node = self.expression()
-        if self.current_token().type != TOKEN_TYPE_EOF:
-            raise SyntaxError("解析未完成，输入中有多余的 token")
-        return node
-
-    def expression(self):
-        """解析加法和减法 (最低优先级)。"""
-        node = self.term()
-
-        while self.current_token().type == TOKEN_TYPE_OPERATOR and self.current_token().value in ('+', '-'):
-            token = self.current_token()
-            self.eat(TOKEN_TYPE_OPERATOR)
-            right_node = self.term()
-            node = BinOpNode(token.value, node, right_node)
-
-        return node
-
-    def term(self):
-        """解析乘法和除法。"""
-        node = self.factor()
-
-        # 包含 TokenType.MUL_IMPLICIT 来处理隐式乘法
-        # 需要从 tokenizer 导入 TokenType.MUL_IMPLICIT
-        # from .tokenizer import ..., TOKEN_TYPE_MUL_IMPLICIT
-        while self.current_token().type in (TOKEN_TYPE_OPERATOR, TOKEN_TYPE_MUL_IMPLICIT) and \
-              (self.current_token().value in ('*', '/') or self.current_token().type == TOKEN_TYPE_MUL_IMPLICIT):
-            token = self.current_token()
-            op_type = token.type # 存储原始 token 类型
-
-            if op_type == TOKEN_TYPE_OPERATOR:
-                if token.value == '*':
-                    self.eat(TOKEN_TYPE_OPERATOR)
-                elif token.value == '/':
-                    self.eat(TOKEN_TYPE_OPERATOR)
-            elif op_type == TOKEN_TYPE_MUL_IMPLICIT: # 处理隐式乘法
-                 self.eat(TOKEN_TYPE_MUL_IMPLICIT)
-                 op_type = TOKEN_TYPE_OPERATOR # 对于 AST 节点，隐式乘法视为常规乘法，使用 TokenType.OPERATOR '*'
-                 token.value = '*' # 确保 BinOpNode 使用 '*' 作为操作符值
-
-
-            # 使用确定的 op_type 和 token.value 创建二元运算符节点
-            node = BinOpNode(token.value, node, self.factor())
-
-        return node
-
-    def factor(self):
-        """解析基本单元：数字、变量 'x'、括号内的表达式，或带一元负号的单元。"""
-        token = self.current_token()
-
-        # 处理一元负号
-        if token.type == TOKEN_TYPE_OPERATOR and token.value == '-':
-             self.eat(TOKEN_TYPE_OPERATOR)
-             operand_node = self.factor() # 负号作用于后面的 factor
-             return UnaryOpNode('-', operand_node)
-
-        # 处理括号
-        elif token.type == TOKEN_TYPE_LPAREN:
-            self.eat(TOKEN_TYPE_LPAREN)
-            node = self.expression() # 递归解析括号内的表达式
-            self.eat(TOKEN_TYPE_RPAREN)
-            return node
-
-        # 处理数字和变量
-        elif token.type in (TOKEN_TYPE_NUMBER, TOKEN_TYPE_VARIABLE):
-             start_token = self.current_token() # 记录开始的 token
-
-             if token.type == TOKEN_TYPE_NUMBER:
-                 self.eat(TOKEN_TYPE_NUMBER)
-                 # 将数字 token 转换为 PolynomialNode (常数多项式)
-                 try:
-                     if '/' in start_token.value:
-                         num, den = map(int, start_token.value.split('/'))
-                         coeff = Fraction(num, den)
-                     else:
-                         coeff = Fraction(int(start_token.value))
-                     return PolynomialNode(Polynomial({0: coeff}))
-                 except (ValueError, TypeError):
-                      raise ValueError(f"无效的数字格式: {start_token.value}")
-
-             elif token.type == TOKEN_TYPE_VARIABLE:
-                 self.eat(TOKEN_TYPE_VARIABLE)
-                 # 解析 'x'，可能是 x^n 的形式
-                 exp = 1 # 默认指数是 1
-                 if self.current_token().type == TOKEN_TYPE_OPERATOR and self.current_token().value == '^':
-                      self.eat(TOKEN_TYPE_OPERATOR) # 消耗 '^'
-                      exp_token = self.current_token()
-                      if exp_token.type == TOKEN_TYPE_NUMBER:
-                           self.eat(TOKEN_TYPE_NUMBER)
-                           try:
-                               exp = int(exp_token.value)
-                               if exp < 0:
-                                    raise ValueError("指数不能为负数")
-                           except (ValueError, TypeError):
-                                raise ValueError(f"无效的指数格式: {exp_token.value}")
-                      else:
-                           raise SyntaxError(f"期望指数，但得到 {exp_token.type}")
-
-                 # 创建 PolynomialNode (x^exp)
-                 return PolynomialNode(Polynomial({exp: Fraction(1)}))
+        operands = []   # 已完成的子表达式
+        operators = []  # 待归约的运算符 (AST 运算符, 优先级, 是否一元) 以及左括号标记
+        open_parens = 0 # 运算符栈中左括号标记的数量
+        expect_operand = True
+
+        while True:
+            token = self._current
+
+            if expect_operand:
+                # 期望一个操作数，或者作用于它的前缀运算符 / 左括号
+                prefix = PREFIX_OPERATORS.get(_dispatch_key(token))
+                if prefix is not None:
+                    self.eat(token.type)
+                    operators.append((prefix[0], prefix[1], True))
+                elif token.type == TOKEN_TYPE_LPAREN:
+                    self.eat(TOKEN_TYPE_LPAREN)
+                    operators.append(_LPAREN_MARK)
+                    open_parens += 1
+                else:
+                    operands.append(self._primary())
+                    expect_operand = False
+                continue
+
+            # 期望一个中缀运算符、右括号或输入结束
+            infix = INFIX_OPERATORS.get(_dispatch_key(token))
+            if infix is not None:
+                operator, precedence, right_assoc = infix
+                # 归约栈顶结合得更紧的运算符；同级时左结合运算符先归约
+                while operators and (operators[-1][1] > precedence or
+                                     (operators[-1][1] == precedence and not right_assoc)):
+                    self._reduce(operands, operators)
+                self.eat(token.type)
+                operators.append((operator, precedence, False))
+                expect_operand = True
+
+            elif token.type == TOKEN_TYPE_RPAREN and open_parens:
+                while operators[-1] is not _LPAREN_MARK:
+                    self._reduce(operands, operators)
+                operators.pop()
+                open_parens -= 1
+                self.eat(TOKEN_TYPE_RPAREN)
+
+            elif open_parens:
+                # 括号没有闭合，或括号内出现了无法继续的 token
+                self.eat(TOKEN_TYPE_RPAREN)
+
+            elif token.type != TOKEN_TYPE_EOF:
+                raise SyntaxError("解析未完成，输入中有多余的 token")
+
+            else:
+                while operators:
+                    self._reduce(operands, operators)
+                return operands[0]
+
+    def _primary(self):
+        """解析基本单元：数字或变量 'x' (可能带 ^n)。"""
+        token = self._current
+
+        if token.type == TOKEN_TYPE_NUMBER:
+            self.eat(TOKEN_TYPE_NUMBER)
+            # 将数字 token 转换为 PolynomialNode (常数多项式)
+            poly = self._leaf_polys.get(token.value)
+            if poly is None:
+                try:
+                    if '/' in token.value:
+                        num, den = map(int, token.value.split('/'))
+                        coeff = Fraction(num, den)
+                    else:
+                        coeff = Fraction(int(token.value))
+                except (ValueError, TypeError):
+                    raise ValueError(f"无效的数字格式: {token.value}")
+                poly = self._remember_leaf(token.value, Polynomial({0: coeff}))
+            return self.make_leaf(poly)
+
+        elif token.type == TOKEN_TYPE_VARIABLE:
+            self.eat(TOKEN_TYPE_VARIABLE)
+            # 快速路径：x^NUMBER 直接构造单项式叶子节点；
+            # 其余的乘方 (包括右结合的 x^2^3) 交给中缀 '^'
+            exp = 1 # 默认指数是 1
+            if self._current.type == TOKEN_TYPE_OPERATOR and self._current.value == '^' and \
+               self.peek().type == TOKEN_TYPE_NUMBER and \
+               not (self.peek(2).type == TOKEN_TYPE_OPERATOR and self.peek(2).value == '^'):
+                self.eat(TOKEN_TYPE_OPERATOR) # 消耗 '^'
+                exp_token = self._current
+                self.eat(TOKEN_TYPE_NUMBER)
+                try:
+                    exp = int(exp_token.value)
+                    if exp < 0:
+                        raise ValueError("指数不能为负数")
+                except (ValueError, TypeError):
+                    raise ValueError(f"无效的指数格式: {exp_token.value}")
+                # 单项式叶子不经过 Polynomial.power，在这里检查预算的次数限制
+                budget = current_budget()
+                if budget is not None:
+                    budget.check_degree(exp)
+
+            # 创建 PolynomialNode (x^exp)
+            poly = self._leaf_polys.get(exp)
+            if poly is None:
+                poly = self._remember_leaf(exp, Polynomial({exp: Fraction(1)}))
+            return self.make_leaf(poly)
 
         else:
             raise SyntaxError(f"无法解析的 token: {token}")
+
+    def _remember_leaf(self, key, poly):
+        """缓存叶子多项式 (数字按 token 文本，x^n 按指数 n)，缓存大小有上限。"""
+        if len(self._leaf_polys) < _LEAF_CACHE_SIZE:
+            self._leaf_polys[key] = poly
+        return poly
+
+    def _reduce(self, operands, operators):
+        """弹出一个运算符及其操作数，压入组合后的节点。"""
+        operator, _, unary = operators.pop()
+        if unary:
+            operands.append(self.make_unary(operator, operands.pop()))
+        else:
+            right = operands.pop()
+            left = operands.pop()
+            operands.append(self.make_binary(operator, left, right))
+
+    # --- 节点构造 ---
+    # 子类可以覆盖这三个方法，在解析的同时直接计算结果而不是构建 AST
+    # (见 evaluator.EvaluatingParser)。
+
+    def make_leaf(self, poly):
+        """为数字或 x^n 构造叶子节点。"""
+        return PolynomialNode(poly)
+
+    def make_binary(self, operator, left, right):
+        """构造二元运算节点。"""
+        return BinOpNode(operator, left, right)
+
+    def make_unary(self, operator, operand):
+        """构造一元运算节点。"""
+        return UnaryOpNode(operator, operand)
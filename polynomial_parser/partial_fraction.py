@@ -4,23 +4,78 @@
 from .fractional_polynomial import FractionalPolynomial
 from .polynomial import Polynomial
 from fractions import Fraction
-import sympy # Import sympy
+import sys
+
+# SymPy 只在真正需要时才导入 (导入 SymPy 需要约一秒)：
+# 纯多项式输入、排序以及格式化原生的 Polynomial / FractionalPolynomial 都不会加载它。
+
+def _is_sympy_expr(term):
+    """判断 term 是否为 SymPy 表达式；SymPy 尚未加载时不可能是，也不会为此导入 SymPy。"""
+    sympy = sys.modules.get('sympy')
+    return sympy is not None and isinstance(term, sympy.Expr)
 
 # print(sympy.__version__) # Commented out debug print
 
+# --- 与 SymPy 之间的转换 ---
+#
+# 直接读写 SymPy 的底层稠密表示 (DMP：按次数从高到低的系数列表，系数属于 ZZ 或 QQ 域)，
+# 系数按整数分子 / 分母整批转换，不经过 str()，也不让 SymPy 解析表达式。
+# 域元素由 ZZ / QQ 构造，安装了 python-flint 时 SymPy 会自动使用 flint 类型。
+
+def to_sympy_dmp(poly: Polynomial):
+    """把 Polynomial 转换为 SymPy 的 DMP；系数都是整数时使用 ZZ 域，否则使用 QQ 域。"""
+    from sympy.polys.domains import ZZ, QQ
+    from sympy.polys.polyclasses import DMP
+    if not poly.terms:
+        return DMP([], ZZ, 0)
+    terms = poly.terms
+    dense = [terms.get(exp) for exp in range(max(terms), -1, -1)]
+    if all(coeff is None or coeff.denominator == 1 for coeff in dense):
+        return DMP([ZZ(coeff.numerator) if coeff is not None else ZZ.zero for coeff in dense], ZZ, 0)
+    return DMP([QQ(coeff.numerator, coeff.denominator) if coeff is not None else QQ.zero for coeff in dense], QQ, 0)
+
+
+def from_sympy_dmp(rep):
+    """
+    把一元 DMP 转换为 Polynomial；系数域不是 ZZ 或 QQ (例如含有其他符号) 时返回 None。
+    """
+    domain = rep.dom
+    if rep.lev != 0:
+        return None
+    coeffs = rep.to_list()
+    degree = len(coeffs) - 1
+    if domain.is_ZZ:
+        return Polynomial._from_terms(
+            {degree - i: Fraction(int(coeff)) for i, coeff in enumerate(coeffs) if coeff})
+    if domain.is_QQ:
+        return Polynomial._from_terms(
+            {degree - i: Fraction(int(domain.numer(coeff)), int(domain.denom(coeff)))
+             for i, coeff in enumerate(coeffs) if coeff})
+    return None
+
+
 def to_sympy_poly(poly: Polynomial, symbol_name='x'):
     """Converts a custom Polynomial object to a sympy Polynomial."""
-    x = sympy.symbols(symbol_name)
-    # Construct dictionary using standard Python int for exponents and Fraction for coefficients
-    # Let SymPy handle the conversion to its internal types (Integer, Rational).
-    sympy_terms = {int(exp): coeff for exp, coeff in poly.terms.items()}
-    # print(f"Debug: to_sympy_poly - Converting custom poly {poly.terms} to sympy terms: {sympy_terms}") # Commented out debug print
-    return sympy.Poly(sympy_terms, x) # Let SymPy handle conversion from int/Fraction
+    import sympy
+    return sympy.Poly.new(to_sympy_dmp(poly), sympy.Symbol(symbol_name))
+
+
+def from_sympy_poly(sympy_poly, symbol_name='x'):
+    """把以 symbol_name 为唯一变量、系数为有理数的 sympy.Poly 转换为 Polynomial，否则返回 None。"""
+    if len(sympy_poly.gens) != 1 or str(sympy_poly.gens[0]) != symbol_name:
+        return None
+    return from_sympy_dmp(sympy_poly.rep)
+
+
+def _fraction_from_sympy_rational(value):
+    """SymPy 的 Rational / Integer -> Fraction (读取整数分子分母)。"""
+    return Fraction(int(value.p), int(value.q))
 
 # Helper function to get a sorting key for each term
 # Returns a tuple (priority, degree)
 # Higher priority comes first. Within the same priority, higher degree comes first (due to reverse=True)
 def get_sort_key(term, symbol):
+    # symbol 可以是变量名字符串 (例如 'x')，也可以是 SymPy Symbol
     try:
         if isinstance(term, Polynomial):
             # Custom Polynomial: Priority 3, actual degree
@@ -28,22 +83,17 @@ def get_sort_key(term, symbol):
 
         elif isinstance(term, FractionalPolynomial):
             # Custom FractionalPolynomial: Priority 2.
-            # Sort by the degree difference num_deg - den_deg using sympy.
-            try:
-                # to_sympy_poly is in this file, no need for circular import
-                sympy_num = to_sympy_poly(term.numerator, str(symbol))
-                sympy_den = to_sympy_poly(term.denominator, str(symbol))
-                # SymPy degree of a rational function N/D is deg(N) - deg(D)
-                # Be careful with degrees of zero polynomials (-inf)
-                num_deg = sympy.degree(sympy_num, symbol) if not sympy_num.is_zero else -float('inf')
-                den_deg = sympy.degree(sympy_den, symbol) if not sympy_den.is_zero else -float('inf')
-                return (2, num_deg - den_deg) # Priority 2, degree difference
-            except Exception as e:
-                print(f"警告: 计算 FractionalPolynomial 排序次数时出错: {term}, error: {e}")
-                return (2, -999999) # Priority 2, very low degree on error
+            # Sort by the degree difference num_deg - den_deg (zero polynomials have degree -inf)
+            num_deg = term.numerator.degree() if not term.numerator.is_zero() else -float('inf')
+            den_deg = term.denominator.degree() if not term.denominator.is_zero() else -float('inf')
+            return (2, num_deg - den_deg) # Priority 2, degree difference
 
-        elif isinstance(term, sympy.Expr):
+        elif _is_sympy_expr(term):
             # SymPy Expression: Priority based on type (polynomial, rational, constant, etc.)
+            # (SymPy 表达式只会来自已经加载了 SymPy 的裂项过程)
+            import sympy
+            if isinstance(symbol, str):
+                symbol = sympy.symbols(symbol)
             try:
                 if term.is_polynomial(symbol):
                     # SymPy polynomial expressions: Priority 3, actual degree
@@ -85,6 +135,7 @@ def get_sort_key(term, symbol):
 
 def from_sympy_expr(expr, symbol_name='x'):
     """Converts a sympy expression back to custom objects."""
+    import sympy
     x = sympy.symbols(symbol_name)
 
     # print(f"Debug: from_sympy_expr converting SymPy expression type: {type(expr)}, value: {expr}") # Commented out debug print
@@ -152,7 +203,7 @@ def from_sympy_expr(expr, symbol_name='x'):
 
             if num_poly is not None and den_poly is not None:
                  # Apply the constant factor to the numerator
-                 constant_poly = Polynomial({0: Fraction(str(constant_factor_sym))})
+                 constant_poly = Polynomial({0: _fraction_from_sympy_rational(constant_factor_sym)})
                  try:
                       num_poly = num_poly * constant_poly # Polynomial multiplication
                  except Exception as e:
@@ -184,8 +235,8 @@ def from_sympy_expr(expr, symbol_name='x'):
     elif isinstance(expr, sympy.Poly):
         # print("Debug: from_sympy_expr handling SymPy Poly") # Commented out debug print
         try:
-            custom_terms = {int(exp): Fraction(str(coeff)) for exp, coeff in expr.as_dict().items()}
-            return Polynomial(custom_terms)
+            converted = from_sympy_poly(expr, symbol_name)
+            return converted if converted is not None else expr
         except Exception as e:
             print(f"Error converting SymPy Poly {expr} to custom Polynomial: {e}")
             return expr
@@ -232,7 +283,7 @@ def from_sympy_expr(expr, symbol_name='x'):
     elif isinstance(expr, (sympy.Rational, sympy.Integer)):
         # print("Debug: from_sympy_expr handling SymPy Rational/Integer") # Commented out debug print
         try:
-            return Polynomial({0: Fraction(str(expr))})
+            return Polynomial({0: _fraction_from_sympy_rational(expr)})
         except Exception as e:
             print(f"Error converting SymPy Rational/Integer {expr} to custom Polynomial: {e}")
             return expr
@@ -278,6 +329,7 @@ def from_sympy_expr(expr, symbol_name='x'):
 # This function should be robust in handling expressions that are indeed polynomials
 def from_sympy_expr_to_polynomial(expr, symbol_name='x'):
     """Attempts to convert a sympy expression to a custom Polynomial object."""
+    import sympy
     x = sympy.symbols(symbol_name)
 
     # print(f"Debug: from_sympy_expr_to_polynomial converting type: {type(expr)}, value: {expr}") # Commented out debug print
@@ -286,15 +338,14 @@ def from_sympy_expr_to_polynomial(expr, symbol_name='x'):
     if isinstance(expr, sympy.Poly):
         # print("Debug: from_sympy_expr_to_polynomial handling SymPy Poly") # Commented out debug print
         try:
-            custom_terms = {int(exp): Fraction(str(coeff)) for exp, coeff in expr.as_dict().items()}
-            return Polynomial(custom_terms)
+            return from_sympy_poly(expr, symbol_name)
         except Exception as e:
             print(f"Error converting SymPy Poly {expr} to custom Polynomial in helper: {e}")
             return None
     elif isinstance(expr, (sympy.Rational, sympy.Integer)):
         # print("Debug: from_sympy_expr_to_polynomial handling SymPy Rational/Integer") # Commented out debug print
         try:
-            return Polynomial({0: Fraction(str(expr))})
+            return Polynomial({0: _fraction_from_sympy_rational(expr)})
         except Exception as e:
             print(f"Error converting SymPy constant {expr} to custom Polynomial in helper: {e}")
             return expr
@@ -326,19 +377,12 @@ def from_sympy_expr_to_polynomial(expr, symbol_name='x'):
              return None
 
     # Use sympy's functionality to convert to a polynomial if possible
+    # 含有其他符号的表达式直接判定为失败；否则在固定的 QQ 域上构造，避免 SymPy 推断系数域
+    if not expr.free_symbols <= {x}:
+        return None
     try:
-        # print(f"Debug: from_sympy_expr_to_polynomial attempting sympy.Poly({expr}, {x}) conversion in helper") # Commented out debug print
-        sympy_poly = sympy.Poly(expr, x)
-        # print(f"Debug: from_sympy_expr_to_polynomial sympy.Poly conversion result: {sympy_poly}, generators: {sympy_poly.gens}") # Commented out debug print
-        # Ensure the polynomial is indeed univariate in the target symbol and has integer exponents
-        if all(isinstance(gen, sympy.Symbol) and str(gen) == symbol_name for gen in sympy_poly.gens) and \
-           all(isinstance(exp, (int, sympy.Integer)) for term in sympy_poly.as_terms() for exp in term[1]):
-              # print("Debug: from_sympy_expr_to_polynomial SymPy Poly is a simple univariate polynomial with integer exponents.") # Commented out debug print
-              custom_terms = {int(exp): Fraction(str(coeff)) for exp, coeff in sympy_poly.as_dict().items()}
-              return Polynomial(custom_terms)
-        else:
-             # print(f"Debug: from_sympy_expr_to_polynomial SymPy Poly is not a simple univariate polynomial as expected: {sympy_poly}") # Commented out debug print
-             return None
+        sympy_poly = sympy.Poly(expr, x, domain=sympy.QQ)
+        return from_sympy_poly(sympy_poly, symbol_name)
 
     except Exception as e:
         # If sympy.Poly() fails, it's likely not a simple polynomial
@@ -349,6 +393,7 @@ def from_sympy_expr_to_polynomial(expr, symbol_name='x'):
 # Helper function to convert a sympy Mul expression to a custom Polynomial if it represents one
 def from_sympy_mul_to_polynomial(expr, symbol_name='x'):
      """Attempts to convert a sympy Mul expression to a custom Polynomial object if it represents a simple polynomial."""
+     import sympy
      if isinstance(expr, sympy.Mul):
           # print(f"Debug: from_sympy_mul_to_polynomial converting Mul type: {type(expr)}, value: {expr}") # Commented out debug print
           # Corrected: Call expand as a method of the expression
@@ -359,17 +404,30 @@ def from_sympy_mul_to_polynomial(expr, symbol_name='x'):
           return None # Not a Mul expression
 
 
-def partial_fraction_decompose(frac_poly: FractionalPolynomial, symbol_name='x') -> list[FractionalPolynomial | Polynomial]:
+def partial_fraction_decompose(frac_poly: FractionalPolynomial, symbol_name='x', method='native') -> list[FractionalPolynomial | Polynomial]:
     """
     对分式多项式进行分式裂项。
 
     Args:
         frac_poly: 需要进行裂项的分式多项式 (FractionalPolynomial 对象)。
         symbol_name: 多项式变量的名称 (默认为 'x')。
+        method: 'native' (默认) 使用 apart 模块中的原生实现；
+                'sympy' 使用 sympy.apart 并把结果转换回来 (旧的实现，作为备用)。
 
     Returns:
         一个列表，包含裂项后的项。这些项可能是 Polynomial 或 FractionalPolynomial 对象。
     """
+    if method == 'native':
+        from .apart import apart
+        return apart(frac_poly)
+    if method != 'sympy':
+        raise ValueError(f"未知的裂项方法: {method}")
+    return _partial_fraction_decompose_sympy(frac_poly, symbol_name)
+
+
+def _partial_fraction_decompose_sympy(frac_poly, symbol_name='x'):
+    """使用 sympy.apart 的裂项实现。"""
+    import sympy
     numerator_sym = to_sympy_poly(frac_poly.numerator, symbol_name)
     denominator_sym = to_sympy_poly(frac_poly.denominator, symbol_name)
     x = sympy.symbols(symbol_name)
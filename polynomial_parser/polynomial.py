@@ -1,4 +1,5 @@
 from fractions import Fraction
+from .budget import current_budget
 
 # --- Polynomial 类 ---
 
@@ -22,6 +23,44 @@ class Polynomial:
 
         self._clean_terms()
 
+    @classmethod
+    def _from_terms(cls, terms):
+        """
+        跳过转换和检查直接构造多项式。
+        调用方需保证 terms 的键是 int、值是非零的 Fraction，并且不再被外部修改。
+        """
+        poly = cls.__new__(cls)
+        poly.terms = terms
+        return poly
+
+    def copy(self):
+        """返回多项式的副本 (系数是不可变的 Fraction，只需复制字典)。"""
+        return Polynomial._from_terms(dict(self.terms))
+
+    # --- 序列化 ---
+
+    def to_bytes(self):
+        """编码为紧凑的二进制格式 (见 serialization 模块)。"""
+        from .serialization import dumps
+        return dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data, offset=0):
+        """
+        从 to_bytes 的结果解码。
+        data 可以是 bytes、bytearray、memoryview 或 mmap，解码时不复制缓冲区。
+        """
+        from .serialization import loads
+        poly = loads(data, offset)
+        if not isinstance(poly, Polynomial):
+            raise ValueError("数据不是 Polynomial")
+        return poly
+
+    def __reduce__(self):
+        # pickle (包括多进程之间的传递) 使用紧凑的二进制格式
+        from .serialization import _polynomial_from_bytes
+        return (_polynomial_from_bytes, (self.to_bytes(),))
+
     def _clean_terms(self):
         """移除字典中系数为零的项。"""
         for exp, coeff in list(self.terms.items()):
@@ -158,14 +197,24 @@ class Polynomial:
         elif not isinstance(other, Polynomial):
              return NotImplemented
 
+        budget = current_budget()
+        if budget is not None and self.terms and other.terms:
+            # 先按次数之和拒绝过大的乘积，不必等到算完
+            budget.check_degree(max(self.terms) + max(other.terms))
+
         result_terms = {}
         for exp1, coeff1 in self.terms.items():
+            if budget is not None:
+                budget.check_time()
             for exp2, coeff2 in other.terms.items():
                 new_exp = exp1 + exp2
                 new_coeff = coeff1 * coeff2
                 result_terms[new_exp] = result_terms.get(new_exp, Fraction(0)) + new_coeff
 
-        return Polynomial(result_terms)
+        result = Polynomial(result_terms)
+        if budget is not None:
+            budget.check_polynomial(result)
+        return result
 
     def power(self, n):
         """
@@ -183,6 +232,11 @@ class Polynomial:
         if n == 1:
             return self # 1 次幂是多项式本身
 
+        budget = current_budget()
+        if budget is not None and self.terms:
+            # (x+1)^100000 之类的输入在第一次乘法之前就会被拒绝
+            budget.check_degree(max(self.terms) * n)
+
         # 使用平方求幂法（Exponentiation by squaring）提高效率
         result = Polynomial({0: Fraction(1)}) # 结果初始化为常数 1
         base = Polynomial(self.terms.copy()) # 复制一份多项式作为乘法的基础
@@ -198,6 +252,135 @@ class Polynomial:
 
         return result
 
+    def evaluate(self, value):
+        """
+        计算多项式在 x = value 处的值 (value 为 int 或 Fraction)，返回 Fraction。
+        按指数从高到低使用 Horner 法则，跳过的零系数合并为一次乘方。
+        """
+        value = Fraction(value)
+        result = Fraction(0)
+        previous_exp = None
+        for exp in sorted(self.terms, reverse=True):
+            if previous_exp is not None:
+                result *= value ** (previous_exp - exp)
+            result += self.terms[exp]
+            previous_exp = exp
+        if previous_exp:
+            result *= value ** previous_exp
+        return result
+
+    def derivative(self):
+        """返回多项式的导数。"""
+        return Polynomial({exp - 1: coeff * exp for exp, coeff in self.terms.items() if exp > 0})
+
+    def shift(self, a):
+        """
+        Taylor 平移：返回 self(x + a)，a 为 int 或 Fraction。
+        放缩变量后化为整系数的 f(y + 1)，每一轮综合除法是一次前缀和 (见 composition 模块)。
+        """
+        from .composition import taylor_shift
+        return taylor_shift(self, a)
+
+    def compose(self, other):
+        """
+        复合：返回 self(other(x))，other 为 Polynomial、int 或 Fraction。
+        other 的次数较高时分治计算，乘法用 Kronecker 代换 (见 composition 模块)。
+        """
+        from .composition import compose
+        return compose(self, self._to_polynomial(other))
+
+    def square_free_decomposition(self):
+        """
+        无平方分解 (Yun 算法)：返回 [(factor, multiplicity), ...]，按重数从小到大排列。
+        factor 为首一、无平方因子且两两互素的多项式，self = 主项系数 * prod(factor^multiplicity)。
+        常数多项式返回空列表。结果缓存在多项式上 (多项式按不可变对象使用)。
+        """
+        if not self.terms:
+            raise ValueError("零多项式没有无平方分解")
+        cached = self.__dict__.get('_square_free')
+        if cached is None:
+            cached = self._yun()
+            self._square_free = cached
+        return list(cached)
+
+    def factor(self):
+        """
+        有理数域上的因式分解 (Zassenhaus 算法，见 factorization 模块)。
+        返回 (content, [(factor, multiplicity), ...])，factor 为本原整系数的不可约多项式。
+        """
+        from .factorization import factor
+        return factor(self)
+
+    def real_roots(self, eps=None):
+        """
+        实根隔离 (Descartes 法则 + 二分，见 real_roots 模块)：返回按从小到大排列的区间 [(a, b), ...]，
+        每个区间恰好包含一个不同的实根；a == b 时 a 就是有理根，否则根在开区间 (a, b) 中。
+        eps 不为 None 时把区间细化到宽度不超过 eps。
+        """
+        from .real_roots import real_roots
+        return real_roots(self, eps)
+
+    def sturm_sequence(self):
+        """
+        Sturm 序列 [p0, p1, ...]：p0 为 self 的本原整系数倍，p1 与 p0' 同向，
+        p(i+1) 与 -rem(p(i-1), p(i)) 只差一个正的常数因子 (在整数上用伪除法计算，不出现分数)。
+        有重根时各项再除以 gcd(self, self')。序列只计算一次，缓存在多项式上。
+        """
+        from .int_poly import from_integer_list
+        return [from_integer_list(f) for f in self._sturm_integers()]
+
+    def _sturm_integers(self):
+        cached = self.__dict__.get('_sturm')
+        if cached is None:
+            from .real_roots import sturm_sequence
+            cached = sturm_sequence(self)
+            self._sturm = cached
+        return cached
+
+    def count_real_roots(self, a=None, b=None):
+        """半开区间 (a, b] 中不同实根的个数 (Sturm 定理)；a 为 None 表示 -inf，b 为 None 表示 +inf。"""
+        return self.count_real_roots_many([(a, b)])[0]
+
+    def count_real_roots_many(self, intervals):
+        """
+        对多个区间 [(a, b), ...] 分别计算 (a, b] 中不同实根的个数。
+        Sturm 序列使用缓存，所有端点一起精确求值，重复的端点只计算一次。
+        """
+        from .real_roots import count_real_roots_many
+        return count_real_roots_many(self, intervals, self._sturm_integers())
+
+    def roots_numeric(self):
+        """
+        全部复根 (计重数) 的数值近似，返回按实部、虚部排序的 numpy 复数数组 (需要 NumPy)。
+        批量求根请使用 numeric_roots.roots_numeric_many。
+        """
+        from .numeric_roots import roots_numeric
+        return roots_numeric(self)
+
+    def _yun(self):
+        from .polynomial_math import polynomial_gcd
+        if self.degree() == 0:
+            return ()
+        # f = a * b，a = gcd(f, f') 包含所有重因式；b 是 f 的无平方部分
+        derivative = self.derivative()
+        a = polynomial_gcd(self, derivative)
+        b, _ = self.divmod_polynomial(a)
+        c, _ = derivative.divmod_polynomial(a)
+        d = c - b.derivative()
+        result = []
+        multiplicity = 1
+        while b.degree() > 0:
+            # 每一轮 gcd(b, d) 恰好是重数为 multiplicity 的因式之积
+            a = polynomial_gcd(b, d)
+            if a.degree() > 0:
+                result.append((a, multiplicity))
+            b, _ = b.divmod_polynomial(a)
+            c, _ = d.divmod_polynomial(a)
+            d = c - b.derivative()
+            multiplicity += 1
+        # 每个因式都是 polynomial_gcd 的结果，因此都是首一的
+        return tuple(result)
+
     def __rmul__(self, other):
         return self * other
 
@@ -212,35 +395,37 @@ class Polynomial:
                 raise ValueError("除数不能是零多项式")
 
 
-        quotient = Polynomial()
-        remainder = Polynomial(self.terms)
-
         divisor_leading_exp, divisor_leading_coeff = other._leading_term()
 
         if divisor_leading_coeff == 0:
             raise ValueError("除数的主项系数不能为零")
 
-        while remainder.degree() >= other.degree() and remainder.terms:
-            remainder_leading_exp, remainder_leading_coeff = remainder._leading_term()
-
-            if remainder_leading_coeff == 0:
-                 break
+        # 直接在字典上做长除法，避免每一步都构造新的 Polynomial
+        quotient_terms = {}
+        remainder_terms = dict(self.terms)
+        divisor_rest = [(exp, coeff) for exp, coeff in other.terms.items() if exp != divisor_leading_exp]
 
-            term_coeff = remainder_leading_coeff / divisor_leading_coeff
+        budget = current_budget()
+        while remainder_terms:
+            if budget is not None:
+                budget.check_time()
+            remainder_leading_exp = max(remainder_terms)
             term_exp = remainder_leading_exp - divisor_leading_exp
 
             if term_exp < 0:
                 break
 
-            current_quotient_term = Polynomial({term_exp: term_coeff})
-            quotient = quotient + current_quotient_term
-            term_to_subtract = current_quotient_term * other
-            remainder = remainder - term_to_subtract
-
-        remainder._clean_terms()
-        quotient._clean_terms()
+            term_coeff = remainder_terms.pop(remainder_leading_exp) / divisor_leading_coeff
+            quotient_terms[term_exp] = term_coeff
+            for exp, coeff in divisor_rest:
+                new_exp = exp + term_exp
+                new_coeff = remainder_terms.get(new_exp, 0) - term_coeff * coeff
+                if new_coeff:
+                    remainder_terms[new_exp] = new_coeff
+                else:
+                    remainder_terms.pop(new_exp, None)
 
-        return (quotient, remainder)
+        return (Polynomial._from_terms(quotient_terms), Polynomial._from_terms(remainder_terms))
 
     
     def __truediv__(self, other):
@@ -1,5 +1,9 @@
+import math
 from fractions import Fraction
 from .polynomial import Polynomial
+from .budget import BudgetExceeded, current_budget
+from .int_poly import (addp, divmod_mod, exact_division, exact_mul, integer_combination, mul_mod, primitive,
+                       reduce, to_integer_list, trim)
 
 # --- 多项式 GCD 函数 ---
 
@@ -14,11 +18,17 @@ def polynomial_gcd(poly1: Polynomial, poly2: Polynomial) -> Polynomial:
     a = poly1
     b = poly2
 
+    budget = current_budget()
     while b.terms:
         try:
             _, remainder = a.divmod_polynomial(b)
+            if budget is not None:
+                # 有理数域上的欧几里得算法中，余数的系数可能急剧膨胀
+                budget.check_polynomial(remainder)
             a = b
             b = remainder
+        except BudgetExceeded:
+            raise
         except ValueError:
             print(f"警告: GCD 计算中除法失败，返回当前候选项。a: {a}, b: {b}")
             break
@@ -32,4 +42,267 @@ def polynomial_gcd(poly1: Polynomial, poly2: Polynomial) -> Polynomial:
              monic_gcd_terms = {exp: coeff * reciprocal_coeff for exp, coeff in gcd.terms.items()}
              gcd = Polynomial(monic_gcd_terms)
 
-    return gcd
\ No newline at end of file
+    return gcd
+
+# --- 扩展欧几里得算法 ---
+#
+# polynomial_gcdex 在有理数域上直接做欧几里得算法时，余式和 Bézout 系数的分母会急剧膨胀。
+# 这里改为模大素数计算：
+#   1. a、b 化为本原整系数多项式；对一串约 62 位的素数 p，在 F_p 上求首一的 g 与 s、t
+#      (次数较大时用 half-GCD，只需 O(log n) 次多项式乘法递归，否则用普通的欧几里得算法)
+#   2. 丢弃 gcd 次数偏大的 (不幸运的) 素数，用中国剩余定理合并各个素数下的结果
+#   3. 有理数重构得到 s、t、g 的系数，在整数上精确验证 s*a + t*b = g 且 g 整除 a、b，
+#      验证失败就继续增加素数
+# 结果与在有理数域上做欧几里得算法得到的一致：g 首一，deg s < deg b - deg g，deg t < deg a - deg g。
+
+# 次数不小于这个值时用 half-GCD，否则用普通的欧几里得算法
+_HALF_GCD_THRESHOLD = 64
+# 模数取小于 2^62 的素数
+_MODULAR_PRIME_LIMIT = 1 << 62
+# 对 2^64 以内的整数，以这些数为底的 Miller-Rabin 检验是确定性的
+_MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+_modular_primes = []
+
+
+def _is_prime(n):
+    if n < 2:
+        return False
+    for base in _MILLER_RABIN_BASES:
+        if n % base == 0:
+            return n == base
+    d, r = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        r += 1
+    for base in _MILLER_RABIN_BASES:
+        x = pow(base, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(r - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _iter_modular_primes():
+    """从 2^62 往下依次给出素数 (已经找到的素数缓存在模块中)。"""
+    index = 0
+    while True:
+        if index == len(_modular_primes):
+            candidate = _modular_primes[-1] - 2 if _modular_primes else _MODULAR_PRIME_LIMIT - 1
+            while not _is_prime(candidate):
+                candidate -= 2
+            _modular_primes.append(candidate)
+        yield _modular_primes[index]
+        index += 1
+
+
+def _matrix_mul(m, n, p):
+    """2x2 多项式矩阵的乘积 m * n (模 p)。"""
+    (a, b), (c, d) = m
+    (e, f), (g, h) = n
+    return ((reduce(addp(mul_mod(a, e, p), mul_mod(b, g, p)), p),
+             reduce(addp(mul_mod(a, f, p), mul_mod(b, h, p)), p)),
+            (reduce(addp(mul_mod(c, e, p), mul_mod(d, g, p)), p),
+             reduce(addp(mul_mod(c, f, p), mul_mod(d, h, p)), p)))
+
+
+def _matrix_apply(m, a, b, p):
+    """m * (a, b)^T (模 p)。"""
+    (m00, m01), (m10, m11) = m
+    return (reduce(addp(mul_mod(m00, a, p), mul_mod(m01, b, p)), p),
+            reduce(addp(mul_mod(m10, a, p), mul_mod(m11, b, p)), p))
+
+
+def _sub_mul(a, quotient, b, p):
+    """a - quotient * b (模 p)。商通常只有一两项，逐项用切片更新，最后统一取模。"""
+    result = list(a)
+    if len(result) < len(quotient) + len(b) - 1:
+        result.extend([0] * (len(quotient) + len(b) - 1 - len(result)))
+    width = len(b)
+    for i, coeff in enumerate(quotient):
+        if coeff:
+            result[i:i + width] = [r - coeff * value for r, value in zip(result[i:i + width], b)]
+    return reduce(result, p)
+
+
+def _euclid_step(m, quotient, p):
+    """左乘一步欧几里得算法的矩阵 [[0, 1], [1, -quotient]]。"""
+    (m00, m01), (m10, m11) = m
+    return ((m10, m11), (_sub_mul(m00, quotient, m10, p), _sub_mul(m01, quotient, m11, p)))
+
+
+def _half_gcd(a, b, p):
+    """
+    deg a >= deg b。返回 2x2 矩阵 M (若干步欧几里得算法的乘积)，
+    使得 M * (a, b) = (c, d) 满足 deg c >= ceil(deg a / 2) > deg d。
+    只用 a、b 的高半部分递归，矩阵的次数不超过 deg a / 2。
+    """
+    half = len(a) // 2 # ceil(deg a / 2)
+    identity = (([1], []), ([], [1]))
+    if len(b) - 1 < half:
+        return identity
+    if len(a) <= _HALF_GCD_THRESHOLD:
+        matrix = identity
+        while len(b) - 1 >= half:
+            quotient, remainder = divmod_mod(a, b, p)
+            a, b = b, remainder
+            matrix = _euclid_step(matrix, quotient, p)
+        return matrix
+    # 高半部分的商序列与整体的商序列一致，直到余式的次数降到 half 附近
+    matrix = _half_gcd(a[half:], b[half:], p)
+    a, b = _matrix_apply(matrix, a, b, p)
+    if len(b) - 1 < half:
+        return matrix
+    quotient, remainder = divmod_mod(a, b, p)
+    a, b = b, remainder
+    matrix = _euclid_step(matrix, quotient, p)
+    if len(b) - 1 < half:
+        return matrix
+    shift = 2 * half - (len(a) - 1)
+    return _matrix_mul(_half_gcd(a[shift:], b[shift:], p), matrix, p)
+
+
+def _gcdex_mod_p(a, b, p):
+    """F_p 上的扩展欧几里得：返回 (s, t, g)，g 首一，s*a + t*b = g。a、b 不全为零。"""
+    if len(a) < len(b):
+        t, s, g = _gcdex_mod_p(b, a, p)
+        return s, t, g
+    matrix = (([1], []), ([], [1]))
+    while b:
+        if len(a) > _HALF_GCD_THRESHOLD:
+            step = _half_gcd(a, b, p)
+            a, b = _matrix_apply(step, a, b, p)
+            matrix = _matrix_mul(step, matrix, p)
+            if not b:
+                break
+        quotient, remainder = divmod_mod(a, b, p)
+        a, b = b, remainder
+        matrix = _euclid_step(matrix, quotient, p)
+    inverse = pow(a[-1], -1, p)
+    (s, t), _ = matrix
+    return ([c * inverse % p for c in s], [c * inverse % p for c in t], [c * inverse % p for c in a])
+
+
+def _rational_reconstruction(values, modulus):
+    """
+    把模 modulus 的一组余数还原为分子、分母都不超过 sqrt(modulus / 2) 的有理数；失败时返回 None。
+    各个系数的分母通常相同，先乘上已经得到的公分母，多数系数不需要再做一次欧几里得算法。
+    """
+    bound = math.isqrt(modulus // 2)
+    denominator = 1
+    result = []
+    for value in values:
+        value = value * denominator % modulus
+        if value > modulus // 2:
+            value -= modulus
+        if abs(value) > bound:
+            r0, r1 = modulus, value % modulus
+            s0, s1 = 0, 1
+            while r1 > bound:
+                q = r0 // r1
+                r0, r1 = r1, r0 - q * r1
+                s0, s1 = s1, s0 - q * s1
+            if s1 == 0 or abs(s1) * denominator > bound or math.gcd(r1, s1) != 1:
+                return None
+            if s1 < 0:
+                r1, s1 = -r1, -s1
+            value = r1
+            denominator *= s1
+        result.append(Fraction(value, denominator))
+    return result
+
+
+def _dense_to_polynomial(values):
+    return Polynomial._from_terms({exp: value for exp, value in enumerate(values) if value})
+
+
+def polynomial_gcdex(a: Polynomial, b: Polynomial):
+    """
+    扩展欧几里得算法：返回 (s, t, g)，g = gcd(a, b) 为首一多项式，s*a + t*b = g，
+    并且 deg s < deg b - deg g、deg t < deg a - deg g (与 sympy.gcdex 相同)。
+    a、b 都是零多项式时返回三个零多项式。
+    内部模大素数计算 (见上面的说明)，系数不会像有理数域上的欧几里得算法那样膨胀。
+    """
+    if not isinstance(a, Polynomial) or not isinstance(b, Polynomial):
+        raise TypeError("输入必须是 Polynomial 对象")
+    if a.is_zero() or b.is_zero():
+        if a.is_zero() and b.is_zero():
+            return Polynomial(), Polynomial(), Polynomial()
+        nonzero = b if a.is_zero() else a
+        inverse = Fraction(1) / nonzero._leading_term()[1]
+        cofactor = Polynomial({0: inverse})
+        monic = nonzero * inverse
+        return (cofactor, Polynomial(), monic) if nonzero is a else (Polynomial(), cofactor, monic)
+
+    content_a, int_a = to_integer_list(a)
+    content_b, int_b = to_integer_list(b)
+    if len(int_a) == 1 or len(int_b) == 1:
+        # 其中一个是非零常数：gcd = 1，由次数条件，系数落在常数的那一边 (两个都是常数时取 t)
+        if len(int_b) == 1:
+            return Polynomial(), Polynomial({0: Fraction(1) / b.terms[0]}), Polynomial({0: 1})
+        return Polynomial({0: Fraction(1) / a.terms[0]}), Polynomial(), Polynomial({0: 1})
+
+    budget = current_budget()
+    gcd_length = None
+    modulus = 1
+    images = None
+    for p in _iter_modular_primes():
+        if budget is not None:
+            budget.check_time()
+        if int_a[-1] % p == 0 or int_b[-1] % p == 0:
+            continue
+        s, t, g = _gcdex_mod_p([c % p for c in int_a], [c % p for c in int_b], p)
+        if gcd_length is not None and len(g) > gcd_length:
+            continue # 不幸运的素数
+        # b 整除 a 时 s = 0、t 为常数 (反之亦然)，所以 s、t 至少各留一个系数
+        lengths = (max(len(int_b) - len(g), 1), max(len(int_a) - len(g), 1), len(g))
+        current = [c for part, length in zip((s, t, g), lengths) for c in part + [0] * (length - len(part))]
+        if gcd_length is None or len(g) < gcd_length:
+            # 之前的素数都不幸运，重新开始
+            gcd_length, modulus, images = len(g), p, current
+        else:
+            # 中国剩余定理：x = images (mod modulus)，x = current (mod p)
+            factor = pow(modulus, -1, p)
+            images = [old + modulus * ((new - old) * factor % p) for old, new in zip(images, current)]
+            modulus *= p
+
+        values = _rational_reconstruction(images, modulus)
+        if values is None:
+            continue
+        s_values = values[:lengths[0]]
+        t_values = values[lengths[0]:lengths[0] + lengths[1]]
+        g_values = values[lengths[0] + lengths[1]:]
+        # 在整数上精确验证 s*a + t*b = g，以及 g 整除 a、b
+        denominator, integers = integer_combination(values)
+        int_s = integers[:lengths[0]]
+        int_t = integers[lengths[0]:lengths[0] + lengths[1]]
+        int_g = integers[lengths[0] + lengths[1]:]
+        if trim(addp(exact_mul(int_s, int_a), exact_mul(int_t, int_b))) != int_g:
+            continue
+        if gcd_length > 1:
+            primitive_g = primitive(int_g)
+            if exact_division(int_a, primitive_g) is None or exact_division(int_b, primitive_g) is None:
+                continue
+        return (_dense_to_polynomial(s_values) * (Fraction(1) / content_a),
+                _dense_to_polynomial(t_values) * (Fraction(1) / content_b),
+                _dense_to_polynomial(g_values))
+
+
+def polynomial_invert(a: Polynomial, m: Polynomial) -> Polynomial:
+    """
+    求 a 模 m 的逆元：返回次数小于 deg m 的 s，使得 s*a = 1 (mod m)。
+    a 与 m 不互素时抛出 ValueError。
+    """
+    if not isinstance(a, Polynomial) or not isinstance(m, Polynomial):
+        raise TypeError("输入必须是 Polynomial 对象")
+    if m.degree() < 1:
+        raise ValueError("模多项式的次数必须大于 0")
+    s, _, g = polynomial_gcdex(a, m)
+    if g.degree() != 0:
+        raise ValueError("多项式与模多项式不互素，逆元不存在")
+    return s
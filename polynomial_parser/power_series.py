@@ -0,0 +1,317 @@
+# polynomial_parser/power_series.py
+
+from fractions import Fraction
+from math import isqrt
+
+from .budget import current_budget
+from .polynomial import Polynomial
+
+# --- 截断幂级数 ---
+#
+# PowerSeries(poly, precision) 表示 poly + O(x^precision)：只有前 precision 个系数是已知的，
+# 运算结果的精度取两个操作数中较小的一个 (Polynomial、int、Fraction 视为精确值)。
+# 内部用 Fraction 的稠密列表 (低次在前)，乘法先通分成整系数，再交给 Kronecker 代换 (一次大整数乘法)。
+#
+# 倒数、对数、指数、平方根都用 Newton 迭代，每一轮精度翻倍：
+#   倒数     g <- g - g (f g - 1)              (f g - 1 的低 k 项为零，只需乘高半部分)
+#   对数     log f = 积分 (f' / f)，f(0) = 1
+#   指数     g <- g (1 + f - log g)，f(0) = 0
+#   平方根   先求 h = 1 / sqrt(f)：h <- h + h (1 - f h^2) / 2，最后 sqrt(f) = f h
+# 总代价是常数个截断乘法，而不是逐项递推的 O(n^2) 次有理数运算。
+#
+# point 不为 0 时级数按 (x - point) 的幂展开 (见 FractionalPolynomial.to_series)；
+# 只有展开点相同的级数才能相互运算。
+
+
+def _mul(a, b, n):
+    """a * b mod x^n，a、b 为 Fraction 列表 (低次在前)。"""
+    from .int_poly import exact_mul, integer_combination
+    a = a[:n]
+    b = b[:n]
+    if not any(a) or not any(b):
+        return []
+    da, ia = integer_combination(a)
+    db, ib = integer_combination(b)
+    denominator = da * db
+    return [Fraction(c, denominator) for c in exact_mul(ia, ib)[:n]]
+
+
+def _add(a, b, sign=1):
+    if len(a) < len(b):
+        a = a + [Fraction(0)] * (len(b) - len(a))
+    return [c + sign * b[i] if i < len(b) else c for i, c in enumerate(a)]
+
+
+def _valuation(a):
+    """a 中第一个非零系数的下标；全为零时返回 None。"""
+    for i, c in enumerate(a):
+        if c:
+            return i
+    return None
+
+
+def _inverse(f, n):
+    """1 / f mod x^n，f[0] != 0。"""
+    g = [1 / f[0]]
+    k = 1
+    while k < n:
+        new_k = min(2 * k, n)
+        # f g = 1 + x^k e，e 只需要 new_k - k 项
+        e = _mul(f, g, new_k)[k:]
+        correction = _mul(g, e, new_k - k)
+        g = g + [-c for c in correction] + [Fraction(0)] * (new_k - k - len(correction))
+        k = new_k
+    return g[:n]
+
+
+def _derivative(a):
+    return [i * c for i, c in enumerate(a)][1:]
+
+
+def _integral(a):
+    return [Fraction(0)] + [c / (i + 1) for i, c in enumerate(a)]
+
+
+def _log(f, n):
+    """log f mod x^n，f[0] == 1。"""
+    if n <= 1:
+        return [Fraction(0)] * n
+    quotient = _mul(_derivative(f), _inverse(f, n - 1), n - 1)
+    return _integral(quotient + [Fraction(0)] * (n - 1 - len(quotient)))
+
+
+def _exp(f, n):
+    """exp f mod x^n，f[0] == 0。"""
+    g = [Fraction(1)]
+    k = 1
+    while k < n:
+        k = min(2 * k, n)
+        # 1 + f - log g 的低位与 1 相同
+        difference = _add(f[:k], _log(g, k), -1)
+        difference[0] += 1
+        g = _mul(g, difference, k)
+    return g[:n]
+
+
+def _rational_sqrt(value):
+    """有理数的精确平方根，不是完全平方时返回 None。"""
+    if value < 0:
+        return None
+    numerator = isqrt(value.numerator)
+    denominator = isqrt(value.denominator)
+    if numerator * numerator != value.numerator or denominator * denominator != value.denominator:
+        return None
+    return Fraction(numerator, denominator)
+
+
+def _sqrt(f, n):
+    """sqrt f mod x^n，f[0] 是非零的有理数平方，结果的常数项取正。"""
+    h = [1 / _rational_sqrt(f[0])]
+    k = 1
+    while k < n:
+        new_k = min(2 * k, n)
+        # 1 - f h^2 的低 k 项为零
+        e = _mul(f, _mul(h, h, new_k), new_k)[k:]
+        correction = _mul(h, e, new_k - k)
+        h = h + [-c / 2 for c in correction] + [Fraction(0)] * (new_k - k - len(correction))
+        k = new_k
+    return _mul(f, h, n)
+
+
+class PowerSeries:
+    def __init__(self, poly, precision, point=0):
+        """
+        截断幂级数 poly + O((x - point)^precision)。
+        poly: Polynomial、int 或 Fraction，高于 precision - 1 次的项被舍去；
+        precision: 非负整数，已知系数的个数。
+        """
+        if not isinstance(precision, int) or precision < 0:
+            raise ValueError("幂级数的精度必须是非负整数")
+        if isinstance(poly, (int, Fraction)):
+            poly = Polynomial({0: poly})
+        elif not isinstance(poly, Polynomial):
+            raise TypeError(f"无法将类型 {type(poly)} 转换为 PowerSeries")
+        budget = current_budget()
+        if budget is not None:
+            budget.check_degree(precision - 1)
+        values = [Fraction(0)] * precision
+        for exp, coeff in poly.terms.items():
+            if exp < precision:
+                values[exp] = coeff
+        self._values = values
+        self.precision = precision
+        self.point = Fraction(point)
+
+    @classmethod
+    def _from_values(cls, values, precision, point):
+        """由系数列表直接构造 (不足 precision 项的部分补零，多余的舍去)。"""
+        series = cls.__new__(cls)
+        values = list(values[:precision])
+        values.extend([Fraction(0)] * (precision - len(values)))
+        series._values = values
+        series.precision = precision
+        series.point = point
+        return series
+
+    def coefficients(self):
+        """前 precision 个系数 (Fraction 列表，低次在前)。"""
+        return list(self._values)
+
+    def to_polynomial(self):
+        """去掉 O(...) 之后的多项式 (point 不为 0 时是关于 x - point 的多项式)。"""
+        return Polynomial._from_terms({exp: coeff for exp, coeff in enumerate(self._values) if coeff})
+
+    def __str__(self):
+        variable = "x" if self.point == 0 else f"(x - {self.point})" if self.point > 0 else f"(x + {-self.point})"
+        parts = []
+        for exp, coeff in enumerate(self._values):
+            if not coeff:
+                continue
+            power = "" if exp == 0 else variable if exp == 1 else f"{variable}^{exp}"
+            magnitude = abs(coeff)
+            if not power:
+                term = str(magnitude)
+            elif magnitude == 1:
+                term = power
+            else:
+                term = f"{magnitude}*{power}"
+            if parts:
+                parts.append(f" - {term}" if coeff < 0 else f" + {term}")
+            else:
+                parts.append(f"-{term}" if coeff < 0 else term)
+        if self.precision == 0:
+            order = "O(1)"
+        elif self.precision == 1:
+            order = f"O({variable.strip('()')})"
+        else:
+            order = f"O({variable}^{self.precision})"
+        if parts:
+            return "".join(parts) + f" + {order}"
+        return order
+
+    def __repr__(self):
+        return f"PowerSeries({self})"
+
+    # --- 算术运算 ---
+
+    def _coerce(self, other):
+        """other -> PowerSeries (精确值按 self 的精度截断)；不支持的类型返回 None。"""
+        if isinstance(other, PowerSeries):
+            if other.point != self.point:
+                raise ValueError("展开点不同的幂级数不能一起运算")
+            return other
+        if isinstance(other, (Polynomial, int, Fraction)):
+            return PowerSeries(other, self.precision, self.point)
+        return None
+
+    def __add__(self, other):
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        precision = min(self.precision, other.precision)
+        return PowerSeries._from_values(_add(self._values[:precision], other._values[:precision]),
+                                        precision, self.point)
+
+    def __radd__(self, other):
+        return self + other
+
+    def __neg__(self):
+        return PowerSeries._from_values([-c for c in self._values], self.precision, self.point)
+
+    def __sub__(self, other):
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __mul__(self, other):
+        if isinstance(other, (int, Fraction)):
+            return PowerSeries._from_values([c * other for c in self._values], self.precision, self.point)
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        precision = min(self.precision, other.precision)
+        return PowerSeries._from_values(_mul(self._values, other._values, precision), precision, self.point)
+
+    def __rmul__(self, other):
+        return self * other
+
+    def __truediv__(self, other):
+        """
+        除法 self * (1 / other)。other 的常数项为零时，self 必须含有至少同样多的 (x - point) 因子，
+        两边同时约去后再相除，结果的精度相应减少。
+        """
+        if isinstance(other, (int, Fraction)):
+            if other == 0:
+                raise ValueError("除数不能是零")
+            return self * (1 / Fraction(other))
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        precision = min(self.precision, other.precision)
+        shift = _valuation(other._values[:precision])
+        if shift is None:
+            raise ValueError("除数在当前精度下为零")
+        if shift:
+            own = _valuation(self._values[:precision])
+            if own is not None and own < shift:
+                raise ValueError(f"在 x = {self.point} 处有极点，不能展开为幂级数")
+            precision -= shift
+        numerator = self._values[shift:shift + precision]
+        denominator = other._values[shift:shift + precision]
+        return PowerSeries._from_values(_mul(numerator, _inverse(denominator, precision), precision),
+                                        precision, self.point)
+
+    def __rtruediv__(self, other):
+        if isinstance(other, (Polynomial, int, Fraction)):
+            return PowerSeries(other, self.precision, self.point) / self
+        return NotImplemented
+
+    # --- Newton 迭代 ---
+
+    def inverse(self):
+        """1 / self；常数项必须不为零。"""
+        if self.precision and not self._values[0]:
+            raise ValueError("常数项为零的幂级数不可逆")
+        if not self.precision:
+            return self
+        return PowerSeries._from_values(_inverse(self._values, self.precision), self.precision, self.point)
+
+    def log(self):
+        """log(self)；常数项必须为 1 (其他常数的对数不是有理数)。"""
+        if self.precision and self._values[0] != 1:
+            raise ValueError("对数要求幂级数的常数项为 1")
+        return PowerSeries._from_values(_log(self._values, self.precision), self.precision, self.point)
+
+    def exp(self):
+        """exp(self)；常数项必须为 0 (其他常数的指数不是有理数)。"""
+        if self.precision and self._values[0] != 0:
+            raise ValueError("指数要求幂级数的常数项为 0")
+        return PowerSeries._from_values(_exp(self._values, self.precision), self.precision, self.point)
+
+    def sqrt(self):
+        """
+        平方根 (常数项取正)。最低的非零项必须是 (x - point) 的偶数次幂，且系数是有理数的平方；
+        以 (x - point)^(2m) 开头时结果的精度减少 m。
+        """
+        shift = _valuation(self._values)
+        if shift is None:
+            # 在当前精度下为零：sqrt(O(x^n)) = O(x^(n/2))
+            return PowerSeries._from_values([], (self.precision + 1) // 2, self.point)
+        if shift % 2 or _rational_sqrt(self._values[shift]) is None:
+            raise ValueError("平方根要求最低次项为偶数次，且系数是有理数的平方")
+        half = shift // 2
+        precision = self.precision - half
+        root = _sqrt(self._values[shift:], precision - half)
+        return PowerSeries._from_values([Fraction(0)] * half + root, precision, self.point)
+
+    def derivative(self):
+        """逐项求导，精度减一。"""
+        return PowerSeries._from_values(_derivative(self._values), max(self.precision - 1, 0), self.point)
+
+    def integral(self):
+        """逐项积分 (常数项为 0)，精度加一。"""
+        return PowerSeries._from_values(_integral(self._values), self.precision + 1, self.point)
@@ -0,0 +1,294 @@
+# polynomial_parser/real_roots.py
+
+import math
+from fractions import Fraction
+
+from .polynomial import Polynomial
+from .int_poly import exact_division, is_square_free, primitive, taylor_shift_one, to_integer_list
+
+# --- 实根隔离 (Descartes / Vincent-Collins-Akritas 二分法) ---
+#
+# real_roots(poly) 把 poly 的每个不同实根放进一个互不相交的有理区间：
+#   1. 取本原整系数的无平方部分 (模一个素数检查已经无平方因子时直接使用，否则用无平方分解)，
+#      x = 0 单独处理；负根通过 f(-x) 转化为正根
+#   2. 正根分为 (0, 1) 中的根、x = 1 以及 (1, +inf) 中的根；后者是 x^n f(1/x) 在 (0, 1) 中的根的倒数，
+#      无界的一端用 Fujiwara 界代替。这样不必把系数放大 2^(K*i) 倍
+#   3. 对 (0, 1) 上的多项式 f 做 Descartes 检验：(x+1)^n f(1/(x+1)) 的系数变号次数 v
+#      是 (0, 1) 中根的个数的上界，且与根数同奇偶。v = 0 时没有根，v = 1 时恰有一个根，
+#      否则二分：左半 2^n f(x/2)，右半 2^n f((x+1)/2)；正好落在中点的根在右半的 x = 0 处被发现
+#   4. 需要时用二分法 (整数上精确判断符号) 把区间细化到给定宽度
+#
+# 多项式用整数列表表示 (低次在前)。Taylor 平移 f(x+1) 见 int_poly.taylor_shift_one。
+
+
+def _sign_variations(coefficients):
+    count = 0
+    previous = 0
+    for c in coefficients:
+        if c:
+            if (c > 0) != (previous > 0) and previous:
+                count += 1
+            previous = c
+    return count
+
+
+def _descartes_bound(f):
+    """(0, 1) 中根的个数的 Descartes 上界。"""
+    return _sign_variations(taylor_shift_one(f[::-1]))
+
+
+def _remove_power_of_two(f):
+    shift = min((c & -c).bit_length() - 1 for c in f if c)
+    return [c >> shift for c in f] if shift else f
+
+
+def _root_bound(f):
+    """2 的幂 B，使 f 的所有正根都小于 B (Fujiwara 界)。"""
+    n = len(f) - 1
+    lead = abs(f[-1]).bit_length()
+    exponent = None
+    for i, c in enumerate(f[:-1]):
+        if c:
+            # |c / lc| < 2^(bits(c) - bits(lc) + 1)，取 n-i 次方根
+            candidate = -((lead - abs(c).bit_length() - 1) // (n - i))
+            exponent = candidate if exponent is None else max(exponent, candidate)
+    return Fraction(2) ** (exponent + 2)
+
+
+def _unit_roots(f):
+    """
+    f 无平方因子、f(0) != 0。返回 (0, 1) 中的根的隔离区间 [(a, b), ...]，a == b 表示有理根。
+    栈中的 (f, c, k) 表示区间 (c/2^k, (c+1)/2^k)，f 已经把这个区间变换到 (0, 1)。
+    """
+    result = []
+    stack = [(f, 0, 0)]
+    while stack:
+        f, c, k = stack.pop()
+        if f[0] == 0:
+            # 上一层区间的中点恰好是根
+            result.append((Fraction(c, 1 << k),) * 2)
+            f = f[1:]
+        variations = _descartes_bound(f)
+        if variations == 0:
+            continue
+        if variations == 1:
+            result.append((Fraction(c, 1 << k), Fraction(c + 1, 1 << k)))
+            continue
+        n = len(f) - 1
+        left = _remove_power_of_two([coeff << (n - i) for i, coeff in enumerate(f)])
+        right = taylor_shift_one(left)
+        stack.append((right, 2 * c + 1, k + 1))
+        stack.append((left, 2 * c, k + 1))
+    return result
+
+
+def _positive_roots(f):
+    """f 的正根的隔离区间 [(a, b), ...]，a、b 为 Fraction，a == b 表示有理根。"""
+    if len(f) < 2:
+        return []
+    intervals = _unit_roots(f)
+    if sum(f) == 0:
+        intervals.append((Fraction(1), Fraction(1)))
+    bound = None
+    for a, b in _unit_roots(f[::-1]):
+        if a == 0:
+            bound = bound or _root_bound(f)
+            intervals.append((1 / b, bound))
+        else:
+            intervals.append((1 / b, 1 / a))
+    return intervals
+
+
+def _sign_at(f, value):
+    """f 在有理数 value 处的符号 (齐次 Horner，只做整数运算)。"""
+    numerator, denominator = value.numerator, value.denominator
+    result = 0
+    power = 1
+    for c in reversed(f):
+        result = result * numerator + c * power
+        power *= denominator
+    # result = f(value) * denominator^n，denominator > 0
+    return (result > 0) - (result < 0)
+
+
+def _derivative(f):
+    return [i * c for i, c in enumerate(f)][1:]
+
+
+def _refine(f, interval, eps):
+    """二分 (a, b) 直到宽度不超过 eps；(a, b) 中恰有 f 的一个单根。"""
+    a, b = interval
+    if a == b or b - a <= eps:
+        return interval
+    sign_a = _sign_at(f, a)
+    if sign_a == 0:
+        # a 是另一个 (单) 根，紧挨 a 右侧的符号与 f'(a) 相同
+        sign_a = _sign_at(_derivative(f), a)
+    while b - a > eps:
+        middle = (a + b) / 2
+        sign = _sign_at(f, middle)
+        if sign == 0:
+            return (middle, middle)
+        if sign == sign_a:
+            a = middle
+        else:
+            b = middle
+    return (a, b)
+
+
+def real_roots(poly, eps=None):
+    """
+    隔离 poly 的全部不同实根，返回按从小到大排列的区间 [(a, b), ...] (a、b 为 Fraction)：
+    a < b 时开区间 (a, b) 中恰有一个实根，a == b 时 a 就是一个有理根。
+    eps 不为 None 时把每个区间二分到宽度不超过 eps。
+    """
+    if poly.is_zero():
+        raise ValueError("零多项式的实根不能隔离")
+    if eps is not None and eps <= 0:
+        raise ValueError("区间宽度必须为正数")
+    if poly.is_constant():
+        return []
+
+    _, f = to_integer_list(poly)
+    if not is_square_free(f):
+        square_free = Polynomial({0: 1})
+        for factor, _ in poly.square_free_decomposition():
+            square_free = square_free * factor
+        _, f = to_integer_list(square_free)
+
+    intervals = []
+    if f[0] == 0:
+        # 无平方因子，x = 0 至多是一重根
+        intervals.append((Fraction(0), Fraction(0)))
+        f = f[1:]
+    intervals.extend(_positive_roots(f))
+    reflected = [-c if i % 2 else c for i, c in enumerate(f)]
+    intervals.extend((-b, -a) for a, b in _positive_roots(reflected))
+    intervals.sort()
+    if eps is not None:
+        eps = Fraction(eps)
+        intervals = [_refine(f, interval, eps) for interval in intervals]
+    return intervals
+
+
+# --- Sturm 序列与实根计数 ---
+#
+# Sturm 序列 p0 = f, p1 = f', p(i+1) = -rem(p(i-1), p(i))。对任意 a < b，
+# V(a) - V(b) 等于 (a, b] 中 f 的不同实根的个数 (V(x) 为序列在 x 处去掉零之后的变号次数)。
+# f 有重根时序列的最后一项是 gcd(f, f')，把每一项都除以它，得到无平方部分的 Sturm 序列。
+# 序列中的多项式只在乎符号，因此每一项可以乘以任意正数：
+#   用 |lc|^(deg a - deg b + 1) 倍的伪除法在整数上求余式 (不出现分数)，再除以正的容度。
+# 计数时先收集所有区间的不同端点，逐个系数对所有端点同时做齐次 Horner，
+# 每个端点处的变号数只计算一次，供共用这个端点的区间使用。
+
+
+def _negative_pseudo_remainder(a, b):
+    """-|lc(b)|^(deg a - deg b + 1) * (a mod b) 的本原部分 (整数列表，低次在前；余式为零时返回 [])。"""
+    lead = b[-1]
+    scale = abs(lead)
+    sign = 1 if lead > 0 else -1
+    shift_limit = len(b) - 1
+    r = list(a)
+    for top in range(len(r) - 1, shift_limit - 1, -1):
+        # scale * r - (sign * r[top]) * x^(top - deg b) * b 消去 x^top 项
+        factor = sign * r[top]
+        offset = top - shift_limit
+        r = [scale * c for c in r[:top]]
+        if factor:
+            for i, c in enumerate(b[:-1]):
+                r[offset + i] -= factor * c
+    while r and r[-1] == 0:
+        r.pop()
+    if not r:
+        return r
+    content = 0
+    for c in r:
+        content = math.gcd(content, c)
+    return [-c // content for c in r]
+
+
+def sturm_sequence(poly):
+    """
+    poly 的 Sturm 序列，整数列表 (低次在前) 的元组；每一项与有理数上的 Sturm 序列只差一个正的常数因子。
+    poly 有重根时返回的是它的无平方部分的 Sturm 序列 (各项都除以了 gcd(poly, poly'))。
+    """
+    if poly.is_zero():
+        raise ValueError("零多项式没有 Sturm 序列")
+    content, f = to_integer_list(poly)
+    if content < 0:
+        # to_integer_list 使主项系数为正，把符号放回来
+        f = [-c for c in f]
+    sequence = [f]
+    if len(f) > 1:
+        g = _derivative(f)
+        content = 0
+        for c in g:
+            content = math.gcd(content, c)
+        sequence.append([c // content for c in g])
+        while len(sequence[-1]) > 1:
+            r = _negative_pseudo_remainder(sequence[-2], sequence[-1])
+            if not r:
+                break
+            sequence.append(r)
+        if len(sequence[-1]) > 1:
+            # 最后一项是 gcd(f, f') (差一个常数)，在 f 的重根处整个序列都为零；
+            # 全部除以它 (主项系数取正，不改变符号)，得到无平方部分的 Sturm 序列
+            g = primitive(sequence[-1])
+            sequence = [exact_division(f, g) for f in sequence]
+    return tuple(sequence)
+
+
+def _signs_at(f, points):
+    """f 在多个有理点处的符号；points 为 [(numerator, denominator), ...]，denominator > 0。"""
+    numerators = [numerator for numerator, _ in points]
+    denominators = [denominator for _, denominator in points]
+    lead = f[-1]
+    values = [lead] * len(points)
+    powers = denominators
+    for c in reversed(f[:-1]):
+        # values = f 的前几项在各点处的齐次值，powers = denominator^(已处理的项数)
+        if c:
+            values = [v * u + c * p for v, u, p in zip(values, numerators, powers)]
+        else:
+            values = [v * u for v, u in zip(values, numerators)]
+        powers = [p * d for p, d in zip(powers, denominators)]
+    return [(v > 0) - (v < 0) for v in values]
+
+
+def _variations_at_infinity(sequence, direction):
+    signs = []
+    for f in sequence:
+        sign = 1 if f[-1] > 0 else -1
+        signs.append(-sign if direction < 0 and len(f) % 2 == 0 else sign)
+    return _sign_variations(signs)
+
+
+def count_real_roots_many(poly, intervals, sequence=None):
+    """
+    对每个区间 (a, b) 计算 poly 在半开区间 (a, b] 中不同实根的个数，返回整数列表。
+    a 为 None 表示 -inf，b 为 None 表示 +inf；a、b 可以是 int、Fraction 或 float (按精确值)。
+    sequence 为 poly 的 Sturm 序列 (省略时重新计算)。
+    """
+    if sequence is None:
+        sequence = sturm_sequence(poly)
+    bounds = []
+    points = set()
+    for a, b in intervals:
+        a = None if a is None else Fraction(a)
+        b = None if b is None else Fraction(b)
+        if a is not None and b is not None and a > b:
+            raise ValueError("区间左端点不能大于右端点")
+        bounds.append((a, b))
+        points.update(value for value in (a, b) if value is not None)
+
+    points = sorted(points)
+    keys = [(value.numerator, value.denominator) for value in points]
+    # signs[i][j]: 第 i 个多项式在第 j 个端点处的符号
+    signs = [_signs_at(f, keys) for f in sequence] if keys else []
+    variations = {value: _sign_variations([row[j] for row in signs]) for j, value in enumerate(points)}
+    at_minus_infinity = _variations_at_infinity(sequence, -1)
+    at_plus_infinity = _variations_at_infinity(sequence, 1)
+    return [
+        (at_minus_infinity if a is None else variations[a]) - (at_plus_infinity if b is None else variations[b])
+        for a, b in bounds
+    ]
@@ -0,0 +1,216 @@
+# polynomial_parser/serialization.py
+
+from fractions import Fraction
+from math import gcd
+
+from .polynomial import Polynomial
+from .fractional_polynomial import FractionalPolynomial
+
+# --- 紧凑二进制序列化 ---
+#
+# 格式 (版本 1)：
+#   version: 1 字节
+#   object:  tag (1 字节) + 内容
+#
+#   TAG_POLY_DENSE   varint 次数+1 (n)，varint 公分母 D，随后 n 个 zigzag varint 系数 (从常数项开始)
+#   TAG_POLY_SPARSE  varint 项数 (m)，varint 公分母 D，随后 m 对 (varint 指数增量, zigzag varint 系数)
+#   TAG_FRACTION     分子 object + 分母 object
+#   TAG_TERMS        varint 项数，随后逐个 object (用于裂项结果列表)
+#
+# 系数 c 存为整数 c * D，D 是所有系数分母的最小公倍数。
+# 零多项式编码为 n = 0 的稠密多项式。
+
+FORMAT_VERSION = 1
+
+TAG_POLY_DENSE = 1
+TAG_POLY_SPARSE = 2
+TAG_FRACTION = 3
+TAG_TERMS = 4
+
+
+# --- varint / zigzag ---
+
+def _write_varint(out, value):
+    """无符号 LEB128。"""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _write_zigzag(out, value):
+    """有符号整数先做 zigzag 映射 (0, -1, 1, -2, ... -> 0, 1, 2, 3, ...) 再写 varint。"""
+    _write_varint(out, (value << 1) if value >= 0 else ((-value << 1) - 1))
+
+
+def _read_varint(buf, pos):
+    """从 buf[pos] 读取一个 varint，返回 (值, 新位置)。"""
+    byte = buf[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+    result = byte & 0x7F
+    shift = 7
+    pos += 1
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _read_zigzag(buf, pos):
+    value, pos = _read_varint(buf, pos)
+    return ((value >> 1) if not value & 1 else -((value + 1) >> 1)), pos
+
+
+# --- 编码 ---
+
+def _write_polynomial(out, poly):
+    terms = poly.terms
+    if not terms:
+        out.append(TAG_POLY_DENSE)
+        _write_varint(out, 0)
+        _write_varint(out, 1)
+        return
+
+    # 公分母：所有系数分母的最小公倍数
+    common = 1
+    for coeff in terms.values():
+        den = coeff.denominator
+        if den != 1:
+            common = common // gcd(common, den) * den
+
+    degree = max(terms)
+    # 非零项不到一半时稀疏编码更短
+    if len(terms) * 2 < degree + 1:
+        out.append(TAG_POLY_SPARSE)
+        _write_varint(out, len(terms))
+        _write_varint(out, common)
+        previous = 0
+        for exp in sorted(terms):
+            coeff = terms[exp]
+            _write_varint(out, exp - previous)
+            _write_zigzag(out, coeff.numerator * (common // coeff.denominator))
+            previous = exp
+    else:
+        out.append(TAG_POLY_DENSE)
+        _write_varint(out, degree + 1)
+        _write_varint(out, common)
+        for exp in range(degree + 1):
+            coeff = terms.get(exp)
+            if coeff is None:
+                out.append(0)
+            else:
+                _write_zigzag(out, coeff.numerator * (common // coeff.denominator))
+
+
+def _write_object(out, obj):
+    if isinstance(obj, FractionalPolynomial):
+        out.append(TAG_FRACTION)
+        _write_polynomial(out, obj.numerator)
+        _write_polynomial(out, obj.denominator)
+    elif isinstance(obj, Polynomial):
+        _write_polynomial(out, obj)
+    elif isinstance(obj, (list, tuple)):
+        out.append(TAG_TERMS)
+        _write_varint(out, len(obj))
+        for item in obj:
+            _write_object(out, item)
+    else:
+        raise TypeError(f"无法序列化类型 {type(obj)}")
+
+
+def dumps(obj) -> bytes:
+    """
+    将 Polynomial、FractionalPolynomial 或它们的列表编码为 bytes。
+    """
+    out = bytearray()
+    out.append(FORMAT_VERSION)
+    _write_object(out, obj)
+    return bytes(out)
+
+
+# --- 解码 ---
+
+def _read_polynomial(buf, pos, tag):
+    if tag != TAG_POLY_DENSE and tag != TAG_POLY_SPARSE:
+        raise ValueError(f"需要多项式，但得到序列化标记: {tag}")
+    poly = Polynomial.__new__(Polynomial)
+    terms = poly.terms = {}
+    count, pos = _read_varint(buf, pos)
+    common, pos = _read_varint(buf, pos)
+    if common == 0:
+        raise ValueError("序列化数据中的公分母为零")
+    if tag == TAG_POLY_DENSE:
+        for exp in range(count):
+            if buf[pos] == 0:
+                # 零系数只占一个字节
+                pos += 1
+                continue
+            value, pos = _read_zigzag(buf, pos)
+            terms[exp] = Fraction(value, common) if common != 1 else Fraction(value)
+    else:
+        exp = 0
+        for _ in range(count):
+            delta, pos = _read_varint(buf, pos)
+            exp += delta
+            value, pos = _read_zigzag(buf, pos)
+            terms[exp] = Fraction(value, common) if common != 1 else Fraction(value)
+    return poly, pos
+
+
+def _read_object(buf, pos):
+    tag = buf[pos]
+    pos += 1
+    if tag == TAG_POLY_DENSE or tag == TAG_POLY_SPARSE:
+        return _read_polynomial(buf, pos, tag)
+    if tag == TAG_FRACTION:
+        numerator, pos = _read_polynomial(buf, pos + 1, buf[pos])
+        denominator, pos = _read_polynomial(buf, pos + 1, buf[pos])
+        if not denominator.terms:
+            raise ValueError("序列化数据中的分母是零多项式")
+        # 只有最简分式会被编码，解码时无需再次约分
+        return FractionalPolynomial._from_reduced(numerator, denominator), pos
+    if tag == TAG_TERMS:
+        count, pos = _read_varint(buf, pos)
+        items = []
+        for _ in range(count):
+            item, pos = _read_object(buf, pos)
+            items.append(item)
+        return items, pos
+    raise ValueError(f"未知的序列化标记: {tag}")
+
+
+def loads_from(buffer, offset=0):
+    """
+    从 buffer 的 offset 处解码一个对象，返回 (对象, 结束位置)。
+
+    buffer 可以是 bytes、bytearray、memoryview 或 mmap；
+    解码直接读取缓冲区，不会复制其内容，适合从一个大文件中连续读取多条记录。
+    """
+    buf = buffer if isinstance(buffer, (bytes, bytearray)) else memoryview(buffer)
+    try:
+        version = buf[offset]
+        if version != FORMAT_VERSION:
+            raise ValueError(f"不支持的序列化版本: {version}")
+        return _read_object(buf, offset + 1)
+    except IndexError:
+        raise ValueError("序列化数据不完整")
+
+
+def loads(buffer, offset=0):
+    """解码 dumps 生成的数据，返回 Polynomial、FractionalPolynomial 或列表。"""
+    obj, _ = loads_from(buffer, offset)
+    return obj
+
+
+# pickle 通过模块级函数重建对象 (见 Polynomial.__reduce__ / FractionalPolynomial.__reduce__)
+
+def _polynomial_from_bytes(data):
+    return Polynomial.from_bytes(data)
+
+
+def _fractional_from_bytes(data):
+    return FractionalPolynomial.from_bytes(data)
@@ -0,0 +1,446 @@
+# polynomial_parser/server.py
+# 本地 HTTP/JSON 求解服务 (仅依赖标准库)：
+#   python -m polynomial_parser.server --port 8765 --workers 4 --queue-size 64
+#
+#   POST /simplify   {"expression": "..."}            -> {"simplified": ..., "single_fraction": ...}
+#   POST /decompose  {"expression": "..."}            -> {"partial_fractions": [...]}
+#   POST /evaluate   {"expression": "...", "x": "3/2"} -> {"value": "p/q", "float": ...}
+#   GET  /metrics                                     -> 各阶段延迟的 p50 / p99 以及计数
+#   GET  /health
+
+import argparse
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from fractions import Fraction
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .budget import Budget, BudgetExceeded
+
+# --- 工作进程中执行的函数 ---
+
+# 作为客户端错误 (HTTP 400) 返回的异常类型
+_CLIENT_ERRORS = (ValueError, SyntaxError, TypeError, ZeroDivisionError)
+
+
+def _warm_worker(cache_size, disk_path, warm_expressions):
+    """
+    工作进程启动时调用：配置缓存，预先导入裂项依赖并用语料预热缓存，
+    使第一个请求不必承担这些开销。
+    """
+    from . import configure_cache
+    from .partial_fraction import partial_fraction_decompose
+    from .apart import apart
+    from .factorization import factor
+    configure_cache(maxsize=cache_size, disk_path=disk_path)
+    if warm_expressions:
+        from . import _evaluate
+        for expression in warm_expressions:
+            try:
+                _evaluate(expression)
+            except _CLIENT_ERRORS:
+                pass
+
+
+def _noop():
+    return None
+
+
+def _simplify(request, stages):
+    from . import _evaluate
+    begin = time.perf_counter()
+    result = _evaluate(_expression_of(request))
+    stages['parse_evaluate'] = (time.perf_counter() - begin) * 1000
+    return result, {
+        'simplified': str(result),
+        'single_fraction': result.to_single_fraction_str(),
+    }
+
+
+def _decompose(request, stages):
+    # 与命令行、AsyncSolver 相同的路径：配置了磁盘缓存时裂项结果也从中读取 / 写回
+    from . import _evaluate_keyed, _decomposition_of
+    from .formatting import format_decomposed_terms
+    begin = time.perf_counter()
+    result, key = _evaluate_keyed(_expression_of(request), True)
+    stages['parse_evaluate'] = (time.perf_counter() - begin) * 1000
+    begin = time.perf_counter()
+    terms = format_decomposed_terms(_decomposition_of(result, key), 'x')
+    stages['decompose'] = (time.perf_counter() - begin) * 1000
+    return result, {'partial_fractions': terms}
+
+
+def _evaluate_at(request, stages):
+    if 'x' not in request:
+        raise ValueError("缺少求值点 \"x\"")
+    try:
+        point = Fraction(str(request['x']))
+    except (ValueError, ZeroDivisionError):
+        raise ValueError(f"无效的求值点: {request['x']}")
+    result, _ = _simplify(request, stages)
+    begin = time.perf_counter()
+    value = result.evaluate(point)
+    stages['evaluate_point'] = (time.perf_counter() - begin) * 1000
+    return result, {'x': str(point), 'value': str(value), 'float': float(value)}
+
+
+def _expression_of(request):
+    expression = request.get('expression')
+    if not isinstance(expression, str):
+        raise ValueError("请求必须包含字符串字段 \"expression\"")
+    return expression
+
+
+_ENDPOINTS = {
+    '/simplify': _simplify,
+    '/decompose': _decompose,
+    '/evaluate': _evaluate_at,
+}
+
+
+def _run_request(path, request, submitted_at, limits):
+    """
+    在工作进程中处理一个请求，返回 (HTTP 状态码, 响应对象, 各阶段耗时 (毫秒))。
+    所有异常都在这里转换为响应，工作进程不会因为单个请求出错而退出。
+    limits: Budget 的参数；超出预算的请求被中止并返回 422，工作进程可以立即处理下一个请求。
+    """
+    stages = {'queue': max(0.0, (time.time() - submitted_at) * 1000)}
+    try:
+        with Budget(**limits):
+            _, payload = _ENDPOINTS[path](request, stages)
+        return 200, payload, stages
+    except BudgetExceeded as e:
+        return 422, {'error': {'type': 'BudgetExceeded', 'limit': e.limit, 'message': str(e)}}, stages
+    except _CLIENT_ERRORS as e:
+        return 400, {'error': {'type': type(e).__name__, 'message': str(e)}}, stages
+    except Exception as e:
+        return 500, {'error': {'type': type(e).__name__, 'message': str(e)}}, stages
+
+
+# --- 延迟统计 ---
+
+class LatencyStats:
+    """按阶段记录最近 window 个样本的延迟 (毫秒)，按需计算分位数。"""
+    def __init__(self, window=10000):
+        self.window = window
+        self._samples = {}
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage, milliseconds):
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = deque(maxlen=self.window)
+            samples.append(milliseconds)
+            self._counts[stage] = self._counts.get(stage, 0) + 1
+
+    def snapshot(self):
+        """返回 {阶段: {count, p50, p99, max}}。"""
+        with self._lock:
+            copies = {stage: sorted(samples) for stage, samples in self._samples.items()}
+            counts = dict(self._counts)
+        return {
+            stage: {
+                'count': counts[stage],
+                'p50': _percentile(values, 0.50),
+                'p99': _percentile(values, 0.99),
+                'max': round(values[-1], 3),
+            }
+            for stage, values in copies.items()
+        }
+
+
+def _percentile(sorted_values, q):
+    """最近秩法分位数。"""
+    index = min(len(sorted_values) - 1, max(0, int(q * len(sorted_values) + 0.5) - 1))
+    return round(sorted_values[index], 3)
+
+
+# --- 服务 ---
+
+class ServiceOverloaded(Exception):
+    """排队的请求已满，新请求被拒绝 (HTTP 503)。"""
+
+
+class _WorkerPool:
+    """一组预先启动的工作进程及其有界的请求槽位。"""
+    def __init__(self, workers, queue_size, initargs):
+        self.workers = workers
+        self.capacity = workers + queue_size
+        self.slots = threading.BoundedSemaphore(self.capacity)
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker, initargs=initargs)
+        # 立即启动全部工作进程并等待预热完成，而不是在第一个请求到来时才启动
+        for future in [self.executor.submit(_noop) for _ in range(workers)]:
+            future.result()
+
+
+class SolverService:
+    """
+    预先启动的工作进程池 + 有界请求队列。
+
+    workers: 工作进程数；每个进程在启动时预热 (见 _warm_worker)，并保留自己的结果缓存。
+    queue_size: 除正在执行的请求外最多排队的请求数，超过时立即拒绝 (负载削减)。
+    request_timeout: 单个请求的时间限制 (秒)，同时作为工作进程中 Budget 的 timeout，
+                     超时的计算会在工作进程中被中止，而不是继续占用进程；None 表示不限时。
+    max_degree / max_coefficient_bits / max_terms: 每个请求的 Budget 限制 (None 表示不限制)。
+
+    准入控制：请求进入队列之前先用 estimate_bounds 估计结果大小 (只解析，不做多项式运算)。
+    估计的次数超过 admission_max_degree 或系数位数超过 admission_max_coefficient_bits 的请求
+    在有大任务进程池 (big_job_workers > 0) 时交给它处理，否则直接返回 422。
+    大任务进程池有自己的队列 (big_job_queue_size)，不会占用普通请求的工作进程。
+    """
+    def __init__(self, workers=2, queue_size=64, request_timeout=30.0,
+                 cache_size=1024, disk_cache_path=None, warm_expressions=(),
+                 max_degree=None, max_coefficient_bits=None, max_terms=None,
+                 admission_max_degree=None, admission_max_coefficient_bits=None,
+                 big_job_workers=0, big_job_queue_size=4, big_job_timeout=None):
+        if workers < 1:
+            raise ValueError("工作进程数必须是正整数")
+        if queue_size < 0 or big_job_queue_size < 0:
+            raise ValueError("队列长度不能为负数")
+        self.workers = workers
+        self.capacity = workers + queue_size
+        self.request_timeout = request_timeout
+        self.limits = {'max_degree': max_degree, 'max_coefficient_bits': max_coefficient_bits,
+                       'max_terms': max_terms, 'timeout': request_timeout}
+        self.admission_max_degree = admission_max_degree
+        self.admission_max_coefficient_bits = admission_max_coefficient_bits
+        self.stats = LatencyStats()
+        self._counter_lock = threading.Lock()
+        self.counters = {'requests': 0, 'rejected': 0, 'client_errors': 0, 'over_budget': 0,
+                         'not_admitted': 0, 'big_jobs': 0,
+                         'server_errors': 0, 'timeouts': 0, 'in_flight': 0}
+
+        initargs = (cache_size, disk_cache_path, tuple(warm_expressions))
+        self._pool = _WorkerPool(workers, queue_size, initargs)
+        self._big_pool = None
+        self._big_limits = None
+        if big_job_workers > 0:
+            self._big_pool = _WorkerPool(big_job_workers, big_job_queue_size, initargs)
+            # 大任务只放宽时间限制，次数 / 位数限制保持不变；request_timeout 为 None 时同样不限时
+            if big_job_timeout is None and request_timeout is not None:
+                big_job_timeout = request_timeout * 10
+            self._big_limits = dict(self.limits, timeout=big_job_timeout)
+
+    def _count(self, name, delta=1):
+        with self._counter_lock:
+            self.counters[name] += delta
+
+    def _admit(self, request):
+        """
+        估计请求结果的大小，返回 (是否为大任务, SizeBounds)。
+        没有设置准入阈值时不做估计，返回 (False, None)。
+        """
+        if self.admission_max_degree is None and self.admission_max_coefficient_bits is None:
+            return False, None
+        from .bounds import estimate_bounds
+        begin = time.perf_counter()
+        bounds = estimate_bounds(_expression_of(request))
+        self.stats.record('admission', (time.perf_counter() - begin) * 1000)
+        degree = max(bounds.numerator_degree, bounds.denominator_degree)
+        oversized = ((self.admission_max_degree is not None and degree > self.admission_max_degree) or
+                     (self.admission_max_coefficient_bits is not None and
+                      bounds.coefficient_bits > self.admission_max_coefficient_bits))
+        return oversized, bounds
+
+    def submit(self, path, request):
+        """
+        处理请求，返回 (HTTP 状态码, 响应对象)。
+        队列已满时抛出 ServiceOverloaded。
+        """
+        try:
+            oversized, bounds = self._admit(request)
+        except _CLIENT_ERRORS as e:
+            # 语法错误在准入阶段就能发现，不必占用工作进程
+            self._count('client_errors')
+            return 400, {'error': {'type': type(e).__name__, 'message': str(e)}}
+
+        pool, limits = self._pool, self.limits
+        if oversized:
+            if self._big_pool is None:
+                self._count('not_admitted')
+                return 422, {'error': {'type': 'NotAdmitted', 'message': "预计的结果规模超过服务限制",
+                                       'bounds': _bounds_to_json(bounds)}}
+            pool, limits = self._big_pool, self._big_limits
+            self._count('big_jobs')
+
+        if not pool.slots.acquire(blocking=False):
+            self._count('rejected')
+            raise ServiceOverloaded("服务繁忙，请稍后重试")
+        self._count('requests')
+        self._count('in_flight')
+        try:
+            future = pool.executor.submit(_run_request, path, request, time.time(), limits)
+            # 工作进程中的 Budget 会先于这里超时；这里多留的时间覆盖排队和进程间通信
+            wait = limits['timeout'] * 2 + 1 if limits['timeout'] is not None else None
+            try:
+                status, payload, stages = future.result(timeout=wait)
+            except FutureTimeoutError:
+                future.cancel()
+                self._count('timeouts')
+                return 504, {'error': {'type': 'TimeoutError', 'message': "请求处理超时"}}
+        finally:
+            self._count('in_flight', -1)
+            pool.slots.release()
+
+        for stage, milliseconds in stages.items():
+            self.stats.record(stage, milliseconds)
+        if status == 400:
+            self._count('client_errors')
+        elif status == 422:
+            self._count('over_budget')
+        elif status >= 500:
+            self._count('server_errors')
+        return status, payload
+
+    def metrics(self):
+        with self._counter_lock:
+            counters = dict(self.counters)
+        return {
+            'workers': self.workers,
+            'capacity': self.capacity,
+            'big_job_workers': self._big_pool.workers if self._big_pool is not None else 0,
+            'counters': counters,
+            'latency_ms': self.stats.snapshot(),
+        }
+
+    def close(self):
+        for pool in (self._pool, self._big_pool):
+            if pool is not None:
+                pool.executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _bounds_to_json(bounds):
+    """SizeBounds -> JSON 对象 (无法估计的项为 null)。"""
+    return {name: (None if value == float('inf') else value) for name, value in bounds._asdict().items()}
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server_version = "PolynomialSolver/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, payload, headers=()):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status, error_type, message, headers=()):
+        self._send_json(status, {'error': {'type': error_type, 'message': message}}, headers)
+
+    def do_GET(self):
+        service = self.server.service
+        if self.path == '/metrics':
+            self._send_json(200, service.metrics())
+        elif self.path == '/health':
+            self._send_json(200, {'status': 'ok'})
+        else:
+            self._error(404, 'NotFound', f"未知路径: {self.path}")
+
+    def do_POST(self):
+        begin = time.perf_counter()
+        service = self.server.service
+        if self.path not in _ENDPOINTS:
+            self._error(404, 'NotFound', f"未知路径: {self.path}")
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', ''))
+        except ValueError:
+            self._error(411, 'LengthRequired', "缺少 Content-Length")
+            return
+        if length > self.server.max_body_bytes:
+            self.close_connection = True
+            self._error(413, 'PayloadTooLarge', f"请求体超过 {self.server.max_body_bytes} 字节")
+            return
+        try:
+            request = json.loads(self.rfile.read(length))
+            if not isinstance(request, dict):
+                raise ValueError("请求体必须是 JSON 对象")
+        except ValueError as e:
+            self._error(400, 'ValueError', f"无效的 JSON 请求: {e}")
+            return
+
+        try:
+            status, payload = service.submit(self.path, request)
+        except ServiceOverloaded as e:
+            self._error(503, 'ServiceOverloaded', str(e), headers=[('Retry-After', '1')])
+            return
+        self._send_json(status, payload)
+        service.stats.record('total', (time.perf_counter() - begin) * 1000)
+
+
+class SolverHTTPServer(ThreadingHTTPServer):
+    """
+    每个连接一个线程接收请求；实际计算交给 SolverService 的工作进程池。
+    """
+    daemon_threads = True
+
+    def __init__(self, address, service, max_body_bytes=1 << 20, quiet=True):
+        self.service = service
+        self.max_body_bytes = max_body_bytes
+        self.quiet = quiet
+        super().__init__(address, _RequestHandler)
+
+
+def serve(host='127.0.0.1', port=8765, **service_options):
+    """启动服务并阻塞运行，直到 KeyboardInterrupt。"""
+    service = SolverService(**service_options)
+    server = SolverHTTPServer((host, port), service)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='本地 HTTP/JSON 多项式求解服务')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=2, help='工作进程数 (默认 2)')
+    parser.add_argument('--queue-size', type=int, default=64, help='最多排队的请求数，超过时返回 503 (默认 64)')
+    parser.add_argument('--timeout', type=float, default=30.0, help='单个请求的超时秒数 (默认 30)')
+    parser.add_argument('--max-degree', type=int, default=None, help='中间结果允许的最高次数')
+    parser.add_argument('--max-coefficient-bits', type=int, default=None, help='系数允许的最大位数')
+    parser.add_argument('--admission-max-degree', type=int, default=None,
+                        help='预计结果次数超过此值的请求不进入普通队列')
+    parser.add_argument('--admission-max-coefficient-bits', type=int, default=None,
+                        help='预计系数位数超过此值的请求不进入普通队列')
+    parser.add_argument('--big-job-workers', type=int, default=0,
+                        help='处理超过准入阈值的大任务的工作进程数；为 0 时直接拒绝这些请求 (默认 0)')
+    parser.add_argument('--disk-cache', default=None, help='可选的 SQLite 持久化缓存路径，所有工作进程共享')
+    parser.add_argument('--warm', default=None, help='可选的预热语料文件，每行一个表达式')
+    args = parser.parse_args(argv)
+
+    warm_expressions = ()
+    if args.warm:
+        with open(args.warm, encoding='utf-8') as f:
+            warm_expressions = tuple(line.strip() for line in f if line.strip())
+
+    print(f"多项式求解服务运行在 http://{args.host}:{args.port} (工作进程: {args.workers})")
+    serve(args.host, args.port, workers=args.workers, queue_size=args.queue_size,
+          request_timeout=args.timeout, disk_cache_path=args.disk_cache,
+          warm_expressions=warm_expressions, max_degree=args.max_degree,
+          max_coefficient_bits=args.max_coefficient_bits,
+          admission_max_degree=args.admission_max_degree,
+          admission_max_coefficient_bits=args.admission_max_coefficient_bits,
+          big_job_workers=args.big_job_workers)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
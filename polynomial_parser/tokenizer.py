@@ -1,3 +1,4 @@
+import mmap
 import re
 
 # --- Tokenizer ---
@@ -5,13 +6,16 @@ import re
 # 定义 token 类型
 TOKEN_TYPE_NUMBER = 'NUMBER' # 整数或分数
 TOKEN_TYPE_VARIABLE = 'VARIABLE' # 'x'
-TOKEN_TYPE_OPERATOR = 'OPERATOR' # +, -, *, /, ^
+TOKEN_TYPE_OPERATOR = 'OPERATOR' # +, -, *, /, ^, @
 TOKEN_TYPE_LPAREN = 'LPAREN'   # (
 TOKEN_TYPE_RPAREN = 'RPAREN'   # )
 TOKEN_TYPE_EOF = 'EOF'         # End of File
 TOKEN_TYPE_MUL_IMPLICIT = 'MUL_IMPLICIT' # 隐式乘法 token
 
 class Token:
+    # 使用 __slots__ 让每个 token 只占用两个字段，长表达式会产生大量 token
+    __slots__ = ('type', 'value')
+
     def __init__(self, type, value=None):
         self.type = type
         self.value = value
@@ -23,66 +27,137 @@ class Token:
         return self.__str__()
 
 
+# 主正则在模块加载时编译一次。
+# 分组名与 token 类型常量一致，这样 match.lastgroup 就直接是 token 类型。
+# 每次匹配先吞掉前导空白；INVALID 分组兜底任何无法识别的非空白字符。
+_TOKEN_PATTERN = (
+    r'\s*(?:'
+    r'(?P<NUMBER>\d+(?:/\d+)?)'   # 匹配整数或分数 (如 3 或 1/2)
+    r'|(?P<OPERATOR>[-+*/^@])'
+    r'|(?P<VARIABLE>x)'
+    r'|(?P<LPAREN>\()'
+    r'|(?P<RPAREN>\))'
+    r'|(?P<INVALID>\S)'
+    r')'
+)
+_TOKEN_REGEX = re.compile(_TOKEN_PATTERN)
+# bytes 版本用于直接扫描 bytes / mmap 缓冲区，避免把整个输入解码成 str
+_TOKEN_REGEX_BYTES = re.compile(_TOKEN_PATTERN.encode('ascii'))
+
+# 隐式乘法：前一个 token 是数字、变量或右括号，且当前 token 是变量或左括号。
+# 例如 '2x', '3(x+1)', 'x(x+1)', '(x+1)(x-1)', '(x+1)x'
+_IMPLICIT_MUL_LEFT = frozenset((TOKEN_TYPE_NUMBER, TOKEN_TYPE_VARIABLE, TOKEN_TYPE_RPAREN))
+_IMPLICIT_MUL_RIGHT = frozenset((TOKEN_TYPE_VARIABLE, TOKEN_TYPE_LPAREN))
+
+# 运算符、变量和括号的取值固定，所有 tokenize 调用共享同一批只读 token 对象，
+# 只有数字 token 需要逐个创建。调用方不应修改 token 的字段。
+_SHARED_TOKENS = {
+    value: Token(token_type, value)
+    for token_type, values in (
+        (TOKEN_TYPE_OPERATOR, '+-*/^@'),
+        (TOKEN_TYPE_VARIABLE, 'x'),
+        (TOKEN_TYPE_LPAREN, '('),
+        (TOKEN_TYPE_RPAREN, ')'),
+    )
+    for value in values
+}
+_SHARED_TOKENS_BYTES = {value.encode('ascii'): token for value, token in _SHARED_TOKENS.items()}
+_MUL_IMPLICIT_TOKEN = Token(TOKEN_TYPE_MUL_IMPLICIT, '*')
+EOF_TOKEN = Token(TOKEN_TYPE_EOF)
+
+# 从文件对象读取时每次读取的字符/字节数
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def _scan(buffer, previous_type, offset=0, limit=None):
+    """
+    扫描 buffer (str 或 bytes 类缓冲区) 并逐个产生 token。
+
+    previous_type: 上一块输入的最后一个 token 类型，用于跨块判断隐式乘法。
+    offset: buffer 在整个输入中的起始位置，仅用于错误信息。
+    limit: 只产生结束位置不超过 limit 的 token；遇到第一个越界的匹配即停止。
+    生成器的返回值为 (已消耗的长度, 最后一个 token 类型)。
+    """
+    is_text = isinstance(buffer, str)
+    if is_text:
+        regex, shared_tokens = _TOKEN_REGEX, _SHARED_TOKENS
+    else:
+        regex, shared_tokens = _TOKEN_REGEX_BYTES, _SHARED_TOKENS_BYTES
+    if limit is None:
+        limit = len(buffer)
+
+    consumed = 0
+    for match in regex.finditer(buffer):
+        end = match.end()
+        if end > limit:
+            break
+        token_type = match.lastgroup
+
+        if token_type in _IMPLICIT_MUL_RIGHT and previous_type in _IMPLICIT_MUL_LEFT:
+            yield _MUL_IMPLICIT_TOKEN
+
+        value = match.group(token_type)
+        token = shared_tokens.get(value)
+        if token is None:
+            if not is_text:
+                value = value.decode('ascii', errors='replace')
+            if token_type != TOKEN_TYPE_NUMBER:
+                raise ValueError(f"无法识别的字符: {value} 在位置 {offset + match.start(token_type)}")
+            token = Token(token_type, value)
+        yield token
+        previous_type = token_type
+        consumed = end
+
+    return consumed, previous_type
+
+
+def _scan_file(file_obj, chunk_size):
+    """
+    分块读取文件对象 (文本或二进制模式) 并逐个产生 token。
+
+    每块末尾至少保留两个字符不扫描：数字 token (如 '12/34') 可能跨越块边界，
+    两个字符的前瞻足以确定它是否已经结束。未消耗的尾部与下一块拼接后继续扫描。
+    """
+    pending = None
+    offset = 0
+    previous_type = None
+    while True:
+        chunk = file_obj.read(chunk_size)
+        at_eof = not chunk
+        buffer = chunk if pending is None else pending + chunk
+        limit = None if at_eof else len(buffer) - 2
+        consumed, previous_type = yield from _scan(buffer, previous_type, offset, limit)
+        if at_eof:
+            return
+        pending = buffer[consumed:]
+        offset += consumed
+
+
+def iter_tokens(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    以生成器方式产生 token，隐式乘法 token 在扫描时插入，最后产生 EOF token。
+
+    source 可以是:
+    - str: 直接扫描；
+    - bytes / bytearray / memoryview / mmap: 直接在缓冲区上扫描，不复制整个输入；
+    - 具有 read() 方法的文件对象 (文本或二进制): 按 chunk_size 分块读取。
+    内存占用与输入长度无关。
+    """
+    if isinstance(source, (str, bytes, bytearray, memoryview, mmap.mmap)):
+        yield from _scan(source, None)
+    elif hasattr(source, 'read'):
+        yield from _scan_file(source, chunk_size)
+    else:
+        raise TypeError(f"无法对类型 {type(source)} 进行词法分析")
+    yield EOF_TOKEN
+
+
 def tokenize(expression_str):
     """
     将数学表达式字符串分解成 token 列表，处理隐式乘法。
+
+    单遍扫描：在产生 token 的同时插入 MUL_IMPLICIT，
+    因此结果无需再经过 insert_implicit_multiplication。
+    需要流式处理时请使用 iter_tokens。
     """
-    tokens = []
-    # Combine patterns, order matters (e.g., operators before single chars)
-    token_patterns = [
-        (TOKEN_TYPE_NUMBER, r'\d+(\/\d+)?'), # 匹配整数或分数 (如 3 或 1/2)
-        (TOKEN_TYPE_OPERATOR, r'[\+\-\*\/\^]'), # Operators should be before VARIABLE to avoid 'x' matching '-'
-        (TOKEN_TYPE_VARIABLE, r'x'),
-        (TOKEN_TYPE_LPAREN, r'\('),
-        (TOKEN_TYPE_RPAREN, r'\)'),
-    ]
-
-    full_pattern = '|'.join(f'(?P<{name}>{pattern})' for name, pattern in token_patterns)
-    token_regex = re.compile(full_pattern)
-
-    i = 0
-    while i < len(expression_str):
-        # 显式跳过空格
-        if expression_str[i].isspace():
-            i += 1
-            continue
-
-        match = token_regex.match(expression_str, i)
-        if match:
-            token_type = match.lastgroup
-            token_value = match.group(token_type)
-
-            # 在添加当前 token 之前，检查是否需要插入隐式乘法 token
-            if tokens: # 仅当已存在 token 时进行检查
-                last_token_type = tokens[-1].type
-                # 检查当前匹配到的 token 类型，以及它在原字符串中的起始位置
-                current_match_start = match.start()
-
-                insert_mul_implicit = False
-                # 条件：前一个 token 是数字、变量或右括号，且当前匹配的字符是左括号或变量
-                if last_token_type in (TOKEN_TYPE_NUMBER, TOKEN_TYPE_VARIABLE, TOKEN_TYPE_RPAREN) and \
-                   expression_str[current_match_start] in ('x', '('):
-                    insert_mul_implicit = True
-                # 特殊情况：前一个 token 是数字，当前匹配到变量 'x'
-                elif last_token_type == TOKEN_TYPE_NUMBER and expression_str[current_match_start] == 'x':
-                     insert_mul_implicit = True
-                # 特殊情况：前一个 token 是变量，当前匹配到左括号
-                elif last_token_type == TOKEN_TYPE_VARIABLE and expression_str[current_match_start] == '(':
-                     insert_mul_implicit = True
-                # 特殊情况：前一个 token 是右括号，当前匹配到变量 'x' 或 左括号 '('
-                elif last_token_type == TOKEN_TYPE_RPAREN and expression_str[current_match_start] in ('x', '('):
-                     insert_mul_implicit = True
-
-
-                # 如果需要插入隐式乘法 token，则插入一个
-                if insert_mul_implicit:
-                    tokens.append(Token(TOKEN_TYPE_MUL_IMPLICIT, '*'))
-
-            # 添加当前 token
-            tokens.append(Token(token_type, token_value))
-            i = match.end()
-        else:
-            raise ValueError(f"无法识别的字符: {expression_str[i]} 在位置 {i}")
-
-    tokens.append(Token(TOKEN_TYPE_EOF))
-    return tokens
\ No newline at end of file
+    return list(iter_tokens(expression_str))
@@ -9,12 +9,15 @@ setup(
         # 例如： 'sympy',
         'sympy'
     ],
+    extras_require={
+        # 数值求根 (Polynomial.roots_numeric / roots_numeric_many) 需要 NumPy
+        'numeric': ['numpy'],
+    },
     entry_points={
-        # 如果您希望安装后可以通过命令行运行某个函数，可以在这里配置
-        # 例如，如果您想让 main.py 中的 solve_expression 函数可以通过命令行调用：
-        # 'console_scripts': [
-        #     'poly-solve=main:solve_expression',
-        # ],
+        # 非交互式批处理命令行: poly-solve [文件] --jobs N --order input|completion
+        'console_scripts': [
+            'poly-solve=polynomial_parser.cli:main',
+        ],
     },
     author='jasmiana', # 作者名称
     author_email='lune07525@gmail.com', # 作者邮箱
@@ -0,0 +1,140 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from polynomial_parser import AsyncSolver, FractionalPolynomial
+
+# --- 测试 asyncio 接口 (AsyncSolver) ---
+
+# 在单个工作线程 / 进程中需要几秒的表达式，乘法循环中会定期检查预算
+SLOW_EXPRESSION = "(x+1)^600*(x+2)^600"
+MEDIUM_EXPRESSION = "(x+1)^300*(x+2)^300"
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """记录提交了多少个任务的线程池。"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+async def quick_after(solver, label):
+    """在同一个执行器上提交一个简单请求，报告它多快完成 (判断工作线程 / 进程是否已经空闲)。"""
+    begin = time.perf_counter()
+    result = await solver.parse_and_evaluate("x^2 - 1", timeout=3)
+    elapsed = time.perf_counter() - begin
+    print(f"{label}: 结果 {result}，在 1 秒内完成: {elapsed < 1.0}")
+
+
+async def test_basic():
+    print("\n--- 测试求值与裂项 ---")
+    async with AsyncSolver(use_cache=False) as solver:
+        print("输入: '(x^2 - 1) / (x - 1)'")
+        print(f"结果: {await solver.parse_and_evaluate('(x^2 - 1) / (x - 1)')}")
+        print("-" * 30)
+        print("输入: '1 / (x^2 - 1)' (裂项)")
+        print(f"结果: {[str(term) for term in await solver.partial_fraction_decompose('1 / (x^2 - 1)')]}")
+        print("-" * 30)
+        print("输入: '(x + 1' (语法错误)")
+        try:
+            await solver.parse_and_evaluate("(x + 1")
+        except SyntaxError as e:
+            print(f"SyntaxError: {e}")
+        print("-" * 30)
+        print("输入: 裂项的输入类型错误")
+        try:
+            await solver.partial_fraction_decompose(42)
+        except TypeError as e:
+            print(f"TypeError: {e}")
+        print("-" * 30)
+
+
+async def test_dedup():
+    print("\n--- 测试相同请求去重 ---")
+    executor = CountingExecutor(max_workers=2)
+    solver = AsyncSolver(executor=executor, use_cache=False)
+    print(f"输入: 同时发出 5 个 '{MEDIUM_EXPRESSION}'")
+    tasks = [asyncio.ensure_future(solver.parse_and_evaluate(MEDIUM_EXPRESSION)) for _ in range(5)]
+    await asyncio.sleep(0)
+    print(f"正在执行的请求数: {solver.in_flight()}")
+    results = await asyncio.gather(*tasks)
+    print(f"提交到执行器的任务数: {executor.submitted}")
+    print(f"结果相同: {len({r.to_single_fraction_str() for r in results}) == 1}")
+    print(f"每个调用方拿到独立的副本: {len({id(r.numerator) for r in results}) == 5}")
+    print(f"完成后不再记录: {solver.in_flight() == 0}")
+    print("-" * 30)
+
+    print("输入: 相同的表达式、不同的 timeout")
+    tasks = [asyncio.ensure_future(solver.parse_and_evaluate("x + 1", timeout=t)) for t in (None, 5, 5)]
+    await asyncio.gather(*tasks)
+    print(f"提交到执行器的任务数 (timeout 是去重键的一部分): {executor.submitted - 1}")
+    print("-" * 30)
+    solver.close()
+    executor.shutdown()
+
+
+async def test_timeout_and_cancel():
+    print("\n--- 测试超时与取消 ---")
+    solver = AsyncSolver(max_workers=1, use_cache=False)
+
+    print(f"输入: '{SLOW_EXPRESSION}'，timeout=0.3")
+    begin = time.perf_counter()
+    try:
+        await solver.parse_and_evaluate(SLOW_EXPRESSION, timeout=0.3)
+    except TimeoutError:
+        print(f"TimeoutError，在 1 秒内返回: {time.perf_counter() - begin < 1.0}")
+    await quick_after(solver, "超时之后的请求 (工作线程已停止计算)")
+    print("-" * 30)
+
+    print(f"输入: '{SLOW_EXPRESSION}'，唯一的调用方被取消")
+    task = asyncio.ensure_future(solver.parse_and_evaluate(SLOW_EXPRESSION))
+    await asyncio.sleep(0.2)
+    entry = next(iter(solver._inflight.values()))
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        print("调用方收到 CancelledError")
+    print(f"取消标志已设置: {entry.cancel_event.is_set()}")
+    await quick_after(solver, "取消之后的请求")
+    print("-" * 30)
+
+    print(f"输入: '{MEDIUM_EXPRESSION}'，两个调用方中的一个被取消")
+    first = asyncio.ensure_future(solver.parse_and_evaluate(MEDIUM_EXPRESSION))
+    second = asyncio.ensure_future(solver.parse_and_evaluate(MEDIUM_EXPRESSION))
+    await asyncio.sleep(0.2)
+    entry = next(iter(solver._inflight.values()))
+    first.cancel()
+    result = await second
+    print(f"另一个调用方仍然得到结果: {isinstance(result, FractionalPolynomial)}")
+    print(f"取消标志未设置: {not entry.cancel_event.is_set()}")
+    print("-" * 30)
+    solver.close()
+
+
+async def test_process_pool():
+    print("\n--- 测试进程池执行器 ---")
+    async with AsyncSolver(use_processes=True, max_workers=1, use_cache=False) as solver:
+        await solver.parse_and_evaluate("x") # 启动工作进程
+        print(f"输入: '{SLOW_EXPRESSION}'，timeout=0.3 (进程池)")
+        try:
+            await solver.parse_and_evaluate(SLOW_EXPRESSION, timeout=0.3)
+        except TimeoutError:
+            print("TimeoutError")
+        await quick_after(solver, "超时之后的请求 (工作进程已停止计算)")
+        print("-" * 30)
+
+
+async def main():
+    await test_basic()
+    await test_dedup()
+    await test_timeout_and_cancel()
+    await test_process_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,132 @@
+from fractions import Fraction
+
+from polynomial_parser import parse_and_evaluate, Polynomial, FractionalPolynomial
+from polynomial_parser.apart import factor_denominator
+from polynomial_parser.partial_fraction import partial_fraction_decompose
+from polynomial_parser.formatting import format_decomposed_terms
+
+# --- 测试原生分式裂项 (apart) ---
+print("\n--- 测试原生分式裂项 ---")
+
+expressions_to_test = [
+    # 一重的一次因式 (Heaviside 覆盖法)
+    "1 / (x^2 - 1)",
+    "(3x + 5) / ((x - 1)(x + 2)(x - 3))",
+    "1 / ((2x + 1)(3x - 2))",                 # 有理根 -1/2、2/3
+    # 重一次因式
+    "1 / (x^2 (x - 1)^3)",
+    "(x^2 + 1) / (x + 2)^4",
+    # 二次因式及其重因式
+    "1 / (x (x^2 + 1))",
+    "(x^3 + 2) / ((x^2 + x + 1)^2 (x - 1))",
+    "1 / (x^4 + 1)",                          # 不可约的四次因式
+    "1 / (x^4 - 4)",                          # (x^2 - 2)(x^2 + 2)
+    # 多项式部分
+    "(x^5 + 3x + 1) / (x^2 - 3x + 2)",
+    "(2x^3 - x) / (2x - 1)",
+    # 常数分母与整除
+    "(x^2 - 1) / 4",
+    "(x^3 - 1) / (x - 1)",
+    # 系数很大：有理根搜索放弃，交给 factorization 模块
+    "1 / ((x - 123456789011)(x + 98765432101))",
+]
+
+
+def as_sum(terms):
+    """把裂项结果加回一个分式多项式。"""
+    total = FractionalPolynomial(Polynomial(), Polynomial({0: 1}))
+    for term in terms:
+        total = total + term
+    return total
+
+
+def normalized(term):
+    """分式项的规范形式：分母首一，用于比较 native 与 sympy 的结果。"""
+    lc = term.denominator._leading_term()[1]
+    scale = Polynomial({0: Fraction(1) / lc})
+    return (tuple(sorted((term.numerator * scale).terms.items())),
+            tuple(sorted((term.denominator * scale).terms.items())))
+
+
+def comparable(terms):
+    """规范化的项集合；sympy 路径把多项式部分拆成单项式，这里先把它们加在一起。"""
+    polynomial_part = Polynomial()
+    fractions = []
+    for term in terms:
+        if isinstance(term, Polynomial):
+            polynomial_part = polynomial_part + term
+        else:
+            fractions.append(normalized(term))
+    return sorted(fractions), sorted(polynomial_part.terms.items())
+
+
+def is_proper_term(term):
+    """c / f^k 的形式：分子次数小于不可约因式 f 的次数。"""
+    if isinstance(term, Polynomial):
+        return True
+    _, factors = factor_denominator(term.denominator)
+    return len(factors) == 1 and (term.numerator.is_zero() or term.numerator.degree() < factors[0][0].degree())
+
+
+for expr in expressions_to_test:
+    print(f"输入: '{expr}'")
+    try:
+        frac = parse_and_evaluate(expr, use_cache=False)
+        native = partial_fraction_decompose(frac, method='native')
+        print(f"裂项结果: {format_decomposed_terms(native, 'x')}")
+        total = as_sum(native)
+        same_sum = total.numerator.terms == frac.numerator.terms and total.denominator.terms == frac.denominator.terms
+        print(f"各项之和等于输入: {same_sum}")
+        print(f"每一项都是 c / f^k (deg c < deg f): {all(is_proper_term(term) for term in native)}")
+        polynomial_parts = [term for term in native if isinstance(term, Polynomial)]
+        print(f"多项式部分: {polynomial_parts[0] if polynomial_parts else '无'}")
+        sympy_terms = partial_fraction_decompose(frac, method='sympy')
+        print(f"与 method='sympy' 一致: {comparable(native) == comparable(sympy_terms)}")
+    except Exception as e:
+        print(f"处理失败: {e}")
+    print("-" * 30)
+
+print("输入: method='unknown'")
+try:
+    partial_fraction_decompose(parse_and_evaluate("1 / x"), method='unknown')
+except ValueError as e:
+    print(f"ValueError: {e}")
+print("-" * 30)
+
+
+# --- 测试分母分解的有理根快速路径 ---
+print("\n--- 测试分母分解 (有理根快速路径) ---")
+
+denominators_to_test = [
+    "x^3 - x",                                # 全部是一次因式
+    "(2x - 1)^3 (3x + 4)",                    # 重根和非整数的有理根
+    "6x^4 - 5x^3 - 38x^2 - 5x + 6",           # (2x + 1)(3x + 2)... 四个有理根
+    "x^2 (x^2 + 1)",                          # 剥离 x^2 后剩下不可约的二次因式
+    "(x - 1)(x^3 - 2)",                       # 剩下没有有理根的三次因式
+    "(x^2 - 2)(x^2 - 3)",                     # 没有有理根的四次多项式交给 factorization
+    "1/2 x^2 - 1/8",                          # 有理系数：常数因子 1/8
+]
+
+for expr in denominators_to_test:
+    poly = parse_and_evaluate(expr, use_cache=False).numerator
+    lc, factors = factor_denominator(poly)
+    print(f"输入: '{expr}'")
+    print(f"常数因子: {lc}")
+    for f, multiplicity in factors:
+        print(f"    ({f})^{multiplicity}")
+    product = Polynomial({0: lc})
+    for f, multiplicity in factors:
+        product = product * f.power(multiplicity)
+    print(f"因子乘积等于输入: {product.terms == poly.terms}")
+    print("-" * 30)
+
+
+# --- 测试负项的格式 ---
+print("\n--- 测试负项的格式 ---")
+
+for expr in ["1 / (x^2 - 1)", "(x - 3) / (x^2 - 1)", "-2 / (x + 1)^2 + x"]:
+    print(f"输入: '{expr}'")
+    formatted = format_decomposed_terms(partial_fraction_decompose(parse_and_evaluate(expr, use_cache=False)), 'x')
+    print(f"格式化结果: {formatted}")
+    print(f"负号在括号外: {all(not s.startswith('(-') for s in formatted)}")
+    print("-" * 30)
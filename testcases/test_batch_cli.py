@@ -0,0 +1,85 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from polynomial_parser import parse_and_evaluate, parse_and_evaluate_many, EvaluationError
+
+
+def main():
+    # --- 测试批量求值 (进程池) ---
+    print("\n--- 测试批量求值 (进程池) ---")
+
+    expressions = ["x + 1", "(x^2 - 1) / (x - 1)", "x ^", "1 / (x^2 + 1)", "(x + 1)^3", "2x(x - 3)", "1 / 0"]
+    expected = []
+    for expr in expressions:
+        try:
+            expected.append(str(parse_and_evaluate(expr, use_cache=False)))
+        except Exception:
+            expected.append(None)
+
+    for workers, chunksize in [(1, 64), (2, 1), (2, 3)]:
+        print(f"输入: {len(expressions)} 个表达式，workers={workers}，chunksize={chunksize}")
+        results = parse_and_evaluate_many(expressions, workers=workers, chunksize=chunksize)
+        errors = [result for result in results if isinstance(result, EvaluationError)]
+        print(f"结果数量与输入一致: {len(results) == len(expressions)}")
+        print(f"结果与逐个求值一致 (按输入顺序): "
+              f"{[None if isinstance(r, EvaluationError) else str(r) for r in results] == expected}")
+        print(f"错误: {[(error.index, error.error_type) for error in errors]}")
+        print("-" * 30)
+
+
+    # --- 测试 poly-solve 命令行 ---
+    print("\n--- 测试 poly-solve 命令行 ---")
+
+    directory = tempfile.TemporaryDirectory()
+    input_path = os.path.join(directory.name, "input.jsonl")
+    lines = [
+        "x^2 - 1",
+        '{"id": "a", "expression": "1 / (x^2 - 1)"}',
+        "(x + 1",                       # 语法错误
+        "",                             # 空行被跳过
+        '{"id": 7, "expression": "(x^3 + 1) / (x + 1)"}',
+        '{"expression": 5}',            # expression 不是字符串
+        "x(x + 1)(x + 2)",
+    ]
+    with open(input_path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    environment = dict(os.environ, PYTHONPATH=package_root + os.pathsep + os.environ.get('PYTHONPATH', ''))
+
+    for extra in (["--jobs", "2", "--chunksize", "2"], ["--jobs", "2", "--chunksize", "1", "--order", "completion"]):
+        print(f"输入: poly-solve input.jsonl {' '.join(extra)}")
+        completed = subprocess.run([sys.executable, "-m", "polynomial_parser.cli", input_path, *extra],
+                                   capture_output=True, text=True, env=environment, timeout=300)
+        records = [json.loads(line) for line in completed.stdout.splitlines()]
+        print(f"退出码: {completed.returncode}")
+        indices = [record['index'] for record in records]
+        if "--order" in extra:
+            print(f"按完成顺序输出，覆盖全部输入: {sorted(indices) == list(range(6))}")
+        else:
+            print(f"输出顺序与输入一致: {indices == list(range(6))}")
+        records.sort(key=lambda record: record['index'])
+        for record in records:
+            if 'error' in record:
+                print(f"  [{record['index']}] {record['expression']!r} -> 错误 {record['error']['type']}: "
+                      f"{record['error']['message']}")
+            else:
+                print(f"  [{record['index']}] id={record.get('id')} {record['expression']!r} -> {record['simplified']}"
+                      f" | 裂项: {record['partial_fractions']}")
+        print("-" * 30)
+
+    print("输入: poly-solve --jobs -1")
+    completed = subprocess.run([sys.executable, "-m", "polynomial_parser.cli", input_path, "--jobs", "-1"],
+                               capture_output=True, text=True, env=environment, timeout=60)
+    print(f"退出码: {completed.returncode}，错误信息: {completed.stderr.strip()}")
+    print("-" * 30)
+
+    directory.cleanup()
+
+
+# 进程池在 spawn 方式下会重新导入本模块
+if __name__ == "__main__":
+    main()
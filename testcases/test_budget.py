@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import time
+
+from polynomial_parser import parse_and_evaluate, Budget, BudgetExceeded, current_budget, estimate_bounds
+
+# --- 测试静态结果大小估计 (estimate_bounds) ---
+print("\n--- 测试静态结果大小估计 ---")
+
+expressions_to_estimate = [
+    "(x + 1)^10 / (x - 1)",
+    "x^100000",
+    "x^10 @ x^10 @ x^10 @ x^10",
+    "(x^500 + 1) * (x^700 - 1)",
+    "(123456789x + 1)^20",
+    "x^(1/2)",                      # 指数不是整数常数
+]
+
+for expr in expressions_to_estimate:
+    print(f"输入: '{expr}'")
+    begin = time.perf_counter()
+    bounds = estimate_bounds(expr)
+    elapsed = time.perf_counter() - begin
+    print(f"上界: 分子次数 {bounds.numerator_degree}，分母次数 {bounds.denominator_degree}，"
+          f"系数位数 {bounds.coefficient_bits}")
+    print(f"在 50 毫秒内完成 (不做多项式运算): {elapsed < 0.05}")
+    try:
+        result = parse_and_evaluate(expr, use_cache=False) if bounds.numerator_degree <= 1000 else None
+    except ValueError:
+        result = None
+    if result is not None:
+        # 上界必须不小于实际结果
+        within = (result.numerator.degree() <= bounds.numerator_degree and
+                  result.denominator.degree() <= bounds.denominator_degree)
+        print(f"实际次数不超过上界: {within}")
+    print("-" * 30)
+
+
+# --- 测试资源预算 (Budget) ---
+print("\n--- 测试资源预算 ---")
+
+budget_cases = [
+    # (表达式, Budget 参数)：前三个在做任何大的多项式运算之前就超出次数限制
+    ("x^100000", {'max_degree': 1000}),
+    ("x^10 @ x^10 @ x^10 @ x^10", {'max_degree': 1000}),
+    ("(x^500 + 1) * (x^700 - 1)", {'max_degree': 1000}),
+    ("(123456789x + 1)^20", {'max_coefficient_bits': 200}),
+    ("(x + 1)^40", {'max_terms': 20}),
+    ("(x+1)^600*(x+2)^600", {'timeout': 0.2}),
+    # 在预算之内：正常求值
+    ("(x + 1)^10 / (x - 1)", {'max_degree': 1000, 'max_coefficient_bits': 64, 'max_terms': 20, 'timeout': 5}),
+    ("x^10 @ x^10 @ x^10", {'max_degree': 1000}),
+]
+
+for expr, limits in budget_cases:
+    print(f"输入: '{expr}'，{limits}")
+    begin = time.perf_counter()
+    try:
+        with Budget(**limits):
+            result = parse_and_evaluate(expr, use_cache=False)
+        print(f"结果: {str(result)[:60]}")
+    except BudgetExceeded as e:
+        print(f"BudgetExceeded: limit={e.limit}，value={e.value}，{e}")
+        print(f"是 ValueError 的子类: {isinstance(e, ValueError)}")
+    print(f"在 0.5 秒内完成: {time.perf_counter() - begin < 0.5}")
+    print(f"退出后没有生效的预算: {current_budget() is None}")
+    print("-" * 30)
+
+
+print("输入: 嵌套的预算")
+with Budget(max_degree=100, timeout=10) as outer:
+    with Budget(max_degree=1000, max_terms=5, timeout=1) as inner:
+        print(f"内层实际生效: max_degree={inner.max_degree}，max_terms={inner.max_terms}，timeout={inner.timeout}")
+        print(f"内层截止时间不晚于外层: {inner.deadline <= outer.deadline}")
+    print(f"退出内层后恢复外层: {current_budget() is outer}")
+print(f"全部退出后: {current_budget()}")
+print("-" * 30)
+
+
+# 同一个 Budget 对象被多个协程 / 线程同时进入：每次进入都有自己的生效对象和截止时间，
+# 退出顺序与进入顺序交错时也能各自恢复
+print("输入: 两个协程同时进入同一个 Budget 对象")
+shared = Budget(max_degree=50, timeout=5)
+
+
+async def enter_shared(delay_before_exit, seen):
+    with shared as effective:
+        seen.append(effective)
+        await asyncio.sleep(delay_before_exit)
+        with_budget = current_budget() is effective
+    return with_budget and current_budget() is None
+
+
+async def interleaved():
+    seen = []
+    # 第一个协程先进入、先退出；第二个协程在它退出时仍在上下文中
+    results = await asyncio.gather(enter_shared(0.05, seen), enter_shared(0.1, seen))
+    return results, seen
+
+
+try:
+    results, seen = asyncio.run(interleaved())
+    print(f"每个协程在上下文中看到自己的预算、退出后恢复为空: {results}")
+    print(f"两次进入得到不同的生效对象: {seen[0] is not seen[1]}")
+    print(f"共享的 Budget 对象未被修改: {shared.deadline is None}")
+except Exception as e:
+    print(f"处理失败: {type(e).__name__}: {e}")
+print("-" * 30)
+
+print("输入: 两个线程同时进入同一个 Budget 对象")
+outcomes = []
+barrier = threading.Barrier(2)
+
+
+def enter_in_thread(delay):
+    try:
+        with shared:
+            barrier.wait()
+            time.sleep(delay)
+            parse_and_evaluate("(x + 1)^20", use_cache=False)
+        outcomes.append(current_budget() is None)
+    except Exception as e:
+        outcomes.append(f"{type(e).__name__}: {e}")
+
+
+threads = [threading.Thread(target=enter_in_thread, args=(delay,)) for delay in (0.0, 0.05)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+print(f"结果: {outcomes}")
+print("-" * 30)
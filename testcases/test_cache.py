@@ -0,0 +1,83 @@
+from fractions import Fraction
+
+from polynomial_parser import parse_and_evaluate, configure_cache, get_cache, canonical_key, tokenize
+from polynomial_parser import ExpressionCache
+
+# --- 测试表达式结果缓存 ---
+print("\n--- 测试表达式结果缓存 ---")
+
+cache = configure_cache(maxsize=3)
+
+
+def show_info(label):
+    info = get_cache().info()
+    print(f"{label}: 命中 {info.hits}，未命中 {info.misses}，当前 {info.currsize} 项，命中率 {info.hit_rate:.2f}")
+
+
+# 命中与未命中的计数
+for expr in ["x + 1", "x + 1", "x+1", "(x - 1)^2"]:
+    print(f"输入: '{expr}'")
+    print(f"结果: {parse_and_evaluate(expr)}")
+    show_info("统计")
+    print("-" * 30)
+
+# use_cache=False 不计入统计
+parse_and_evaluate("x + 1", use_cache=False)
+show_info("use_cache=False 之后")
+print("-" * 30)
+
+# 隐式乘法与显式乘法共享同一项
+print("输入: '2x(x+1)' 与 '2*x*(x+1)'")
+print(f"键相同: {canonical_key(tokenize('2x(x+1)')) == canonical_key(tokenize('2 * x * (x + 1)'))}")
+cache.clear()
+parse_and_evaluate("2x(x+1)")
+parse_and_evaluate("2*x*(x+1)")
+show_info("统计 (第二次应命中)")
+print("-" * 30)
+
+# LRU 淘汰：容量为 3，最久未使用的项先被淘汰
+print("输入: LRU 淘汰 (容量 3)")
+cache.clear()
+for expr in ["x", "x^2", "x^3"]:
+    parse_and_evaluate(expr)
+parse_and_evaluate("x")        # x 变为最近使用
+parse_and_evaluate("x^4")      # 淘汰 x^2
+show_info("插入 x^4 之后")
+print(f"x 仍在缓存中: {cache.get(canonical_key(tokenize('x'))) is not None}")
+print(f"x^2 已被淘汰: {cache.get(canonical_key(tokenize('x^2'))) is None}")
+print(f"x^3 仍在缓存中: {cache.get(canonical_key(tokenize('x^3'))) is not None}")
+print("-" * 30)
+
+# 调用方修改拿到的结果，不影响缓存和其他调用方
+print("输入: 修改缓存返回的结果")
+cache.clear()
+first = parse_and_evaluate("(x + 1) / (x - 1)")
+first.numerator.terms[0] = Fraction(100)
+first.denominator.terms[5] = Fraction(1)
+second = parse_and_evaluate("(x + 1) / (x - 1)")
+print(f"第二次的结果: {second}")
+print(f"未被第一个调用方的修改影响: {second.to_single_fraction_str() == '(x + 1) / (x - 1)'}")
+print(f"两次返回的是不同对象: {first is not second and first.numerator is not second.numerator}")
+show_info("统计")
+print("-" * 30)
+
+# 容量为 0 时不缓存，超长的表达式不进入缓存
+print("输入: maxsize=0 与 max_key_length")
+configure_cache(maxsize=0)
+parse_and_evaluate("x + 2")
+parse_and_evaluate("x + 2")
+show_info("maxsize=0")
+configure_cache(maxsize=16, max_key_length=10)
+parse_and_evaluate("x + 1 + 1 + 1 + 1")
+show_info("超过 max_key_length")
+print("-" * 30)
+
+print("输入: ExpressionCache(maxsize=-1)")
+try:
+    ExpressionCache(maxsize=-1)
+except ValueError as e:
+    print(f"ValueError: {e}")
+print("-" * 30)
+
+# 恢复默认缓存
+configure_cache()
@@ -0,0 +1,163 @@
+import random
+from fractions import Fraction
+
+from polynomial_parser import Polynomial, FractionalPolynomial, parse_and_evaluate
+from polynomial_parser.composition import _HORNER_MAX_DEGREE
+
+# --- 测试 Taylor 平移 (Polynomial.shift) ---
+print("\n--- 测试 Taylor 平移 ---")
+
+rng = random.Random(49)
+
+
+def random_polynomial(degree, rational=False):
+    """次数为 degree 的随机多项式；rational 为 True 时系数带有分母。"""
+    terms = {}
+    for exp in range(degree + 1):
+        numerator = rng.randint(-9, 9)
+        terms[exp] = Fraction(numerator, rng.randint(1, 6)) if rational else numerator
+    terms[degree] = terms[degree] or 1
+    return Polynomial(terms)
+
+
+def naive_compose(f, g):
+    """逐项 f_i * g^i 相加，作为对照。"""
+    result = Polynomial()
+    for exp, coeff in f.terms.items():
+        result = result + g.power(exp) * Polynomial({0: coeff})
+    return result
+
+
+shift_cases = [
+    ("x^3 - 2x + 1", 2),
+    ("x^3 - 2x + 1", -3),
+    ("x^4 + x^2 + 1", Fraction(1, 2)),
+    ("1/3 x^5 - 7/2 x^2 + 4", Fraction(-5, 7)),
+    ("x^10", 1),
+    ("(x - 3)^6", 3),                  # 平移后为 x^6
+    ("5", 100),                        # 常数不变
+    ("x^2 + x", 0),
+]
+
+for expr, a in shift_cases:
+    poly = parse_and_evaluate(expr, use_cache=False).numerator
+    shifted = poly.shift(a)
+    print(f"输入: '{expr}'，a = {a}")
+    print(f"结果: {shifted}")
+    print(f"与朴素复合 p(x + a) 一致: {shifted.terms == naive_compose(poly, Polynomial({1: 1, 0: a})).terms}")
+    print(f"在 x = 1/2 处的值等于 p(1/2 + a): {shifted.evaluate(Fraction(1, 2)) == poly.evaluate(Fraction(1, 2) + a)}")
+    print("-" * 30)
+
+for degree, a in [(60, 7), (60, Fraction(-3, 4)), (120, Fraction(11, 13))]:
+    poly = random_polynomial(degree, rational=True)
+    print(f"输入: {degree} 次随机有理系数多项式，a = {a}")
+    print(f"与朴素复合一致: {poly.shift(a).terms == naive_compose(poly, Polynomial({1: 1, 0: a})).terms}")
+    print(f"平移回去得到原多项式: {poly.shift(a).shift(-a).terms == poly.terms}")
+    print("-" * 30)
+
+
+# --- 测试多项式复合 (Polynomial.compose) ---
+print("\n--- 测试多项式复合 ---")
+print(f"Horner / 分治的分界次数: {_HORNER_MAX_DEGREE}")
+
+# 内层次数在分界两侧：低于分界用 Horner 法则，不低于分界用分治
+compose_cases = [
+    ("外层 5 次，内层 1 次", random_polynomial(5), random_polynomial(1)),
+    ("外层 8 次，内层 11 次", random_polynomial(8), random_polynomial(11)),
+    ("外层 8 次，内层 12 次", random_polynomial(8), random_polynomial(12)),
+    ("外层 9 次，内层 13 次 (有理系数)", random_polynomial(9, True), random_polynomial(13, True)),
+    ("外层 20 次，内层 16 次", random_polynomial(20), random_polynomial(16, True)),
+    ("外层 3 次，内层 30 次", random_polynomial(3, True), random_polynomial(30)),
+    ("常数外层", Polynomial({0: 4}), random_polynomial(15)),
+    ("常数内层", random_polynomial(6), Polynomial({0: Fraction(-2, 3)})),
+    ("稀疏内层 x^12 + 1", random_polynomial(4), Polynomial({12: 1, 0: 1})),
+]
+
+for label, f, g in compose_cases:
+    composed = f.compose(g)
+    print(f"输入: {label}")
+    print(f"结果次数: {composed.degree()}")
+    print(f"与朴素的 power / __mul__ 结果一致: {composed.terms == naive_compose(f, g).terms}")
+    print("-" * 30)
+
+print("输入: compose 的参数为 int / Fraction")
+f = random_polynomial(5, True)
+print(f"f.compose(3) 等于 f(3): {f.compose(3).terms == ({0: f.evaluate(3)} if f.evaluate(3) else {})}")
+print(f"f.compose(Fraction(1, 2)) 等于 f(1/2): {f.compose(Fraction(1, 2)).terms.get(0) == f.evaluate(Fraction(1, 2))}")
+print("-" * 30)
+
+
+# --- 测试分式复合 (FractionalPolynomial.compose) ---
+print("\n--- 测试分式复合 ---")
+
+
+def naive_fractional_compose(frac, inner):
+    """用 FractionalPolynomial 的加法和乘法逐项代入，作为对照。"""
+    def substitute(poly):
+        result = FractionalPolynomial(Polynomial(), Polynomial({0: 1}))
+        power = FractionalPolynomial(Polynomial({0: 1}), Polynomial({0: 1}))
+        for exp in range(poly.degree() + 1 if not poly.is_zero() else 0):
+            coeff = poly.terms.get(exp)
+            if coeff:
+                result = result + power * coeff
+            power = power * inner
+        return result
+    return substitute(frac.numerator) / substitute(frac.denominator)
+
+
+def fraction_of(numerator, denominator):
+    return FractionalPolynomial(numerator, denominator)
+
+
+fractional_cases = [
+    ("(x + 1)/(x - 1) @ (x^2 + 1)/(x - 2)",
+     fraction_of(Polynomial({1: 1, 0: 1}), Polynomial({1: 1, 0: -1})),
+     fraction_of(Polynomial({2: 1, 0: 1}), Polynomial({1: 1, 0: -2}))),
+    # 内层的分母是非 1 的常数：低于分界与不低于分界各一个
+    ("随机 6 次分式 @ (内层 5 次) / 3",
+     fraction_of(random_polynomial(6), random_polynomial(3, True)),
+     fraction_of(random_polynomial(5), Polynomial({0: 3}))),
+    ("随机 6 次分式 @ (内层 14 次) / (2/5)",
+     fraction_of(random_polynomial(6, True), random_polynomial(4)),
+     fraction_of(random_polynomial(14, True), Polynomial({0: Fraction(2, 5)}))),
+    ("随机 4 次分式 @ 3 次 / 2 次",
+     fraction_of(random_polynomial(4), random_polynomial(2)),
+     fraction_of(random_polynomial(3), random_polynomial(2, True))),
+    ("1/x @ (x + 1)", fraction_of(Polynomial({0: 1}), Polynomial({1: 1})), Polynomial({1: 1, 0: 1})),
+]
+
+for label, frac, inner in fractional_cases:
+    print(f"输入: {label}")
+    try:
+        composed = frac.compose(inner)
+        inner_frac = inner if isinstance(inner, FractionalPolynomial) else fraction_of(inner, Polynomial({0: 1}))
+        expected = naive_fractional_compose(frac, inner_frac)
+        # 两边的最简形式可能相差一个常数因子，交叉相乘比较
+        same = (composed.numerator * expected.denominator).terms == (expected.numerator * composed.denominator).terms
+        print(f"结果分子次数 {composed.numerator.degree()}，分母次数 {composed.denominator.degree()}")
+        print(f"与逐项代入的结果相等: {same}")
+    except Exception as e:
+        print(f"处理失败: {e}")
+    print("-" * 30)
+
+# 内层次数不低于分界且分母非常数时，逐项代入太慢，改为在若干点上比较取值
+print("输入: 随机 5 次分式 @ 13 次 / 12 次 (按点取值比较)")
+frac = fraction_of(random_polynomial(5), random_polynomial(2))
+inner = fraction_of(random_polynomial(13), random_polynomial(12, True))
+composed = frac.compose(inner)
+points = [Fraction(1, 3), Fraction(-2, 5), Fraction(7, 4)]
+matches = []
+for point in points:
+    inner_value = inner.numerator.evaluate(point) / inner.denominator.evaluate(point)
+    expected = frac.numerator.evaluate(inner_value) / frac.denominator.evaluate(inner_value)
+    matches.append(composed.numerator.evaluate(point) / composed.denominator.evaluate(point) == expected)
+print(f"结果分子次数 {composed.numerator.degree()}，分母次数 {composed.denominator.degree()}")
+print(f"在 x = 1/3, -2/5, 7/4 处与直接代入一致: {all(matches)}")
+print("-" * 30)
+
+print("输入: (x + 1)/(x - 1) @ 1")
+try:
+    fraction_of(Polynomial({1: 1, 0: 1}), Polynomial({1: 1, 0: -1})).compose(1)
+except ValueError as e:
+    print(f"ValueError: {e}")
+print("-" * 30)
@@ -0,0 +1,82 @@
+import os
+import tempfile
+
+from polynomial_parser import parse_and_evaluate, canonical_key, tokenize, ExpressionCache
+from polynomial_parser.disk_cache import DiskCache
+
+# --- 测试持久化结果缓存 (DiskCache) ---
+print("\n--- 测试持久化结果缓存 ---")
+
+directory = tempfile.TemporaryDirectory()
+path = os.path.join(directory.name, "cache.sqlite")
+
+
+def key_of(expr):
+    return canonical_key(tokenize(expr))
+
+
+# 一个实例写入，另一个实例 (相当于另一个进程) 读取
+print("输入: 两个 DiskCache 实例之间的往返")
+writer = DiskCache(path)
+expr = "(x^2 + 1) / (x - 2)"
+result = parse_and_evaluate(expr, use_cache=False)
+decomposition = [parse_and_evaluate("x + 2", use_cache=False), parse_and_evaluate("5 / (x - 2)", use_cache=False)]
+writer.put(key_of(expr), result)
+writer.put(key_of(expr), result, decomposition)
+writer.close()
+
+reader = DiskCache(path)
+loaded = reader.get(key_of("(x^2+1)/(x-2)"))
+print(f"读取的结果: {loaded}")
+print(f"与写入的结果一致: {loaded.to_single_fraction_str() == result.to_single_fraction_str()}")
+terms = reader.get_decomposition(key_of(expr))
+print(f"裂项结果: {[str(term) for term in terms]}")
+print(f"未命中返回 None: {reader.get(key_of('x + 3')) is None}")
+print(f"项数: {len(reader)}，总字节数与各项之和一致: "
+      f"{reader.total_size() == reader._connection().execute('SELECT SUM(size) FROM entries').fetchone()[0]}")
+print("-" * 30)
+
+# 超过 max_bytes 时按最近访问时间淘汰到 90% 以下
+print("输入: 按大小淘汰")
+reader.clear()
+print(f"清空后: {len(reader)} 项，{reader.total_size()} 字节")
+small = DiskCache(path, max_bytes=400)
+small.TOUCH_INTERVAL = 0.0
+expressions = [f"(x + {i})^6" for i in range(1, 21)]
+for i, expr in enumerate(expressions):
+    small.put(key_of(expr), parse_and_evaluate(expr, use_cache=False))
+    if i == 0:
+        entry_size = small.total_size()
+    if i < 10:
+        small.get(key_of(expressions[0])) # 第一项一直被访问，不应被淘汰
+print(f"第一项 {entry_size} 字节，上限 400 字节")
+print(f"总大小不超过上限: {small.total_size() <= 400} ({small.total_size()} 字节，{len(small)} 项)")
+print(f"经常访问的第一项仍在: {small.get(key_of(expressions[0])) is not None}")
+print(f"最后写入的一项仍在: {small.get(key_of(expressions[-1])) is not None}")
+print(f"最早写入且未再访问的一项已淘汰: {small.get(key_of(expressions[1])) is None}")
+print("-" * 30)
+
+# warm_up：计算并保存一批表达式，跳过无法解析的表达式，已缓存的不再计算
+print("输入: warm_up")
+small.clear()
+warm = DiskCache(path)
+corpus = ["x^2 - 1", "(x + 1)(x - 1)", "1 / (x^2 - 1)", "x ^", "1 / 0"]
+memory = ExpressionCache(maxsize=16)
+print(f"新计算的表达式数量: {warm.warm_up(corpus, decompose=True, memory_cache=memory)}")
+print(f"磁盘缓存项数: {len(warm)} (x^2 - 1 与 (x + 1)(x - 1) 的键不同)")
+print(f"内存缓存项数: {len(memory)}")
+print(f"裂项结果已保存: {[str(term) for term in warm.get_decomposition(key_of('1 / (x^2 - 1)'))]}")
+print(f"再次预热时新计算的数量: {warm.warm_up(corpus, decompose=True)}")
+print("-" * 30)
+
+# 作为 ExpressionCache 的第二级缓存
+print("输入: ExpressionCache(disk=...)")
+fresh = ExpressionCache(maxsize=16, disk=DiskCache(path))
+value = fresh.get(key_of("x^2 - 1"))
+info = fresh.info()
+print(f"结果: {value}，命中 {info.hits}，其中来自磁盘 {info.disk_hits}")
+print("-" * 30)
+
+for cache in (writer, reader, small, warm, fresh.disk):
+    cache.close()
+directory.cleanup()
@@ -0,0 +1,71 @@
+import sympy
+from sympy.polys.specialpolys import swinnerton_dyer_poly
+
+from polynomial_parser import parse_and_evaluate, Polynomial
+from polynomial_parser.partial_fraction import to_sympy_poly, from_sympy_poly
+
+# --- 测试有理数域上的因式分解 ---
+print("\n--- 测试有理数域上的因式分解 ---")
+
+polynomials_to_test = [
+    # 分圆多项式与 x^n ± 1
+    "x^4 + x^3 + x^2 + x + 1",      # Φ5，不可约
+    "x^6 - x^3 + 1",                # Φ18，不可约
+    "x^12 - 1",                     # 6 个分圆因子
+    "x^15 + 1",                     # Φ2 Φ6 Φ10 Φ30
+    "x^30 - 1",                     # 8 个分圆因子
+    "x^64 + 1",                     # Φ128，不可约
+
+    # 重因子
+    "(x^2 - 1)^3 * (x^2 + x + 1)^2",
+    "x^5 * (x - 2)^4",
+    "(x^3 + 2)^2 * (x - 1)",
+
+    # 非首一、有理系数
+    "(2x + 3) * (3x^2 - 5) * (6x^3 + x - 1)",
+    "1/2x^2 - 1/8",                 # (1/8) (2x - 1) (2x + 1)
+    "-4x^4 + 1",
+    "6x^4 + 5x^3 - 38x^2 + 5x + 6",
+
+    # 常数和一次多项式
+    "7",
+    "3x - 6",
+]
+
+
+def check_factorization(poly, label):
+    content, factors = poly.factor()
+    print(f"输入: '{label}'")
+    print(f"常数因子: {content}")
+    for f, multiplicity in factors:
+        print(f"    ({f})^{multiplicity}")
+
+    product = Polynomial({0: content})
+    for f, multiplicity in factors:
+        product = product * f.power(multiplicity)
+    print(f"因子乘积等于输入: {product.terms == poly.terms}")
+
+    _, sympy_factors = to_sympy_poly(poly).factor_list()
+    counts_match = (len(factors) == len(sympy_factors) and
+                    sorted(m for _, m in factors) == sorted(m for _, m in sympy_factors))
+    print(f"因子个数与 sympy.factor_list 一致: {counts_match} ({len(factors)} 个)")
+    print("-" * 30)
+
+
+for expr in polynomials_to_test:
+    try:
+        check_factorization(parse_and_evaluate(expr).numerator, expr)
+    except Exception as e:
+        print(f"处理失败: {e}")
+        print("-" * 30)
+
+
+# Swinnerton-Dyer 多项式：在每个素数下都分解成低次因子，但在有理数域上不可约
+x = sympy.Symbol('x')
+for n in (2, 3, 4):
+    poly = from_sympy_poly(sympy.Poly(swinnerton_dyer_poly(n, x), x, domain=sympy.QQ))
+    try:
+        check_factorization(poly, f"Swinnerton-Dyer S{n} (次数 {poly.degree()})")
+    except Exception as e:
+        print(f"处理失败: {e}")
+        print("-" * 30)
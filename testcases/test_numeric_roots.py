@@ -0,0 +1,126 @@
+import sys
+from fractions import Fraction
+
+try:
+    import numpy as np
+except ImportError:
+    print("未安装 NumPy，跳过数值求根测试")
+    sys.exit(0)
+
+from polynomial_parser import parse_and_evaluate, Polynomial, roots_numeric_many
+from polynomial_parser.numeric_roots import _COMPANION_MAX_DEGREE
+
+# --- 测试数值求根 ---
+print("\n--- 测试数值求根 ---")
+print(f"友矩阵 / Aberth 的分界次数: {_COMPANION_MAX_DEGREE}")
+
+
+def max_relative_error(found, expected):
+    """
+    每个根到另一组中最近的根的最大相对距离 (两个方向都算)。
+    实部几乎相同的根在排序后的顺序可能因舍入而交换，所以不逐个按位置比较。
+    """
+    found = np.asarray(found, dtype=complex)
+    expected = np.asarray(expected, dtype=complex)
+    if len(found) != len(expected):
+        return float('inf')
+    if not len(found):
+        return 0.0
+    distances = np.abs(found[:, None] - expected[None, :]) / np.maximum(np.abs(expected), 1.0)[None, :]
+    return float(max(distances.min(axis=1).max(), distances.min(axis=0).max()))
+
+
+cases = [
+    # (表达式, 精确的根)
+    ("x^2 - 2", [-2 ** 0.5, 2 ** 0.5]),
+    ("x^2 + 1", [-1j, 1j]),
+    ("(x - 1)(x - 2)(x - 3)(x + 4)", [1, 2, 3, -4]),
+    ("(2x - 1)(3x + 1)", [0.5, -1 / 3]),
+    ("x^3 (x^2 - 2)", [0, 0, 0, -2 ** 0.5, 2 ** 0.5]),          # x^k 因子：精确为 0
+    ("x^5", [0, 0, 0, 0, 0]),
+    ("(x - 1)^2", [1, 1]),                                       # 重根的精度约为 sqrt(eps)
+    ("7", []),
+]
+
+polys = [parse_and_evaluate(expr, use_cache=False).numerator for expr, _ in cases]
+batch = roots_numeric_many(polys)
+for (expr, expected), poly, roots in zip(cases, polys, batch):
+    print(f"输入: '{expr}'")
+    print(f"根的个数等于次数: {len(roots) == max(poly.degree(), 0)}")
+    tolerance = 1e-7 if expr == "(x - 1)^2" else 1e-12
+    print(f"与精确的根一致 (相对误差 < {tolerance}): {max_relative_error(roots, expected) < tolerance}")
+    print(f"与单独调用 roots_numeric 一致: {np.array_equal(poly.roots_numeric(), roots)}")
+    zeros = sum(1 for z in roots if z == 0)
+    print(f"精确为 0 的根: {zeros}")
+    print("-" * 30)
+
+
+# 次数超过分界：Aberth-Ehrlich 迭代
+for degree in (250, 400):
+    print(f"输入: x^{degree} - 1 (Aberth)")
+    roots = Polynomial({degree: 1, 0: -1}).roots_numeric()
+    expected = np.exp(2j * np.pi * np.arange(degree) / degree)
+    print(f"根的个数: {len(roots)}")
+    print(f"与单位根一致 (误差 < 1e-12): {max_relative_error(roots, expected) < 1e-12}")
+    print("-" * 30)
+
+rng = np.random.default_rng(2024)
+coefficients = [int(c) for c in rng.integers(-9, 10, size=260)]
+coefficients[-1] = coefficients[-1] or 1
+poly = Polynomial(dict(enumerate(coefficients)))
+print("输入: 259 次随机整系数多项式 (Aberth)")
+roots = poly.roots_numeric()
+reference = np.roots(coefficients[::-1])
+print(f"与 numpy.roots 一致 (误差 < 1e-8): {max_relative_error(roots, reference) < 1e-8}")
+print("-" * 30)
+
+
+# 超出 float 范围的精确系数：先精确地缩放 x = 2^s y，再转换为 float
+print("\n--- 测试超出 float 范围的系数 ---")
+
+big = Polynomial({0: Fraction(10 ** 400), 300: 1})             # 根的模为 10^(4/3)
+tiny = Polynomial({0: 1, 2: Fraction(1, 10 ** 400)})            # 根为 ±10^200 i
+huge_root = Polynomial({1: 1, 0: -10 ** 400})                   # 根 10^400 超出 float 范围
+scaled = Polynomial({2: Fraction(1, 10 ** 500), 1: Fraction(3, 10 ** 500), 0: Fraction(2, 10 ** 500)})
+batch = roots_numeric_many([big, tiny, huge_root, scaled, Polynomial({2: 1, 0: -2})])
+
+print("输入: x^300 + 10^400")
+magnitudes = np.abs(batch[0])
+print(f"根的个数: {len(batch[0])}，模都约为 10^(4/3): {np.allclose(magnitudes, 10 ** (400 / 300), rtol=1e-12)}")
+print(f"都是有限值: {bool(np.all(np.isfinite(batch[0])))}")
+print("-" * 30)
+print("输入: 1 + 10^-400 x^2")
+print(f"根: {batch[1]}，与 ±10^200 i 一致: {max_relative_error(batch[1], [1e200j, -1e200j]) < 1e-12}")
+print("-" * 30)
+print("输入: x - 10^400 (根超出 float 范围)")
+print(f"结果是 NaN: {bool(np.all(np.isnan(batch[2])))}，长度: {len(batch[2])}")
+print("-" * 30)
+print("输入: 10^-500 (x^2 + 3x + 2)")
+print(f"根: {batch[3]}")
+print("-" * 30)
+print("输入: 同一批中的 x^2 - 2")
+print(f"不受其他多项式影响: {max_relative_error(batch[4], [-2 ** 0.5, 2 ** 0.5]) < 1e-12}")
+print("-" * 30)
+
+print("输入: x^2 (x - 10^400) (NaN 行保留 x^k 因子的零根)")
+print(f"结果: {roots_numeric_many([Polynomial({3: 1, 2: -10 ** 400})])[0]}")
+print("-" * 30)
+
+
+# 零多项式：ValueError 中给出它在输入中的位置
+print("\n--- 测试错误 ---")
+for label, batch_input in [("第 2 个是零多项式", [Polynomial({1: 1}), Polynomial({2: 1, 0: 1}), Polynomial()]),
+                           ("单独的零多项式", [Polynomial()])]:
+    print(f"输入: {label}")
+    try:
+        roots_numeric_many(batch_input)
+    except ValueError as e:
+        print(f"ValueError: {e}")
+    print("-" * 30)
+
+print("输入: Polynomial().roots_numeric()")
+try:
+    Polynomial().roots_numeric()
+except ValueError as e:
+    print(f"ValueError: {e}")
+print("-" * 30)
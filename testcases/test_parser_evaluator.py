@@ -1,4 +1,4 @@
-from polynomial_parser import parse_and_evaluate
+from polynomial_parser import parse_and_evaluate, get_cache
 
 # --- 测试解析器和求值器 ---
 print("\n--- 测试解析器和求值器 ---")
@@ -33,6 +33,20 @@ expressions_to_test = [
     "2(x+1) + 3x",                # 2 * (x+1) + 3 * x = 2x + 2 + 3x = 5x + 2
     "x^2(x-1)",                   # x^2 * (x-1) = x^3 - x^2
     "1/2(x+1)",                   # 1/2 * (x+1) = 1/2*x + 1/2
+
+    # 乘方测试用例
+    "(x+1)^2",                    # x^2 + 2x + 1
+    "-x^2",                       # -(x^2)
+    "x^2^3",                      # x^(2^3) = x^8 (右结合)
+    "(x^2-1)^2/(x+1)^2",          # (x-1)^2 = x^2 - 2x + 1 (约分)
+
+    # 复合 (@) 测试用例
+    "x^2+1 @ x-1",                # (x-1)^2 + 1 = x^2 - 2x + 2 (@ 的优先级最低)
+    "x @ x @ (x+1)",              # (x @ x) @ (x+1) = x + 1 (左结合)
+    "-x @ x^2",                   # -x^2
+    "(1/x) @ (x+1)",              # 1/(x+1)
+    "(x+1)/(x-1) @ 1",            # 处理失败: 代入 x = 1 后分母为零
+    "x @",                        # 处理失败: 语法错误
 ]
 
 for expr in expressions_to_test:
@@ -64,5 +78,32 @@ for expr in expressions_to_test_complex:
      except Exception as e:
           print(f"处理失败: {e}")
           print("-" * 30)
-          
-          
\ No newline at end of file
+
+
+# 缓存键必须保留 token 边界：分数 token '2/3' 与 '2', '/', '3' 不能共享缓存项。
+# 每一对表达式按两种顺序经过缓存求值，结果都应与不经过缓存时相同。
+print("\n--- 测试缓存键的 token 边界 ---")
+
+
+def evaluate_or_error(expr, use_cache):
+    try:
+        return str(parse_and_evaluate(expr, use_cache=use_cache))
+    except Exception as e:
+        return f"处理失败: {e}"
+
+
+cache_key_pairs = [
+    ("(x+1)^2/3", "(x+1)^2 / 3"),    # 指数 2/3 (错误) 与 (x+1)^2 除以 3
+    ("x^1/2", "x^1 / 2"),            # 指数 1/2 (错误) 与 x/2
+    ("23x", "2 3x"),                 # 23x 与语法错误
+]
+
+for pair in cache_key_pairs:
+    for order in (pair, pair[::-1]):
+        get_cache().clear()
+        for expr in order:
+            print(f"输入: '{expr}' (顺序: {' -> '.join(order)})")
+            cached = evaluate_or_error(expr, True)
+            print(f"结果: {cached}")
+            print(f"与不经过缓存的结果一致: {cached == evaluate_or_error(expr, False)}")
+            print("-" * 30)
@@ -0,0 +1,96 @@
+import random
+from fractions import Fraction
+
+from polynomial_parser import Polynomial
+from polynomial_parser.polynomial_math import polynomial_gcdex, polynomial_invert, _HALF_GCD_THRESHOLD
+from polynomial_parser.partial_fraction import to_sympy_poly, from_sympy_poly
+
+# --- 测试扩展欧几里得算法 (polynomial_gcdex) ---
+print("\n--- 测试扩展欧几里得算法 ---")
+print(f"half-GCD 阈值: {_HALF_GCD_THRESHOLD}")
+
+rng = random.Random(2024)
+
+
+def random_polynomial(degree, rational=False):
+    """次数为 degree 的随机多项式；rational 为 True 时系数带有分母。"""
+    terms = {}
+    for exp in range(degree + 1):
+        numerator = rng.randint(-9, 9)
+        terms[exp] = Fraction(numerator, rng.randint(1, 6)) if rational else numerator
+    terms[degree] = terms[degree] or 1
+    return Polynomial(terms)
+
+
+def degree_of(poly):
+    # 零多项式的次数记为 -1，便于比较次数界
+    return -1 if poly.is_zero() else poly.degree()
+
+
+def check_gcdex(a, b, label):
+    s, t, g = polynomial_gcdex(a, b)
+    print(f"输入: {label} (次数 {degree_of(a)} 与 {degree_of(b)})")
+    print(f"gcd 的次数: {degree_of(g)}")
+    print(f"s*a + t*b = g: {(s * a + t * b).terms == g.terms}")
+    if not g.is_zero():
+        print(f"g 首一: {g._leading_term()[1] == 1}")
+        # 一方整除另一方 (或为零) 时对应的系数是常数，次数界至少按 1 计
+        print(f"deg s < deg b - deg g: {degree_of(s) < max(degree_of(b) - degree_of(g), 1)}")
+        print(f"deg t < deg a - deg g: {degree_of(t) < max(degree_of(a) - degree_of(g), 1)}")
+        expected = from_sympy_poly(to_sympy_poly(a).gcd(to_sympy_poly(b)).monic())
+        print(f"g 与 sympy.gcd 一致: {g.terms == expected.terms}")
+    print("-" * 30)
+
+
+cases = [
+    ("x^3 - 1, x^2 - 1", Polynomial({3: 1, 0: -1}), Polynomial({2: 1, 0: -1})),
+    ("x^4 + 1, x^3 + 2x", Polynomial({4: 1, 0: 1}), Polynomial({3: 1, 1: 2})),
+    ("b 整除 a", Polynomial({2: 1, 0: -1}) * Polynomial({1: 1, 0: 3}), Polynomial({2: 1, 0: -1})),
+    ("常数与多项式", Polynomial({0: Fraction(2, 3)}), Polynomial({2: 1, 0: 5})),
+    ("零多项式与多项式", Polynomial(), Polynomial({2: 3, 0: 1})),
+    ("两个零多项式", Polynomial(), Polynomial()),
+]
+
+# 次数低于阈值：普通的欧几里得算法
+cases.append(("互素的随机多项式", random_polynomial(12), random_polynomial(9)))
+common = random_polynomial(4, rational=True)
+cases.append(("有公因子 (4 次)", common * random_polynomial(10), common * random_polynomial(8, rational=True)))
+
+# 次数不小于阈值：half-GCD
+cases.append(("互素的随机多项式 (half-GCD)", random_polynomial(90), random_polynomial(75)))
+common = random_polynomial(7)
+cases.append(("有公因子 (7 次, half-GCD)",
+              common * random_polynomial(80, rational=True), common * random_polynomial(66)))
+cases.append(("高次公因子 (half-GCD)", common.power(10) * random_polynomial(5), common.power(9)))
+
+for label, a, b in cases:
+    try:
+        check_gcdex(a, b, label)
+    except Exception as e:
+        print(f"处理失败: {e}")
+        print("-" * 30)
+
+
+# --- 测试模逆元 (polynomial_invert) ---
+print("\n--- 测试模逆元 ---")
+
+invert_cases = [
+    ("x^2 + 1 模 x^3 + x + 1", Polynomial({2: 1, 0: 1}), Polynomial({3: 1, 1: 1, 0: 1})),
+    ("3x 模 x^2 - 2", Polynomial({1: 3}), Polynomial({2: 1, 0: -2})),
+    ("次数高于模多项式", random_polynomial(20, rational=True), random_polynomial(7)),
+    ("half-GCD", random_polynomial(100), random_polynomial(80)),
+    # 下面两个不互素 (或模多项式是常数)，应当抛出 ValueError
+    ("x^2 - 1 模 x^3 - x (不互素)", Polynomial({2: 1, 0: -1}), Polynomial({3: 1, 1: -1})),
+    ("x + 1 模 5 (常数)", Polynomial({1: 1, 0: 1}), Polynomial({0: 5})),
+]
+
+for label, a, m in invert_cases:
+    print(f"输入: {label}")
+    try:
+        s = polynomial_invert(a, m)
+        _, remainder = (s * a).divmod_polynomial(m)
+        print(f"s*a = 1 (mod m): {remainder.terms == {0: 1}}")
+        print(f"deg s < deg m: {degree_of(s) < m.degree()}")
+    except ValueError as e:
+        print(f"ValueError: {e}")
+    print("-" * 30)
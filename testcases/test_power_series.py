@@ -0,0 +1,160 @@
+from fractions import Fraction
+from math import factorial
+
+from polynomial_parser import Polynomial, PowerSeries, parse_and_evaluate
+
+N = 12
+
+
+def binomial_half(k):
+    """二项式系数 C(1/2, k)。"""
+    value = Fraction(1)
+    for i in range(k):
+        value = value * (Fraction(1, 2) - i) / (i + 1)
+    return value
+
+
+def series(expr, precision=N):
+    return PowerSeries(parse_and_evaluate(expr, use_cache=False).numerator, precision)
+
+
+def check(label, result, expected, precision):
+    """比较系数与已知展开式，并检查结果的精度。"""
+    print(f"输入: {label}")
+    print(f"结果: {result}")
+    print(f"精度为 {precision}: {result.precision == precision}")
+    print(f"与已知展开式一致: {result.coefficients() == expected}")
+    print("-" * 30)
+
+
+# --- 测试 Newton 迭代与已知展开式 ---
+print("\n--- 测试 Newton 迭代与已知展开式 ---")
+
+check("(1 - x).inverse()", series("1 - x").inverse(), [Fraction(1)] * N, N)
+check("(1 + x)^2 的倒数", series("(1 + x)^2").inverse(),
+      [Fraction((-1) ** k * (k + 1)) for k in range(N)], N)
+
+fibonacci = [1, 1]
+while len(fibonacci) < N:
+    fibonacci.append(fibonacci[-1] + fibonacci[-2])
+check("(1 - x - x^2).inverse() (Fibonacci 数)", series("1 - x - x^2").inverse(),
+      [Fraction(f) for f in fibonacci], N)
+
+check("log(1 + x)", series("1 + x").log(),
+      [Fraction(0)] + [Fraction((-1) ** (k + 1), k) for k in range(1, N)], N)
+check("log(1 / (1 - x)) = Σ x^k / k", series("1 - x").inverse().log(),
+      [Fraction(0)] + [Fraction(1, k) for k in range(1, N)], N)
+check("exp(x)", series("x").exp(), [Fraction(1, factorial(k)) for k in range(N)], N)
+check("exp(-2x)", series("-2x").exp(), [Fraction((-2) ** k, factorial(k)) for k in range(N)], N)
+check("sqrt(1 + x)", series("1 + x").sqrt(), [binomial_half(k) for k in range(N)], N)
+check("sqrt(9 + 18x + 9x^2) = 3 + 3x", series("9 + 18x + 9x^2").sqrt(),
+      [Fraction(3), Fraction(3)] + [Fraction(0)] * (N - 2), N)
+
+f = series("1 + 2x - 1/3 x^2 + 5x^7")
+print("输入: f = 1 + 2x - 1/3 x^2 + 5x^7")
+print(f"exp(log f) == f: {f.log().exp().coefficients() == f.coefficients()}")
+print(f"sqrt(f)^2 == f: {(f.sqrt() * f.sqrt()).coefficients() == f.coefficients()}")
+print(f"f * f.inverse() == 1: {(f * f.inverse()).coefficients() == [Fraction(1)] + [Fraction(0)] * (N - 1)}")
+print(f"log f 的导数 == f' / f: {f.log().derivative().coefficients() == (f.derivative() / f).coefficients()}")
+print("-" * 30)
+
+# 精度较高时走多轮 Newton 迭代，与逐项递推的结果比较
+print("输入: 1/(1 - x - x^2) 精度 200")
+long_fibonacci = [1, 1]
+while len(long_fibonacci) < 200:
+    long_fibonacci.append(long_fibonacci[-1] + long_fibonacci[-2])
+print(f"与 Fibonacci 数一致: {series('1 - x - x^2', 200).inverse().coefficients() == long_fibonacci}")
+print("-" * 30)
+
+
+# --- 测试除法 ---
+print("\n--- 测试除法 ---")
+
+check("(1 + x) / (1 - x) = 1 + 2x + 2x^2 + ...", series("1 + x") / series("1 - x"),
+      [Fraction(1)] + [Fraction(2)] * (N - 1), N)
+# 分子分母同时约去 x，精度减一
+check("(x + x^2) / (x - x^2)，约去公因子 x", series("x + x^2") / series("x - x^2"),
+      [Fraction(1)] + [Fraction(2)] * (N - 2), N - 1)
+# 约去 x^3，精度减三
+check("(2x^3 + x^5) / x^3", series("2x^3 + x^5") / series("x^3"),
+      [Fraction(2), Fraction(0), Fraction(1)] + [Fraction(0)] * (N - 6), N - 3)
+check("(1 + x) / 2", series("1 + x") / 2, [Fraction(1, 2), Fraction(1, 2)] + [Fraction(0)] * (N - 2), N)
+
+for label, compute in [
+    ("x / x^2 (极点)", lambda: series("x") / series("x^2")),
+    ("1 / x (极点)", lambda: series("1") / series("x")),
+    ("1 / x^20 (除数在当前精度下为零)", lambda: series("1") / series("x^20")),
+    ("(1 + x) / 0", lambda: series("1 + x") / 0),
+    ("x.inverse()", lambda: series("x").inverse()),
+    ("(2 + x).log()", lambda: series("2 + x").log()),
+    ("(1 + x).exp()", lambda: series("1 + x").exp()),
+]:
+    print(f"输入: {label}")
+    try:
+        print(f"结果: {compute()}")
+    except ValueError as e:
+        print(f"ValueError: {e}")
+    print("-" * 30)
+
+
+# --- 测试最低次项为 x^(2m) 的平方根 ---
+print("\n--- 测试最低次项为 x^(2m) 的平方根 ---")
+
+# x^4 (1 + x) 的平方根是 x^2 sqrt(1 + x)，精度从 N 降为 N - 2
+check("sqrt(x^4 + x^5)", series("x^4 + x^5").sqrt(),
+      [Fraction(0)] * 2 + [binomial_half(k) for k in range(N - 4)], N - 2)
+check("sqrt(4x^2)", series("4x^2").sqrt(), [Fraction(0), Fraction(2)] + [Fraction(0)] * (N - 3), N - 1)
+check("sqrt(1/9 x^6 - 2/3 x^7 + x^8) = 1/3 x^3 - x^4", series("1/9 x^6 - 2/3 x^7 + x^8").sqrt(),
+      [Fraction(0)] * 3 + [Fraction(1, 3), Fraction(-1)] + [Fraction(0)] * (N - 8), N - 3)
+check("sqrt(0 + O(x^12))", PowerSeries(0, N).sqrt(), [Fraction(0)] * (N // 2), N // 2)
+
+for label in ["x^3 + x^4", "2x^2", "-1 + x"]:
+    print(f"输入: sqrt({label})")
+    try:
+        print(f"结果: {series(label).sqrt()}")
+    except ValueError as e:
+        print(f"ValueError: {e}")
+    print("-" * 30)
+
+
+# --- 测试 to_series 在非零点的展开 ---
+print("\n--- 测试 to_series 在非零点的展开 ---")
+
+# 1/x 在 x = 1 处: 1 / (1 + (x - 1)) = Σ (-1)^k (x - 1)^k
+frac = parse_and_evaluate("1/x", use_cache=False)
+check("1/x 在 x = 1 处", frac.to_series(N, 1), [Fraction((-1) ** k) for k in range(N)], N)
+
+# 1/x 在 x = -2 处: -1/2 Σ ((x + 2)/2)^k
+check("1/x 在 x = -2 处", frac.to_series(N, -2), [Fraction(-1, 2 ** (k + 1)) for k in range(N)], N)
+
+# 多项式在 x = 1/2 处的展开就是 Taylor 平移
+poly = parse_and_evaluate("x^3 - 2x + 1", use_cache=False)
+expected = poly.numerator.shift(Fraction(1, 2))
+check("x^3 - 2x + 1 在 x = 1/2 处", poly.to_series(N, Fraction(1, 2)),
+      [expected.terms.get(k, Fraction(0)) for k in range(N)], N)
+
+# 一般的分式：展开式乘以平移后的分母，应等于平移后的分子 (截断到精度)
+frac = parse_and_evaluate("(x^2 + 3)/(x^3 - x + 5)", use_cache=False)
+point = Fraction(3, 2)
+expansion = frac.to_series(N, point)
+product = expansion * frac.denominator.shift(point)
+shifted_numerator = frac.numerator.shift(point)
+print(f"输入: (x^2 + 3)/(x^3 - x + 5) 在 x = {point} 处")
+print(f"展开点: {expansion.point}")
+print(f"乘以平移后的分母等于平移后的分子: {product.coefficients() == [shifted_numerator.terms.get(k, Fraction(0)) for k in range(N)]}")
+print("-" * 30)
+
+for expr, p in [("1/(x - 1)", 1), ("(x + 2)/(x^2 - 4x + 4)", 2), ("1/x", 0)]:
+    print(f"输入: '{expr}'.to_series({N}, {p})")
+    try:
+        print(f"结果: {parse_and_evaluate(expr, use_cache=False).to_series(N, p)}")
+    except ValueError as e:
+        print(f"ValueError: {e}")
+    print("-" * 30)
+
+print("输入: 不同展开点的级数相加")
+try:
+    print(frac.to_series(4, 1) + frac.to_series(4, 0))
+except ValueError as e:
+    print(f"ValueError: {e}")
+print("-" * 30)
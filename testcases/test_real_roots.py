@@ -0,0 +1,126 @@
+from fractions import Fraction
+
+import sympy
+
+from polynomial_parser import parse_and_evaluate, Polynomial
+from polynomial_parser.partial_fraction import to_sympy_poly
+
+# --- 测试实根隔离 (real_roots) ---
+print("\n--- 测试实根隔离 ---")
+
+polynomials_to_test = [
+    "x^2 - 2",                          # ±sqrt(2)，在 ±1 两侧
+    "(2x - 1)(3x + 4)(x - 5)",          # 有理根：区间退化为 (a, a)
+    "x^3 - x",                          # -1, 0, 1 (正好落在 ±1 和 0 上)
+    "(x - 1)^3 (x + 2)^2 (x^2 - 3)",    # 重根：只报告不同的根
+    "x^4 (x^2 + 1)",                    # x = 0 是重根，其余为复根
+    "x^5 - 10x^3 + 9x - 1/2",           # 五个实根，有的在 (-1, 1) 内，有的在外
+    "(x - 1/1000)(x - 1/999)",          # 两个很接近的有理根
+    "(1000x - 1)(x - 1000)(x + 1/1000)",
+    "x^8 + 1",                          # 没有实根
+    "7",                                # 常数
+]
+
+
+def sympy_real_roots(poly):
+    """SymPy 给出的不同实根 (精确的代数数)。"""
+    return sorted(set(sympy.Poly(to_sympy_poly(poly).as_expr(), sympy.Symbol('x')).real_roots()))
+
+
+for expr in polynomials_to_test:
+    poly = parse_and_evaluate(expr, use_cache=False).numerator
+    print(f"输入: '{expr}'")
+    try:
+        intervals = poly.real_roots()
+        exact = sympy_real_roots(poly)
+        print(f"隔离区间: {[(str(a), str(b)) for a, b in intervals]}")
+        print(f"根的个数与 sympy 一致: {len(intervals) == len(exact)}")
+        # 每个区间恰好包含对应的根：有理根精确相等，其余的根在开区间内
+        contains = all((a == b and root == a) or (a < root < b) for (a, b), root in zip(intervals, exact))
+        print(f"每个区间包含对应的根: {contains}")
+        # 正好落在二分点上的有理根以 (a, a) 报告；(a, a) 一定是精确的有理根
+        exact_points = [a for a, b in intervals if a == b]
+        print(f"以 (a, a) 报告的根: {[str(a) for a in exact_points]}，都是精确的根: "
+              f"{all(poly.evaluate(a) == 0 for a in exact_points)}")
+        disjoint = all(intervals[i][1] <= intervals[i + 1][0] and intervals[i][1] != intervals[i + 1][1]
+                       for i in range(len(intervals) - 1))
+        print(f"区间互不相交且从小到大排列: {disjoint}")
+
+        eps = Fraction(1, 10 ** 12)
+        refined = poly.real_roots(eps)
+        print(f"eps = 1e-12 细化后宽度都不超过 eps: {all(b - a <= eps for a, b in refined)}")
+        print(f"细化后的区间在原区间之内: "
+              f"{all(a0 <= a and b <= b0 for (a, b), (a0, b0) in zip(refined, intervals))}")
+        print(f"细化后仍然包含对应的根: "
+              f"{all((a == b and root == a) or (a < root < b) for (a, b), root in zip(refined, exact))}")
+    except Exception as e:
+        print(f"处理失败: {e}")
+    print("-" * 30)
+
+for label, poly, eps in [("零多项式", Polynomial(), None), ("eps = 0", Polynomial({2: 1, 0: -2}), 0)]:
+    print(f"输入: {label}")
+    try:
+        poly.real_roots(eps)
+    except ValueError as e:
+        print(f"ValueError: {e}")
+    print("-" * 30)
+
+
+# --- 测试 Sturm 序列与实根计数 ---
+print("\n--- 测试 Sturm 序列与实根计数 ---")
+
+# 区间都是半开区间 (a, b]：左端点上的根不计入，右端点上的根计入；None 表示无穷
+intervals_to_test = [
+    (None, None), (None, 0), (0, None), (-1, 1), (1, 5), (-2, -1), (Fraction(-1, 2), Fraction(1, 3)),
+    (0, 0), (Fraction(1, 2), Fraction(1, 2)), (-10, 10), (2, 3), (5, 6), (Fraction(-4, 3), 5),
+]
+
+
+def count_from_roots(exact, a, b):
+    """由精确的根数出 (a, b] 中的根。"""
+    return sum(1 for root in exact if (a is None or root > a) and (b is None or root <= b))
+
+
+for expr in polynomials_to_test[:-1]:
+    poly = parse_and_evaluate(expr, use_cache=False).numerator
+    print(f"输入: '{expr}'")
+    sequence = poly.sturm_sequence()
+    # 有重根时首项是无平方部分
+    square_free = Polynomial({0: poly._leading_term()[1]})
+    for factor, _ in poly.square_free_decomposition():
+        square_free = square_free * factor
+    ratio = Fraction(sequence[0]._leading_term()[1]) / square_free._leading_term()[1]
+    print(f"Sturm 序列长度: {len(sequence)}，首项是无平方部分的正倍数: "
+          f"{ratio > 0 and (square_free * Polynomial({0: ratio})).terms == sequence[0].terms}")
+    print(f"序列使用缓存: {poly._sturm_integers() is poly._sturm_integers()}")
+
+    exact = sympy_real_roots(poly)
+    counts = poly.count_real_roots_many(intervals_to_test)
+    expected = [count_from_roots(exact, a, b) for a, b in intervals_to_test]
+    print(f"各区间的根数: {counts}")
+    print(f"与 sympy 的根一致: {counts == expected}")
+    print(f"(-inf, +inf] 的根数等于 len(real_roots()): {poly.count_real_roots() == len(poly.real_roots())}")
+
+    # 用 real_roots 的细化区间数出 (a, b]：区间内的端点如果是根，根就是这个端点；
+    # 否则根是无理数或不在端点上，与小分母的端点的距离远大于 1e-30，区间不会跨过端点
+    endpoints = {value for interval in intervals_to_test for value in interval if value is not None}
+    located = []
+    for lo, hi in poly.real_roots(Fraction(1, 10 ** 30)):
+        inside = [e for e in endpoints if lo < e < hi]
+        if lo == hi or not inside:
+            located.append((lo, hi))
+        else:
+            root = inside[0]
+            located.append((root, root) if poly.evaluate(root) == 0 else None)
+    from_intervals = [sum(1 for lo, hi in located if (a is None or lo >= a and hi > a) and (b is None or hi <= b))
+                      for a, b in intervals_to_test]
+    print(f"与 real_roots 的区间一致: {counts == from_intervals}")
+    print(f"单个区间的接口一致: {[poly.count_real_roots(a, b) for a, b in intervals_to_test] == counts}")
+    print("-" * 30)
+
+print("输入: 左端点大于右端点")
+try:
+    Polynomial({2: 1, 0: -2}).count_real_roots(1, -1)
+except ValueError as e:
+    print(f"ValueError: {e}")
+print("-" * 30)
@@ -0,0 +1,95 @@
+import pickle
+from fractions import Fraction
+
+from polynomial_parser import Polynomial, FractionalPolynomial, parse_and_evaluate
+from polynomial_parser.serialization import dumps, loads, loads_from
+
+# --- 测试二进制序列化 ---
+print("\n--- 测试二进制序列化 ---")
+
+
+def same(a, b):
+    """两个对象 (Polynomial / FractionalPolynomial / 列表) 的系数完全相同。"""
+    if isinstance(a, list):
+        return isinstance(b, list) and len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+    if isinstance(a, FractionalPolynomial):
+        return (isinstance(b, FractionalPolynomial) and
+                a.numerator.terms == b.numerator.terms and a.denominator.terms == b.denominator.terms)
+    return type(a) is type(b) and a.terms == b.terms
+
+
+huge = 3 ** 500
+objects_to_test = [
+    ("零多项式", Polynomial()),
+    ("常数", Polynomial({0: 7})),
+    ("负系数与零系数 (稠密)", Polynomial({0: -3, 1: 0, 2: 5, 3: -1, 4: 0, 5: 2})),
+    ("稀疏多项式", Polynomial({0: 1, 1000: -1})),
+    ("有理系数", Polynomial({0: Fraction(-1, 2), 1: Fraction(2, 3), 3: Fraction(-5, 7)})),
+    ("巨大的分子和分母", Polynomial({0: Fraction(huge, 2 ** 300 + 1), 2: Fraction(-1, huge), 7: huge})),
+    ("分式多项式", parse_and_evaluate("(x^2 - 3) / (2x + 1)", use_cache=False)),
+    ("分子为零的分式", FractionalPolynomial(Polynomial(), Polynomial({0: 1}))),
+    ("裂项结果列表", [Polynomial({1: 1}), parse_and_evaluate("-1 / (x - 1)^2", use_cache=False)]),
+]
+
+for label, obj in objects_to_test:
+    print(f"输入: {label}")
+    try:
+        data = dumps(obj)
+        print(f"编码长度: {len(data)} 字节")
+        print(f"dumps/loads 往返一致: {same(loads(data), obj)}")
+        if not isinstance(obj, list):
+            print(f"to_bytes/from_bytes 往返一致: {same(type(obj).from_bytes(obj.to_bytes()), obj)}")
+            print(f"pickle 往返一致: {same(pickle.loads(pickle.dumps(obj)), obj)}")
+        # 嵌入在更大的缓冲区中，从偏移处读取，不复制
+        buffer = memoryview(b"\xff" * 3 + data + b"\xff")
+        decoded, end = loads_from(buffer, 3)
+        print(f"从 memoryview 的偏移处解码: {same(decoded, obj)}，结束位置正确: {end == 3 + len(data)}")
+    except Exception as e:
+        print(f"处理失败: {e}")
+    print("-" * 30)
+
+
+# 截断、损坏或类型不符的数据应当抛出 ValueError
+print("\n--- 测试拒绝截断或损坏的数据 ---")
+
+valid = dumps(parse_and_evaluate("(x^3 + 1/2) / (x - 5)", use_cache=False))
+corrupt_inputs = [
+    ("空数据", b""),
+    ("只有版本号", valid[:1]),
+    ("截断到一半", valid[:len(valid) // 2]),
+    ("去掉最后一个字节", valid[:-1]),
+    ("未知的版本", bytes([99]) + valid[1:]),
+    ("未知的标记", valid[:1] + bytes([42]) + valid[2:]),
+    ("公分母为零", bytes([1, 1, 2, 0, 2, 4])),
+    ("分母是零多项式", bytes([1, 3, 1, 1, 1, 2, 1, 0, 1])),
+    ("分式中嵌套了非多项式", bytes([1, 3, 3, 1, 1, 2, 1, 1, 1])),
+    ("未结束的 varint", bytes([1, 1, 0x85, 0x80, 0x80])),
+]
+
+for label, data in corrupt_inputs:
+    print(f"输入: {label} ({data.hex()})")
+    try:
+        result = loads(data)
+        print(f"未被拒绝: {result}")
+    except ValueError as e:
+        print(f"ValueError: {e}")
+    print("-" * 30)
+
+for label, cls, data in [
+    ("Polynomial.from_bytes 读到分式", Polynomial, valid),
+    ("FractionalPolynomial.from_bytes 读到多项式", FractionalPolynomial, dumps(Polynomial({1: 1}))),
+]:
+    print(f"输入: {label}")
+    try:
+        cls.from_bytes(data)
+        print("未被拒绝")
+    except ValueError as e:
+        print(f"ValueError: {e}")
+    print("-" * 30)
+
+print("输入: 无法序列化的类型")
+try:
+    dumps({1: 2})
+except TypeError as e:
+    print(f"TypeError: {e}")
+print("-" * 30)
@@ -0,0 +1,114 @@
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from polynomial_parser.server import SolverService, SolverHTTPServer
+
+# --- 测试本地 HTTP/JSON 求解服务 ---
+
+MEDIUM_EXPRESSION = "(x+1)^300*(x+2)^300"  # 单个工作进程中约 1~2 秒
+SLOW_EXPRESSION = "(x+1)^600*(x+2)^600"
+
+
+def start(**service_options):
+    """在随机的本地端口上启动服务，返回 (服务, HTTP 服务器, 基础 URL)。"""
+    service = SolverService(**service_options)
+    server = SolverHTTPServer(('127.0.0.1', 0), service)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return service, server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def stop(service, server):
+    server.shutdown()
+    server.server_close()
+    service.close()
+
+
+def request(base, path, payload=None):
+    """发送请求，返回 (状态码, JSON 响应, 响应头)。"""
+    data = json.dumps(payload).encode('utf-8') if payload is not None else None
+    req = urllib.request.Request(base + path, data=data, headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(req, timeout=60) as response:
+            return response.status, json.loads(response.read()), response.headers
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read()), e.headers
+
+
+def show(label, base, path, payload=None):
+    status, body, _ = request(base, path, payload)
+    print(f"输入: {label}")
+    print(f"状态码: {status}")
+    print(f"响应: {json.dumps(body, ensure_ascii=False)}")
+    print("-" * 30)
+
+
+def main():
+    print("\n--- 测试各个端点 ---")
+    service, server, base = start(workers=1, queue_size=0, request_timeout=None)
+    show("GET /health", base, "/health")
+    show("POST /simplify (x^2 - 1) / (x - 1)", base, "/simplify", {"expression": "(x^2 - 1) / (x - 1)"})
+    show("POST /decompose 1 / (x^2 - 1)", base, "/decompose", {"expression": "1 / (x^2 - 1)"})
+    show("POST /evaluate (x + 1) / (x - 2) 在 x = 3/2", base, "/evaluate",
+         {"expression": "(x + 1) / (x - 2)", "x": "3/2"})
+    show("POST /simplify 语法错误", base, "/simplify", {"expression": "(x + 1"})
+    show("POST /simplify 缺少 expression", base, "/simplify", {"x": 1})
+    show("POST /unknown", base, "/unknown", {"expression": "x"})
+
+    # 负载削减：1 个工作进程、队列长度 0，正在执行一个请求时新请求立即得到 503
+    print("输入: 负载削减 (workers=1, queue_size=0)")
+    slow = {}
+    thread = threading.Thread(target=lambda: slow.update(
+        result=request(base, "/simplify", {"expression": MEDIUM_EXPRESSION})))
+    thread.start()
+    time.sleep(0.3)
+    status, body, headers = request(base, "/simplify", {"expression": "x + 1"})
+    print(f"状态码: {status}，Retry-After: {headers.get('Retry-After')}，错误类型: {body['error']['type']}")
+    thread.join()
+    print(f"正在执行的请求不受影响，状态码: {slow['result'][0]}")
+    print(f"request_timeout=None 时请求正常完成: {slow['result'][0] == 200}")
+    print("-" * 30)
+
+    print("输入: GET /metrics")
+    status, metrics, _ = request(base, "/metrics")
+    counters = metrics['counters']
+    print(f"状态码: {status}")
+    print(f"计数: requests={counters['requests']} rejected={counters['rejected']} "
+          f"client_errors={counters['client_errors']} in_flight={counters['in_flight']}")
+    stages = metrics['latency_ms']
+    print(f"记录的阶段: {sorted(stages)}")
+    print(f"分位数有序: {all(s['p50'] <= s['p99'] <= s['max'] for s in stages.values())}")
+    print("-" * 30)
+    stop(service, server)
+
+    print("\n--- 测试预算、准入控制和大任务进程池 ---")
+    # request_timeout=None 且有大任务进程池时，大任务同样不限时 (user-036)
+    service, server, base = start(workers=1, queue_size=2, request_timeout=None, max_degree=1000,
+                                  admission_max_degree=100, big_job_workers=1)
+    show("超过准入阈值，交给大任务进程池", base, "/simplify", {"expression": "(x + 1)^150 / (x + 1)^149"})
+    show("超过 max_degree (工作进程中的 Budget)", base, "/simplify", {"expression": "(x^2 + 1)^600 - (x^2 + 1)^600"})
+    status, metrics, _ = request(base, "/metrics")
+    print(f"big_jobs={metrics['counters']['big_jobs']} over_budget={metrics['counters']['over_budget']} "
+          f"big_job_workers={metrics['big_job_workers']}")
+    print("-" * 30)
+    stop(service, server)
+
+    service, server, base = start(workers=1, queue_size=0, request_timeout=0.5, admission_max_degree=2000)
+    show("超过准入阈值且没有大任务进程池", base, "/simplify", {"expression": "x^5000"})
+    begin = time.perf_counter()
+    status, body, _ = request(base, "/simplify", {"expression": SLOW_EXPRESSION})
+    print("输入: 超过 request_timeout=0.5 的请求")
+    print(f"状态码: {status}，限制: {body['error'].get('limit')}，在 2 秒内返回: {time.perf_counter() - begin < 2}")
+    print("-" * 30)
+    begin = time.perf_counter()
+    status, body, _ = request(base, "/simplify", {"expression": "x + 1"})
+    print("输入: 超时之后的请求")
+    print(f"状态码: {status}，工作进程已空闲 (在 1 秒内完成): {time.perf_counter() - begin < 1}")
+    print("-" * 30)
+    stop(service, server)
+
+
+if __name__ == "__main__":
+    main()